@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Job queues of the long-lived HybridTool worker (run_worker.py).
+
+A message is the task environment the Lambda triggers pass to run_task as container overrides
+(TASK_TYPE, JOB_ID, PFD_GOAL, ...), as a JSON object.
+
+- SqsJobQueue: JOBS_QUEUE_URL, the deployed setup
+- SqliteJobQueue: JOBS_QUEUE_DB, a local file-backed stand-in with the same receive/extend/delete
+  semantics (a received message is invisible for the visibility timeout, then delivered again)
+
+Enqueue a job on the local queue:
+    python job_queue.py /tmp/jobs.db TASK_TYPE=update_pfd JOB_ID=local-1 PFD_GOAL=1e-4 DEMAND=1000 S3_BUCKET=...
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+default_visibility_seconds = 900
+default_wait_seconds = 20
+
+
+class SqsJobQueue:
+    def __init__(self, queue_url, region_name=None, visibility_seconds=default_visibility_seconds):
+        import boto3
+
+        self.queue_url = queue_url
+        self.visibility_seconds = visibility_seconds
+        self.sqs = boto3.client("sqs", region_name=region_name)
+
+    def send(self, message):
+        return self.sqs.send_message(QueueUrl=self.queue_url, MessageBody=json.dumps(message))["MessageId"]
+
+    def receive(self, wait_seconds=default_wait_seconds):
+        # (receipt handle, message, receive count) or None after wait_seconds of long polling
+        response = self.sqs.receive_message(
+            QueueUrl=self.queue_url, MaxNumberOfMessages=1, WaitTimeSeconds=wait_seconds,
+            VisibilityTimeout=self.visibility_seconds, AttributeNames=["ApproximateReceiveCount"],
+        )
+        for item in response.get("Messages", []):
+            count = int(item.get("Attributes", {}).get("ApproximateReceiveCount", 1))
+            return item["ReceiptHandle"], json.loads(item["Body"]), count
+        return None
+
+    def extend(self, handle):
+        self.sqs.change_message_visibility(QueueUrl=self.queue_url, ReceiptHandle=handle,
+                                           VisibilityTimeout=self.visibility_seconds)
+
+    def delete(self, handle):
+        self.sqs.delete_message(QueueUrl=self.queue_url, ReceiptHandle=handle)
+
+
+class SqliteJobQueue:
+    """
+    Messages in one SQLite table. receive() leases the oldest visible message by moving its
+    visible_at past the visibility timeout inside a write transaction, so several worker
+    processes can share one file.
+    """
+
+    def __init__(self, path, visibility_seconds=default_visibility_seconds, poll_seconds=1.0):
+        self.path = path
+        self.visibility_seconds = visibility_seconds
+        self.poll_seconds = poll_seconds
+        self.lock = threading.Lock()
+        with self.connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS messages ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, body TEXT NOT NULL, visible_at REAL NOT NULL, "
+                "receipt TEXT, receive_count INTEGER NOT NULL DEFAULT 0)"
+            )
+
+    @contextmanager
+    def connect(self):
+        # autocommit connection, closed (rolling back an unfinished transaction) on exit
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def send(self, message):
+        with self.lock, self.connect() as conn:
+            cursor = conn.execute("INSERT INTO messages (body, visible_at) VALUES (?, ?)",
+                                  (json.dumps(message), time.time()))
+            return str(cursor.lastrowid)
+
+    def lease(self):
+        receipt = uuid.uuid4().hex
+        now = time.time()
+        with self.lock, self.connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT id, body, receive_count FROM messages WHERE visible_at <= ? "
+                               "ORDER BY id LIMIT 1", (now,)).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            conn.execute("UPDATE messages SET visible_at = ?, receipt = ?, receive_count = receive_count + 1 "
+                         "WHERE id = ?", (now + self.visibility_seconds, receipt, row[0]))
+            conn.execute("COMMIT")
+        return receipt, json.loads(row[1]), row[2] + 1
+
+    def receive(self, wait_seconds=default_wait_seconds):
+        deadline = time.time() + wait_seconds
+        while True:
+            leased = self.lease()
+            if leased is not None or time.time() >= deadline:
+                return leased
+            time.sleep(min(self.poll_seconds, max(0.0, deadline - time.time())))
+
+    def extend(self, handle):
+        with self.lock, self.connect() as conn:
+            conn.execute("UPDATE messages SET visible_at = ? WHERE receipt = ?",
+                         (time.time() + self.visibility_seconds, handle))
+
+    def delete(self, handle):
+        with self.lock, self.connect() as conn:
+            conn.execute("DELETE FROM messages WHERE receipt = ?", (handle,))
+
+
+def job_queue_from_env(environ=None):
+    """
+    JOBS_QUEUE_URL selects SQS, otherwise JOBS_QUEUE_DB the local SQLite queue.
+    JOBS_QUEUE_VISIBILITY_SECONDS: how long a received job stays invisible without a heartbeat.
+    """
+    environ = os.environ if environ is None else environ
+    visibility_seconds = int(environ.get("JOBS_QUEUE_VISIBILITY_SECONDS", default_visibility_seconds))
+    if environ.get("JOBS_QUEUE_URL"):
+        return SqsJobQueue(environ["JOBS_QUEUE_URL"], region_name=environ.get("AWS_REGION"),
+                           visibility_seconds=visibility_seconds)
+    if environ.get("JOBS_QUEUE_DB"):
+        return SqliteJobQueue(environ["JOBS_QUEUE_DB"], visibility_seconds=visibility_seconds)
+    raise ValueError("Set JOBS_QUEUE_URL (SQS) or JOBS_QUEUE_DB (local SQLite queue)")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print(__doc__)
+        sys.exit(2)
+    message = dict(item.split("=", 1) for item in sys.argv[2:])
+    print(f"Enqueued message {SqliteJobQueue(sys.argv[1]).send(message)}: {message}")
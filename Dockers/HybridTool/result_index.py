@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Result index of listBbnResults (lambda/hybridTool/listBbnResults.py).
+
+Listing s3://<bucket>/results/ reads every stored key on every request. Instead, the task scripts add an
+item to a DynamoDB table (RESULTS_INDEX_TABLE) right after they upload a result, and listBbnResults
+queries one page of it, newest first, optionally for one job type.
+
+Table (on-demand capacity):
+- partition key bucket (S), sort key key (S): one item per result key, so uploading the same key again
+  (a re-run job, a redelivered queue message, a second backfill) replaces its item instead of adding one
+- local secondary index lastModified-index: sort key sortKey (S) = "<lastModified, UTC ISO, fixed width>#<name>"
+- global secondary index jobType-index: partition key bucketJobType (S) = "<bucket>#<jobType>",
+  sort key sortKey
+
+Index the results uploaded before the table existed (one full scan of the prefix):
+    python result_index.py <bucket> <table> [--prefix results/]
+"""
+
+import argparse
+import os
+import sys
+from datetime import datetime, timezone
+
+import boto3
+
+results_prefix = "results/"
+
+# result names are "<job type>-<job id>.json"
+job_types = ("sensitivity-analysis", "update-pfd", "full-analysis", "attribute-importance")
+
+
+def job_type_of(name):
+    for job_type in job_types:
+        if name.startswith(f"{job_type}-"):
+            return job_type
+    return "other"
+
+
+def timestamp(moment):
+    # fixed width, so the sort key orders like the time (isoformat drops zero microseconds)
+    return moment.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f+00:00")
+
+
+def index_item(bucket, key, size, last_modified, job_id=None, job_type=None):
+    # (bucket, key) is the item identity, put_item of the same result overwrites it
+    name = key.rsplit("/", 1)[-1]
+    job_type = job_type or job_type_of(name)
+    if job_id is None:
+        job_id = name[len(job_type) + 1:-len(".json")] if job_type != "other" else name
+    last_modified = timestamp(last_modified)
+    return {
+        "bucket": {"S": bucket},
+        "sortKey": {"S": f"{last_modified}#{name}"},
+        "bucketJobType": {"S": f"{bucket}#{job_type}"},
+        "key": {"S": key},
+        "name": {"S": name},
+        "size": {"N": str(size)},
+        "lastModified": {"S": last_modified},
+        "jobId": {"S": job_id},
+        "jobType": {"S": job_type},
+    }
+
+
+def index_result(env, bucket, key, size, job_id, job_type):
+    """
+    Adds an uploaded result to RESULTS_INDEX_TABLE (no-op when it is not set). A failure only prints a
+    warning: the result is in S3 already, and listBbnResults falls back to listing the bucket.
+    """
+    table = env.get("RESULTS_INDEX_TABLE")
+    if not table:
+        return
+    try:
+        boto3.client('dynamodb', region_name=env.get("AWS_REGION", "ap-northeast-2")).put_item(
+            TableName=table,
+            Item=index_item(bucket, key, size, datetime.now(timezone.utc), job_id=job_id, job_type=job_type),
+        )
+        print(f"[DynamoDB] Result indexed: {key}")
+    except Exception as e:
+        print(f"[WARNING] Failed to index result {key}: {str(e)}")
+
+
+def backfill(bucket, table, prefix=results_prefix, region_name=None):
+    s3_client = boto3.client('s3', region_name=region_name)
+    dynamodb_client = boto3.client('dynamodb', region_name=region_name)
+    indexed = 0
+    for page in s3_client.get_paginator("list_objects_v2").paginate(Bucket=bucket, Prefix=prefix):
+        for obj in page.get("Contents", []):
+            relative_key = obj["Key"][len(prefix):]
+            # the objects listBbnResults lists: JSON files directly under the prefix
+            if not relative_key or "/" in relative_key or not relative_key.lower().endswith(".json"):
+                continue
+            dynamodb_client.put_item(TableName=table, Item=index_item(bucket, obj["Key"], obj["Size"], obj["LastModified"]))
+            indexed += 1
+    return indexed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Index the results already stored in S3")
+    parser.add_argument("bucket")
+    parser.add_argument("table")
+    parser.add_argument("--prefix", default=results_prefix)
+    args = parser.parse_args(argv)
+    indexed = backfill(args.bucket, args.table, args.prefix, region_name=os.environ.get("AWS_REGION"))
+    print(f"Indexed {indexed} results of s3://{args.bucket}/{args.prefix}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
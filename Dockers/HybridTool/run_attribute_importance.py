@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+ECS Fargate Task: Attribute Importance (tornado)
+
+Environment variables:
+- JOB_ID: Job identifier
+- PFD_GOAL: Target PFD value (optional; confidences and their deltas are only reported with it)
+- RANK_BY: "pfd_mean" (default) or "confidence" (needs PFD_GOAL)
+- IMPORTANCE_ATTRIBUTES: Comma-separated attribute codes to evaluate, e.g. "SR_SDP,IM_CM" (default: all)
+- IMPORTANCE_DRAWS: Forward draws per variant (default: 20000)
+- RANDOM_SEED: Seed of the shared random numbers (default: 0)
+- BBN_INPUT_PATH / BBN_INPUT_BUCKET: Baseline BBN input JSON (default: NRC report data)
+- S3_BUCKET: S3 bucket name for results
+- AWS_REGION: AWS region
+- RESULTS_INDEX_TABLE: DynamoDB result index of listBbnResults (optional, result_index.py)
+
+Output:
+- Uploads JSON to S3: s3://{S3_BUCKET}/results/attribute-importance-{JOB_ID}.json
+"""
+
+import os
+import sys
+import json
+import traceback
+import boto3
+
+sys.path.insert(0, '/app/server')
+
+# COMPILE_CACHE_DIR: must run before anything imports PyMC / JAX
+from bbn_inference.compile_cache import configure_compile_cache
+configure_compile_cache()
+
+from bbn_inference.importance import attribute_importance, rank_metrics
+from bbn_inference.scenarios import default_scenario_draws
+from bbn_inference.instrumentation import span, emit_metrics_summary
+from bbn_input_loader import load_bayesian_data_from_env
+from result_index import index_result
+
+
+def update_job_status(dynamodb_client, jobs_table_name, job_id, status, **fields):
+    if not (jobs_table_name and dynamodb_client):
+        return
+    names = {"jobStatus": status, **fields}
+    try:
+        dynamodb_client.update_item(
+            TableName=jobs_table_name,
+            Key={'jobId': {'S': job_id}},
+            UpdateExpression='SET ' + ', '.join(f'{name} = :{name}' for name in names),
+            ExpressionAttributeValues={f':{name}': {'S': value} for name, value in names.items()}
+        )
+        print(f"[DynamoDB] Job status updated to {status}: {job_id}")
+    except Exception as e:
+        print(f"[WARNING] Failed to update DynamoDB status to {status}: {str(e)}")
+
+
+def main(env=None):
+    # env: the task environment (os.environ, or a queue message in run_worker.py)
+    env = os.environ if env is None else env
+    print("=" * 80)
+    print("HybridTool Attribute Importance - Starting")
+    print("=" * 80)
+
+    # Read environment variables
+    job_id = env.get("JOB_ID")
+    pfd_goal = float(env.get("PFD_GOAL", "0")) or None
+    rank_by = env.get("RANK_BY", "pfd_mean").lower()
+    attributes = [code.strip() for code in env.get("IMPORTANCE_ATTRIBUTES", "").split(",") if code.strip()]
+    draws = int(env.get("IMPORTANCE_DRAWS", str(default_scenario_draws)))
+    random_seed = int(env.get("RANDOM_SEED", "0"))
+    s3_bucket = env.get("S3_BUCKET")
+    aws_region = env.get("AWS_REGION", "ap-northeast-2")
+    bbn_input_path = env.get("BBN_INPUT_PATH")
+    bbn_input_bucket = env.get("BBN_INPUT_BUCKET")
+    jobs_table_name = env.get("JOBS_TABLE_NAME")
+
+    dynamodb_client = None
+    if jobs_table_name:
+        dynamodb_client = boto3.client('dynamodb', region_name=aws_region)
+
+    if not job_id:
+        raise ValueError("JOB_ID environment variable is required")
+    if not s3_bucket:
+        raise ValueError("S3_BUCKET environment variable is required")
+    if rank_by not in rank_metrics:
+        raise ValueError(f"RANK_BY must be one of {rank_metrics}")
+
+    print(f"[CONFIG] JOB_ID: {job_id}")
+    print(f"[CONFIG] PFD_GOAL: {pfd_goal}")
+    print(f"[CONFIG] RANK_BY: {rank_by}")
+    print(f"[CONFIG] IMPORTANCE_ATTRIBUTES: {attributes or 'all'}")
+    print(f"[CONFIG] IMPORTANCE_DRAWS: {draws}, RANDOM_SEED: {random_seed}")
+    print(f"[CONFIG] S3_BUCKET: {s3_bucket}")
+    print(f"[CONFIG] BBN_INPUT_PATH: {bbn_input_path or 'default (nrc_report_data)'}")
+
+    update_job_status(dynamodb_client, jobs_table_name, job_id, 'RUNNING')
+
+    try:
+        bbn_data = load_bayesian_data_from_env(bbn_input_path, bbn_input_bucket)
+        print(f"[DEBUG] BBN data loaded successfully. FP={bbn_data.function_point}, complexity={bbn_data.complexity}")
+
+        if bbn_input_path and bbn_input_bucket:
+            bbn_input_info = {"source": "s3", "bucket": bbn_input_bucket, "key": bbn_input_path}
+        elif bbn_input_path:
+            bbn_input_info = {"source": "local", "path": bbn_input_path}
+        else:
+            bbn_input_info = {"source": "default", "description": "NRC report data (default)"}
+
+        # 1. Tornado: every attribute at each of its other states, one at a time
+        print("\n[STEP 1] Evaluating attribute variants...")
+        result = attribute_importance(
+            bbn_data, pfd_goal=pfd_goal, attributes=attributes or None, rank_by=rank_by,
+            draws=draws, random_seed=random_seed,
+        )
+        for item in result["attributes"][:10]:
+            print(f"[STEP 1] {item['attribute']}: {rank_by} swing={item[f'{rank_by}_swing']}")
+
+        result_json = {
+            "message": "Attribute importance complete",
+            "data": result,
+            "bbn_input": bbn_input_info,
+        }
+
+        # 2. Upload to S3
+        print("\n[STEP 2] Uploading results to S3...")
+        s3_client = boto3.client('s3', region_name=aws_region)
+        s3_key = f"results/attribute-importance-{job_id}.json"
+
+        with span("upload_results"):
+            body = json.dumps(result_json, indent=2).encode("utf-8")
+            s3_client.put_object(
+                Bucket=s3_bucket,
+                Key=s3_key,
+                Body=body,
+                ContentType="application/json"
+            )
+        print(f"[STEP 2] Results uploaded to s3://{s3_bucket}/{s3_key}")
+        index_result(env, s3_bucket, s3_key, len(body), job_id, "attribute-importance")
+
+        update_job_status(dynamodb_client, jobs_table_name, job_id, 'COMPLETED', resultsPath=s3_key)
+
+        print("\n" + "=" * 80)
+        print("HybridTool Attribute Importance - Completed Successfully")
+        print("=" * 80)
+
+        print(json.dumps({
+            "status": "completed",
+            "job_id": job_id,
+            "s3_location": f"s3://{s3_bucket}/{s3_key}",
+            "attributes": len(result["attributes"]),
+        }))
+
+    except Exception as e:
+        error_msg = f"Attribute importance failed: {str(e)}"
+        print(f"\n[ERROR] {error_msg}", file=sys.stderr)
+
+        update_job_status(dynamodb_client, jobs_table_name, job_id, 'FAILED', errorMessage=error_msg[:500])  # 최대 500자
+
+        print(json.dumps({
+            "status": "failed",
+            "job_id": job_id,
+            "error": error_msg
+        }))
+        raise
+
+
+if __name__ == "__main__":
+    try:
+        with span("job", job_type="attribute-importance", job_id=os.environ.get("JOB_ID")):
+            main()
+    except Exception:
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        emit_metrics_summary(job_type="attribute-importance", job_id=os.environ.get("JOB_ID"))
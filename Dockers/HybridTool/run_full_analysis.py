@@ -7,8 +7,23 @@ Environment variables:
 - PFD_GOAL: Target PFD value
 - CONFIDENCE_GOAL: Target confidence level
 - FAILURES: Observed number of failures
+- UPDATE_METHOD: "analytic" (default, exact reweighting) or "mcmc" (sampling cross-check)
+- DEMAND_SEARCH: "bisect" (default, no demand ceiling) or "linear" (legacy walk up to 25000)
+- DEMAND_TOLERANCE: Tolerance of the bisection search in demands (default: 10)
+- DEMAND_STEP: Spacing of the demand grid of the PFD curve (default: 500)
+- SUBMODEL_METHOD: "analytic" (default) or "mcmc" for the Dev/VV attribute submodels
+- SUBMODEL_WORKERS: Parallel processes for SUBMODEL_METHOD=mcmc (default: one per vCPU, at most 10)
+- SAMPLING_TARGETS: Optional JSON object of adaptive sampling targets (e.g. '{"ess": 400, "rhat": 1.01}',
+  keys of bbn_utils.default_sampling_targets) for the composite model, SUBMODEL_METHOD=mcmc and
+  UPDATE_METHOD=mcmc; every run then samples until the targets are met (R-hat needs chains >= 2)
+- TRACE_CACHE_DIR / TRACE_CACHE_S3_BUCKET (+ TRACE_CACHE_S3_PREFIX): optional composite trace cache
+- CHECKPOINT_DIR / CHECKPOINT_S3_BUCKET (+ CHECKPOINT_S3_PREFIX, CHECKPOINT_S3_ENDPOINT): optional stage
+  checkpoints under the job id (trace PFD samples, required demand, partial sweep); a task restarted with
+  the same JOB_ID and parameters resumes from the last completed stage or demand point
+- CHECKPOINT_INTERVAL_SECONDS: How often the partial sweep is checkpointed (default: 30)
 - S3_BUCKET: S3 bucket name for results
 - AWS_REGION: AWS region
+- RESULTS_INDEX_TABLE: DynamoDB result index of listBbnResults (optional, result_index.py)
 
 Output:
 - Uploads JSON file to S3: s3://{S3_BUCKET}/results/full-analysis-{JOB_ID}.json
@@ -17,37 +32,59 @@ Output:
 import os
 import sys
 import json
+import time
+import traceback
 import boto3
 from typing import Dict, Any
 
 sys.path.insert(0, '/app/server')
 
+# COMPILE_CACHE_DIR: must run before anything imports PyMC / JAX
+from bbn_inference.compile_cache import configure_compile_cache
+configure_compile_cache()
+
 from bbn_inference.sensitivity_analysis import (
     get_number_of_required_demand,
     filter_outsiders,
-    get_confidence,
-    demand_model_func,
+    check_update_method,
+    iter_demand_sweep,
+    demand_grid,
+    sweep_from_points,
+    sweep_to_pfd_series,
 )
-from bbn_inference.examples.example_for_composite_model import run_example_for_composite_model
-from bbn_inference.bbn_utils import run_sampling
+from bbn_inference.bbn_utils import sampling_targets_from_env
+from bbn_inference.examples.example_for_composite_model import run_cached_composite_model
+from bbn_inference.trace_store import trace_store_from_env
+from bbn_inference.checkpoints import JobCheckpoints, checkpoint_store_from_env, default_interval_seconds
+from bbn_inference.empirical_cdf import EmpiricalCDF
+from bbn_inference.instrumentation import span, event, emit_metrics_summary
 from bbn_input_loader import load_bayesian_data_from_env
+from result_index import index_result
 
 
-def main():
+def main(env=None):
+    # env: the task environment (os.environ, or a queue message in run_worker.py)
+    env = os.environ if env is None else env
     print("=" * 80)
     print("HybridTool Full Analysis - Starting")
     print("=" * 80)
     
-    job_id = os.environ.get("JOB_ID")
-    pfd_goal = float(os.environ.get("PFD_GOAL", "0"))
-    confidence_goal = float(os.environ.get("CONFIDENCE_GOAL", "0"))
-    failures = int(os.environ.get("FAILURES", "0"))
-    s3_bucket = os.environ.get("S3_BUCKET")
-    aws_region = os.environ.get("AWS_REGION", "ap-northeast-2")
-    test_mode = os.environ.get("TEST_MODE", "false").lower() == "true"
-    bbn_input_path = os.environ.get("BBN_INPUT_PATH")
-    bbn_input_bucket = os.environ.get("BBN_INPUT_BUCKET")
-    jobs_table_name = os.environ.get("JOBS_TABLE_NAME")
+    job_id = env.get("JOB_ID")
+    pfd_goal = float(env.get("PFD_GOAL", "0"))
+    confidence_goal = float(env.get("CONFIDENCE_GOAL", "0"))
+    failures = int(env.get("FAILURES", "0"))
+    update_method = env.get("UPDATE_METHOD", "analytic").lower()
+    demand_search = env.get("DEMAND_SEARCH", "bisect").lower()
+    demand_tolerance = int(env.get("DEMAND_TOLERANCE", "10"))
+    demand_step = int(env.get("DEMAND_STEP", "500"))
+    submodel_method = env.get("SUBMODEL_METHOD", "analytic").lower()
+    checkpoint_interval = float(env.get("CHECKPOINT_INTERVAL_SECONDS", default_interval_seconds))
+    s3_bucket = env.get("S3_BUCKET")
+    aws_region = env.get("AWS_REGION", "ap-northeast-2")
+    test_mode = env.get("TEST_MODE", "false").lower() == "true"
+    bbn_input_path = env.get("BBN_INPUT_PATH")
+    bbn_input_bucket = env.get("BBN_INPUT_BUCKET")
+    jobs_table_name = env.get("JOBS_TABLE_NAME")
     
     if not job_id:
         raise ValueError("JOB_ID environment variable is required")
@@ -55,17 +92,37 @@ def main():
         raise ValueError("S3_BUCKET environment variable is required")
     if pfd_goal <= 0 or confidence_goal <= 0:
         raise ValueError("PFD_GOAL and CONFIDENCE_GOAL must be positive numbers")
+    check_update_method(update_method)
+    sampling_targets = sampling_targets_from_env(env)
+    if demand_step <= 0:
+        raise ValueError("DEMAND_STEP must be a positive number")
     
     print(f"[CONFIG] JOB_ID: {job_id}")
     print(f"[CONFIG] PFD_GOAL: {pfd_goal}")
     print(f"[CONFIG] CONFIDENCE_GOAL: {confidence_goal}")
     print(f"[CONFIG] FAILURES: {failures}")
+    print(f"[CONFIG] UPDATE_METHOD: {update_method}")
+    print(f"[CONFIG] SAMPLING_TARGETS: {sampling_targets or 'off (fixed draws/tune)'}")
+    print(f"[CONFIG] DEMAND_SEARCH: {demand_search} (tolerance={demand_tolerance})")
+    print(f"[CONFIG] DEMAND_STEP: {demand_step}")
     print(f"[CONFIG] S3_BUCKET: {s3_bucket}")
     print(f"[CONFIG] AWS_REGION: {aws_region}")
     print(f"[CONFIG] BBN_INPUT_PATH: {bbn_input_path or 'default (nrc_report_data)'}")
     if bbn_input_bucket:
         print(f"[CONFIG] BBN_INPUT_BUCKET: {bbn_input_bucket}")
     
+    # checkpoints of an earlier run of this job count only if it had the same parameters
+    checkpoint_store = None if test_mode else checkpoint_store_from_env(job_id, env)
+    checkpoints = JobCheckpoints(checkpoint_store, {
+        "pfd_goal": pfd_goal, "confidence_goal": confidence_goal, "failures": failures,
+        "update_method": update_method, "demand_search": demand_search,
+        "demand_tolerance": demand_tolerance, "demand_step": demand_step,
+        "submodel_method": submodel_method, "sampling_targets": sampling_targets,
+        "bbn_input_path": bbn_input_path, "bbn_input_bucket": bbn_input_bucket,
+    })
+    if checkpoint_store is not None:
+        print(f"[CONFIG] CHECKPOINTS: {type(checkpoint_store).__name__}")
+    
     dynamodb_client = None
     if jobs_table_name:
         dynamodb_client = boto3.client('dynamodb', region_name=aws_region)
@@ -128,46 +185,73 @@ def main():
         else:
             # Generate trace (composite model)
             print("\n[STEP 1] Generating composite model trace...")
-            
-            # TODO: modify the name of the function
-            trace = run_example_for_composite_model(bbn_data)
+            trace = checkpoints.load_trace()
+            if trace is not None:
+                print("[STEP 1] Resumed trace from checkpoint (BBN stage skipped)")
+                event("checkpoint_resume", stage="trace")
+            else:
+                # TODO: modify the name of the function
+                trace, cache_hit = run_cached_composite_model(
+                    bbn_data, store=trace_store_from_env(env),
+                    submodel_method=submodel_method,
+                    submodel_workers=int(env.get("SUBMODEL_WORKERS", "0")) or None,
+                    adaptive=sampling_targets,
+                )
+                if cache_hit:
+                    print("[STEP 1] Reused cached trace (BBN stage skipped)")
+                checkpoints.save_trace(trace)
             print("[STEP 1] Trace generation completed")
             
             # Sensitivity Analysis: calculate required demand
             print("\n[STEP 2] Running sensitivity analysis...")
-            demand_required = get_number_of_required_demand(
-                trace, pfd_goal=pfd_goal, confidence_goal=confidence_goal
-            )
+            demand_required = checkpoints.load_json("sensitivity")
+            if demand_required is not None:
+                print("[STEP 2] Resumed required demand from checkpoint")
+                event("checkpoint_resume", stage="sensitivity")
+            else:
+                demand_required = int(get_number_of_required_demand(
+                    trace, pfd_goal=pfd_goal, confidence_goal=confidence_goal,
+                    method=update_method, search=demand_search, tolerance=demand_tolerance,
+                    adaptive=sampling_targets,
+                ))
+                checkpoints.save_json("sensitivity", demand_required)
             print(f"[STEP 2] Required number of tests: {int(demand_required)}")
             
             # Trace preprocessing
             filtered_pfd_trace = filter_outsiders(trace.posterior["PFD"])
-            prior_mean = trace.posterior["PFD"].mean().item()
-            prior_conf = get_confidence(data=trace.posterior["PFD"], goal=pfd_goal)
+            prior_cdf = EmpiricalCDF.from_trace(trace)
+            prior_mean = prior_cdf.mean
+            prior_conf = prior_cdf.confidence(pfd_goal)
             
             print(f"[STEP 2] Prior mean: {prior_mean}")
             print(f"[STEP 2] Prior confidence @goal: {prior_conf}")
             
-            # Full Analysis: iterate through demand_list and sample
-            print("\n[STEP 3] Running full analysis with demand list...")
-            demand_list = list(range(500, int(demand_required) + 500, 500))
-            pfd_output = []
-            last_conf = None
-            
-            for idx, demand in enumerate(demand_list, 1):
-                print(f"[STEP 3] Processing demand {idx}/{len(demand_list)}: {demand}")
-                model = demand_model_func(
-                    demand=demand, 
-                    observed_failures=failures, 
-                    pfd_trace=filtered_pfd_trace
-                )
-                updated_trace = run_sampling(model, draws=2000, tune=500)
-                updated_mean = updated_trace.posterior["pfd_prior"].mean().item()
-                last_conf = get_confidence(
-                    data=updated_trace.posterior["pfd_prior"], goal=pfd_goal
-                )
-                pfd_output.append([str(demand), updated_mean])
-                print(f"[STEP 3] Demand={demand} → PFD={updated_mean}, Confidence={last_conf}")
+            # Full Analysis: iterate through demand_list and update
+            print(f"\n[STEP 3] Running full analysis with demand list ({update_method})...")
+            demand_list = demand_grid(demand_required, step=demand_step)
+            # [[demand, mean, confidence], ...] of the points an earlier run finished
+            points = checkpoints.load_json("sweep") or []
+            if [point[0] for point in points] != demand_list[:len(points)]:
+                points = []
+            if points:
+                print(f"[STEP 3] Resumed {len(points)}/{len(demand_list)} demand points from checkpoint")
+                event("checkpoint_resume", stage="sweep", points=len(points))
+            last_checkpoint = time.monotonic()
+            for point in iter_demand_sweep(
+                demand_list[len(points):],
+                observed_failures=failures,
+                pfd_trace=filtered_pfd_trace,
+                pfd_goal=pfd_goal,
+                method=update_method,
+                adaptive=sampling_targets,
+            ):
+                points.append(list(point))
+                if time.monotonic() - last_checkpoint >= checkpoint_interval:
+                    checkpoints.save_json("sweep", points)
+                    last_checkpoint = time.monotonic()
+            checkpoints.save_json("sweep", points)
+            pfd_output, last_conf = sweep_to_pfd_series(sweep_from_points(points))
+            print(f"[STEP 3] Swept {len(demand_list)} demand points, final confidence={last_conf}")
         
         # Build result JSON
         result_json = {
@@ -181,6 +265,8 @@ def main():
                         "confidence": prior_conf,
                     },
                     "observed_failures": failures,
+                    "method": update_method,
+                    "demand_step": demand_step,
                 },
                 "bbn_input": bbn_input_info,
             },
@@ -195,14 +281,19 @@ def main():
         s3_client = boto3.client('s3', region_name=aws_region)
         s3_key = f"results/full-analysis-{job_id}.json"
         
-        s3_client.put_object(
-            Bucket=s3_bucket,
-            Key=s3_key,
-            Body=json.dumps(result_json, indent=2),
-            ContentType="application/json"
-        )
+        with span("upload_results"):
+            body = json.dumps(result_json, indent=2).encode("utf-8")
+            s3_client.put_object(
+                Bucket=s3_bucket,
+                Key=s3_key,
+                Body=body,
+                ContentType="application/json"
+            )
         
         print(f"[STEP 4] Results uploaded to s3://{s3_bucket}/{s3_key}")
+        index_result(env, s3_bucket, s3_key, len(body), job_id, "full-analysis")
+        # the result is durable now, a rerun of this job id starts over
+        checkpoints.clear()
         
         # Update DynamoDB status: COMPLETED
         if jobs_table_name and dynamodb_client:
@@ -258,9 +349,18 @@ def main():
             "job_id": job_id,
             "error": error_msg
         }))
-        sys.exit(1)
+        raise
 
 
 if __name__ == "__main__":
-    main()
+    # JSON-line spans (trace generation, submodels, sampling, search, demand points) and a final
+    # metrics summary go to stdout / CloudWatch; METRICS_LOG=off disables them
+    try:
+        with span("job", job_type="full-analysis", job_id=os.environ.get("JOB_ID")):
+            main()
+    except Exception:
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        emit_metrics_summary(job_type="full-analysis", job_id=os.environ.get("JOB_ID"))
 
@@ -6,8 +6,18 @@ Environment variables:
 - JOB_ID: Job identifier
 - PFD_GOAL: Target PFD value
 - CONFIDENCE_GOAL: Target confidence level
+- UPDATE_METHOD: "analytic" (default, exact reweighting) or "mcmc" (sampling cross-check)
+- DEMAND_SEARCH: "bisect" (default, no demand ceiling) or "linear" (legacy walk up to 25000)
+- DEMAND_TOLERANCE: Tolerance of the bisection search in demands (default: 10)
+- SUBMODEL_METHOD: "analytic" (default) or "mcmc" for the Dev/VV attribute submodels
+- SUBMODEL_WORKERS: Parallel processes for SUBMODEL_METHOD=mcmc (default: one per vCPU, at most 10)
+- SAMPLING_TARGETS: Optional JSON object of adaptive sampling targets (e.g. '{"ess": 400, "rhat": 1.01}',
+  keys of bbn_utils.default_sampling_targets) for the composite model, SUBMODEL_METHOD=mcmc and
+  UPDATE_METHOD=mcmc; every run then samples until the targets are met (R-hat needs chains >= 2)
+- TRACE_CACHE_DIR / TRACE_CACHE_S3_BUCKET (+ TRACE_CACHE_S3_PREFIX): optional composite trace cache
 - S3_BUCKET: S3 bucket name for results
 - AWS_REGION: AWS region
+- RESULTS_INDEX_TABLE: DynamoDB result index of listBbnResults (optional, result_index.py)
 
 Output:
 - Uploads JSON to S3: s3://{S3_BUCKET}/results/sensitivity-analysis-{JOB_ID}.json
@@ -16,35 +26,50 @@ Output:
 import os
 import sys
 import json
+import traceback
 import boto3
 from typing import Dict, Any
 
 sys.path.insert(0, '/app/server')
 
+# COMPILE_CACHE_DIR: must run before anything imports PyMC / JAX
+from bbn_inference.compile_cache import configure_compile_cache
+configure_compile_cache()
+
 from bbn_inference.sensitivity_analysis import (
     get_number_of_required_demand,
     filter_outsiders,
-    get_confidence,
+    check_update_method,
 )
-from bbn_inference.examples.example_for_composite_model import run_example_for_composite_model
+from bbn_inference.bbn_utils import sampling_targets_from_env
+from bbn_inference.examples.example_for_composite_model import run_cached_composite_model
+from bbn_inference.trace_store import trace_store_from_env
+from bbn_inference.empirical_cdf import EmpiricalCDF
+from bbn_inference.instrumentation import span, emit_metrics_summary
 from bbn_input_loader import load_bayesian_data_from_env
+from result_index import index_result
 
 
-def main():
+def main(env=None):
+    # env: the task environment (os.environ, or a queue message in run_worker.py)
+    env = os.environ if env is None else env
     print("=" * 80)
     print("HybridTool Sensitivity Analysis - Starting")
     print("=" * 80)
     
     # Read environment variables
-    job_id = os.environ.get("JOB_ID")
-    pfd_goal = float(os.environ.get("PFD_GOAL", "0"))
-    confidence_goal = float(os.environ.get("CONFIDENCE_GOAL", "0"))
-    s3_bucket = os.environ.get("S3_BUCKET")
-    aws_region = os.environ.get("AWS_REGION", "ap-northeast-2")
-    test_mode = os.environ.get("TEST_MODE", "false").lower() == "true"
-    bbn_input_path = os.environ.get("BBN_INPUT_PATH")
-    bbn_input_bucket = os.environ.get("BBN_INPUT_BUCKET")
-    jobs_table_name = os.environ.get("JOBS_TABLE_NAME")
+    job_id = env.get("JOB_ID")
+    pfd_goal = float(env.get("PFD_GOAL", "0"))
+    confidence_goal = float(env.get("CONFIDENCE_GOAL", "0"))
+    update_method = env.get("UPDATE_METHOD", "analytic").lower()
+    demand_search = env.get("DEMAND_SEARCH", "bisect").lower()
+    demand_tolerance = int(env.get("DEMAND_TOLERANCE", "10"))
+    s3_bucket = env.get("S3_BUCKET")
+    aws_region = env.get("AWS_REGION", "ap-northeast-2")
+    test_mode = env.get("TEST_MODE", "false").lower() == "true"
+    bbn_input_path = env.get("BBN_INPUT_PATH")
+    bbn_input_bucket = env.get("BBN_INPUT_BUCKET")
+    jobs_table_name = env.get("JOBS_TABLE_NAME")
     
     dynamodb_client = None
     if jobs_table_name:
@@ -56,10 +81,15 @@ def main():
         raise ValueError("S3_BUCKET environment variable is required")
     if pfd_goal <= 0 or confidence_goal <= 0:
         raise ValueError("PFD_GOAL and CONFIDENCE_GOAL must be positive numbers")
+    check_update_method(update_method)
+    sampling_targets = sampling_targets_from_env(env)
     
     print(f"[CONFIG] JOB_ID: {job_id}")
     print(f"[CONFIG] PFD_GOAL: {pfd_goal}")
     print(f"[CONFIG] CONFIDENCE_GOAL: {confidence_goal}")
+    print(f"[CONFIG] UPDATE_METHOD: {update_method}")
+    print(f"[CONFIG] SAMPLING_TARGETS: {sampling_targets or 'off (fixed draws/tune)'}")
+    print(f"[CONFIG] DEMAND_SEARCH: {demand_search} (tolerance={demand_tolerance})")
     print(f"[CONFIG] S3_BUCKET: {s3_bucket}")
     print(f"[CONFIG] BBN_INPUT_PATH: {bbn_input_path or 'default (nrc_report_data)'}")
     if bbn_input_bucket:
@@ -114,22 +144,31 @@ def main():
             # Generate trace
             print("\n[STEP 1] Generating composite model trace...")
             try:
-                trace = run_example_for_composite_model(bbn_data)
+                trace, cache_hit = run_cached_composite_model(
+                    bbn_data, store=trace_store_from_env(env),
+                    submodel_method=env.get("SUBMODEL_METHOD", "analytic").lower(),
+                    submodel_workers=int(env.get("SUBMODEL_WORKERS", "0")) or None,
+                    adaptive=sampling_targets,
+                )
+                if cache_hit:
+                    print("[STEP 1] Reused cached trace (BBN stage skipped)")
                 print("[STEP 1] Trace generation completed")
             except Exception as trace_error:
                 print(f"[ERROR] Trace generation failed: {str(trace_error)}", file=sys.stderr)
-                import traceback
                 traceback.print_exc()
                 raise
             
             # 2. Sensitivity Analysis
             print("\n[STEP 2] Running sensitivity analysis...")
             num_tests = get_number_of_required_demand(
-                trace, pfd_goal=pfd_goal, confidence_goal=confidence_goal
+                trace, pfd_goal=pfd_goal, confidence_goal=confidence_goal,
+                method=update_method, search=demand_search, tolerance=demand_tolerance,
+                adaptive=sampling_targets,
             )
             print(f"[STEP 2] Required number of tests: {int(num_tests)}")
-            prior_mean = trace.posterior["PFD"].mean().item()
-            prior_conf = get_confidence(data=trace.posterior["PFD"], goal=pfd_goal)
+            prior_cdf = EmpiricalCDF.from_trace(trace)
+            prior_mean = prior_cdf.mean
+            prior_conf = prior_cdf.confidence(pfd_goal)
             
             print(f"[STEP 2] Prior mean: {prior_mean}")
             print(f"[STEP 2] Prior confidence @goal: {prior_conf}")
@@ -141,6 +180,7 @@ def main():
                 "num_tests": int(num_tests),
                 "prior_mean": prior_mean,
                 "prior_confidence": prior_conf,
+                "method": update_method,
             },
             "bbn_input": bbn_input_info,
         }
@@ -150,14 +190,17 @@ def main():
         s3_client = boto3.client('s3', region_name=aws_region)
         s3_key = f"results/sensitivity-analysis-{job_id}.json"
         
-        s3_client.put_object(
-            Bucket=s3_bucket,
-            Key=s3_key,
-            Body=json.dumps(result_json, indent=2),
-            ContentType="application/json"
-        )
+        with span("upload_results"):
+            body = json.dumps(result_json, indent=2).encode("utf-8")
+            s3_client.put_object(
+                Bucket=s3_bucket,
+                Key=s3_key,
+                Body=body,
+                ContentType="application/json"
+            )
         
         print(f"[STEP 3] Results uploaded to s3://{s3_bucket}/{s3_key}")
+        index_result(env, s3_bucket, s3_key, len(body), job_id, "sensitivity-analysis")
         
         # Update DynamoDB status: COMPLETED
         if jobs_table_name and dynamodb_client:
@@ -211,9 +254,18 @@ def main():
             "job_id": job_id,
             "error": error_msg
         }))
-        sys.exit(1)
+        raise
 
 
 if __name__ == "__main__":
-    main()
+    # JSON-line spans (trace generation, submodels, sampling, search, demand points) and a final
+    # metrics summary go to stdout / CloudWatch; METRICS_LOG=off disables them
+    try:
+        with span("job", job_type="sensitivity-analysis", job_id=os.environ.get("JOB_ID")):
+            main()
+    except Exception:
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        emit_metrics_summary(job_type="sensitivity-analysis", job_id=os.environ.get("JOB_ID"))
 
@@ -7,8 +7,16 @@ Environment variables:
 - PFD_GOAL: Target PFD value
 - DEMAND: Number of tests
 - FAILURES: Observed number of failures
+- UPDATE_METHOD: "analytic" (default, exact reweighting) or "mcmc" (sampling cross-check)
+- SUBMODEL_METHOD: "analytic" (default) or "mcmc" for the Dev/VV attribute submodels
+- SUBMODEL_WORKERS: Parallel processes for SUBMODEL_METHOD=mcmc (default: one per vCPU, at most 10)
+- SAMPLING_TARGETS: Optional JSON object of adaptive sampling targets (e.g. '{"ess": 400, "rhat": 1.01}',
+  keys of bbn_utils.default_sampling_targets) for the composite model, SUBMODEL_METHOD=mcmc and
+  UPDATE_METHOD=mcmc; every run then samples until the targets are met (R-hat needs chains >= 2)
+- TRACE_CACHE_DIR / TRACE_CACHE_S3_BUCKET (+ TRACE_CACHE_S3_PREFIX): optional composite trace cache
 - S3_BUCKET: S3 bucket name for results
 - AWS_REGION: AWS region
+- RESULTS_INDEX_TABLE: DynamoDB result index of listBbnResults (optional, result_index.py)
 
 Output:
 - Uploads JSON to S3: s3://{S3_BUCKET}/results/update-pfd-{JOB_ID}.json
@@ -17,36 +25,49 @@ Output:
 import os
 import sys
 import json
+import traceback
 import boto3
 
 sys.path.insert(0, '/app/server')
 
+# COMPILE_CACHE_DIR: must run before anything imports PyMC / JAX
+from bbn_inference.compile_cache import configure_compile_cache
+configure_compile_cache()
+
 from bbn_inference.sensitivity_analysis import (
     filter_outsiders,
-    get_confidence,
-    demand_model_func,
+    check_update_method,
+    run_demand_update,
+    histogram_to_json,
 )
-from bbn_inference.examples.example_for_composite_model import run_example_for_composite_model
-from bbn_inference.bbn_utils import run_sampling
+from bbn_inference.bbn_utils import sampling_targets_from_env
+from bbn_inference.examples.example_for_composite_model import run_cached_composite_model
+from bbn_inference.trace_store import trace_store_from_env
+from bbn_inference.empirical_cdf import EmpiricalCDF
+from bbn_inference.instrumentation import span, emit_metrics_summary
 from bbn_input_loader import load_bayesian_data_from_env
+from result_index import index_result
 
 
-def main():
+def main(env=None):
+    # env: the task environment (os.environ, or a queue message in run_worker.py)
+    env = os.environ if env is None else env
     print("=" * 80)
     print("HybridTool Update PFD - Starting")
     print("=" * 80)
     
     # Read environment variables
-    job_id = os.environ.get("JOB_ID")
-    pfd_goal = float(os.environ.get("PFD_GOAL", "0"))
-    demand = int(os.environ.get("DEMAND", "0"))
-    failures = int(os.environ.get("FAILURES", "0"))
-    s3_bucket = os.environ.get("S3_BUCKET")
-    aws_region = os.environ.get("AWS_REGION", "ap-northeast-2")
-    test_mode = os.environ.get("TEST_MODE", "false").lower() == "true"
-    bbn_input_path = os.environ.get("BBN_INPUT_PATH")
-    bbn_input_bucket = os.environ.get("BBN_INPUT_BUCKET")
-    jobs_table_name = os.environ.get("JOBS_TABLE_NAME")
+    job_id = env.get("JOB_ID")
+    pfd_goal = float(env.get("PFD_GOAL", "0"))
+    demand = int(env.get("DEMAND", "0"))
+    failures = int(env.get("FAILURES", "0"))
+    update_method = env.get("UPDATE_METHOD", "analytic").lower()
+    s3_bucket = env.get("S3_BUCKET")
+    aws_region = env.get("AWS_REGION", "ap-northeast-2")
+    test_mode = env.get("TEST_MODE", "false").lower() == "true"
+    bbn_input_path = env.get("BBN_INPUT_PATH")
+    bbn_input_bucket = env.get("BBN_INPUT_BUCKET")
+    jobs_table_name = env.get("JOBS_TABLE_NAME")
     
     if not job_id:
         raise ValueError("JOB_ID environment variable is required")
@@ -60,11 +81,15 @@ def main():
         raise ValueError("FAILURES must be non-negative")
     if failures > demand:
         raise ValueError("failures cannot exceed demand")
+    check_update_method(update_method)
+    sampling_targets = sampling_targets_from_env(env)
     
     print(f"[CONFIG] JOB_ID: {job_id}")
     print(f"[CONFIG] PFD_GOAL: {pfd_goal}")
     print(f"[CONFIG] DEMAND: {demand}")
     print(f"[CONFIG] FAILURES: {failures}")
+    print(f"[CONFIG] UPDATE_METHOD: {update_method}")
+    print(f"[CONFIG] SAMPLING_TARGETS: {sampling_targets or 'off (fixed draws/tune)'}")
     print(f"[CONFIG] S3_BUCKET: {s3_bucket}")
     print(f"[CONFIG] BBN_INPUT_PATH: {bbn_input_path or 'default (nrc_report_data)'}")
     if bbn_input_bucket:
@@ -115,6 +140,7 @@ def main():
             before_conf = 0.95
             updated_pfd_mean = 99999
             updated_conf = 99999
+            updated_histogram = None
             print(f"[STEP 2] Prior mean (from input): {prior_mean}")
             print(f"[STEP 2] Prior confidence (dummy): {before_conf}")
             print(f"[STEP 3] Updated PFD mean (DUMMY): {updated_pfd_mean}")
@@ -122,30 +148,41 @@ def main():
         else:
             # Generate trace
             print("\n[STEP 1] Generating composite model trace...")
-            trace = run_example_for_composite_model(bbn_data)
+            trace, cache_hit = run_cached_composite_model(
+                bbn_data, store=trace_store_from_env(env),
+                submodel_method=env.get("SUBMODEL_METHOD", "analytic").lower(),
+                submodel_workers=int(env.get("SUBMODEL_WORKERS", "0")) or None,
+                adaptive=sampling_targets,
+            )
+            if cache_hit:
+                print("[STEP 1] Reused cached trace (BBN stage skipped)")
             print("[STEP 1] Trace generation completed")
             
             # Trace preprocessing
             filtered_pfd_trace = filter_outsiders(trace.posterior["PFD"])
-            prior_mean = trace.posterior["PFD"].mean().item()
-            before_conf = get_confidence(data=trace.posterior["PFD"], goal=pfd_goal)
+            prior_cdf = EmpiricalCDF.from_trace(trace)
+            prior_mean = prior_cdf.mean
+            before_conf = prior_cdf.confidence(pfd_goal)
             
             print(f"[STEP 2] Prior mean: {prior_mean}")
             print(f"[STEP 2] Prior confidence @goal: {before_conf}")
             
-            # PFD update (sampling)
-            print("\n[STEP 3] Running PFD update sampling...")
-            model = demand_model_func(
-                demand=demand,
-                observed_failures=failures,
-                pfd_trace=filtered_pfd_trace,
-            )
-            updated_trace = run_sampling(model, draws=2000, tune=500)
+            # PFD update (analytic reweighting or sampling)
+            print(f"\n[STEP 3] Running PFD update ({update_method})...")
+            with span("demand_update", demand=demand, method=update_method):
+                updated = run_demand_update(
+                    demand=demand,
+                    observed_failures=failures,
+                    pfd_trace=filtered_pfd_trace,
+                    pfd_goal=pfd_goal,
+                    method=update_method,
+                    bins=100,
+                    adaptive=sampling_targets,
+                )
             
-            updated_pfd_mean = updated_trace.posterior["pfd_prior"].mean().item()
-            updated_conf = get_confidence(
-                data=updated_trace.posterior["pfd_prior"], goal=pfd_goal
-            )
+            updated_pfd_mean = updated["mean"]
+            updated_conf = updated["confidence"]
+            updated_histogram = histogram_to_json(updated["histogram"])
             
             print(f"[STEP 3] Updated PFD mean: {updated_pfd_mean}")
             print(f"[STEP 3] Updated confidence @goal: {updated_conf}")
@@ -158,6 +195,8 @@ def main():
                 "updated_confidence": updated_conf,
                 "prior_mean": prior_mean,
                 "prior_confidence": before_conf,
+                "updated_histogram": updated_histogram,
+                "method": update_method,
             },
             "bbn_input": bbn_input_info,
         }
@@ -167,14 +206,17 @@ def main():
         s3_client = boto3.client('s3', region_name=aws_region)
         s3_key = f"results/update-pfd-{job_id}.json"
         
-        s3_client.put_object(
-            Bucket=s3_bucket,
-            Key=s3_key,
-            Body=json.dumps(result_json, indent=2),
-            ContentType="application/json"
-        )
+        with span("upload_results"):
+            body = json.dumps(result_json, indent=2).encode("utf-8")
+            s3_client.put_object(
+                Bucket=s3_bucket,
+                Key=s3_key,
+                Body=body,
+                ContentType="application/json"
+            )
         
         print(f"[STEP 4] Results uploaded to s3://{s3_bucket}/{s3_key}")
+        index_result(env, s3_bucket, s3_key, len(body), job_id, "update-pfd")
         
         # Update DynamoDB status: COMPLETED
         if jobs_table_name and dynamodb_client:
@@ -229,9 +271,18 @@ def main():
             "job_id": job_id,
             "error": error_msg
         }))
-        sys.exit(1)
+        raise
 
 
 if __name__ == "__main__":
-    main()
+    # JSON-line spans (trace generation, submodels, sampling, search, demand points) and a final
+    # metrics summary go to stdout / CloudWatch; METRICS_LOG=off disables them
+    try:
+        with span("job", job_type="update-pfd", job_id=os.environ.get("JOB_ID")):
+            main()
+    except Exception:
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        emit_metrics_summary(job_type="update-pfd", job_id=os.environ.get("JOB_ID"))
 
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+ECS Fargate Service: long-lived HybridTool worker (TASK_TYPE=worker)
+
+A one-shot task pays container start, the PyMC/JAX import and the model compilation for every job.
+The worker stays up instead and runs the jobs that the Lambda triggers put on a queue (JOBS_QUEUE_URL set
+on the trigger). The compiled composite model, the generic model artifact, the importance baselines
+and the most recent traces stay in memory between jobs. Each message is the environment of a one-shot
+task (TASK_TYPE, JOB_ID, PFD_GOAL, ...), passed to the same main(env) of run_<TASK_TYPE>.py. Job
+statuses in DynamoDB (RUNNING / COMPLETED / FAILED, resultsPath, errorMessage) are unchanged.
+
+Environment variables:
+- JOBS_QUEUE_URL: SQS queue URL, or JOBS_QUEUE_DB: path of the local SQLite queue (job_queue.py)
+- JOBS_QUEUE_VISIBILITY_SECONDS: Visibility timeout of a received job, renewed while it runs (default: 900)
+- JOBS_QUEUE_MAX_RECEIVES: A job delivered more often than this (its worker stopped while running it)
+  is marked FAILED instead of being run again (default: 3)
+- WORKER_MAX_JOBS: Exit after this many jobs (default: 0, no limit)
+- WORKER_IDLE_EXIT_SECONDS: Exit after this long without a job (default: 0, never)
+- WORKER_WARMUP: "true" (default) loads the generic artifact and compiles the composite model at start
+- TRACE_CACHE_MEMORY_ENTRIES: Composite traces kept in memory (default in the worker: 32)
+- Every variable of the task scripts; a message overrides them for its job
+"""
+
+import os
+import sys
+import json
+import signal
+import threading
+import time
+import traceback
+
+import boto3
+
+sys.path.insert(0, '/app/server')
+
+# COMPILE_CACHE_DIR: must run before anything imports PyMC / JAX
+from bbn_inference.compile_cache import configure_compile_cache
+configure_compile_cache()
+
+import run_sensitivity_analysis
+import run_update_pfd
+import run_full_analysis
+import run_attribute_importance
+from job_queue import job_queue_from_env
+from bbn_inference.instrumentation import span, emit_metrics_summary
+
+# TASK_TYPE of a message -> main(env) of the one-shot task script
+task_functions = {
+    "sensitivity_analysis": run_sensitivity_analysis.main,
+    "update_pfd": run_update_pfd.main,
+    "full_analysis": run_full_analysis.main,
+    "attribute_importance": run_attribute_importance.main,
+}
+
+default_memory_traces = 32
+default_max_receives = 3
+
+
+class Heartbeat:
+    # renews the visibility timeout of the running job, so long jobs are not delivered twice
+    def __init__(self, queue, handle):
+        self.queue = queue
+        self.handle = handle
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, name="job-heartbeat", daemon=True)
+
+    def run(self):
+        while not self.stopped.wait(self.queue.visibility_seconds / 2):
+            try:
+                self.queue.extend(self.handle)
+            except Exception as e:
+                print(f"[WARNING] Failed to extend the visibility of the running job: {str(e)}")
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stopped.set()
+        self.thread.join()
+
+
+def mark_failed(env, error_msg, from_statuses=("PENDING",)):
+    """
+    FAILED with errorMessage, only while the job is in one of from_statuses. The default (PENDING)
+    leaves failures the task script records itself (after setting RUNNING) as they are; a job whose
+    worker died mid-run is still RUNNING, so the redelivery limit passes ("PENDING", "RUNNING").
+    """
+    jobs_table_name = env.get("JOBS_TABLE_NAME")
+    job_id = env.get("JOB_ID")
+    print(f"[ERROR] {error_msg}", file=sys.stderr)
+    if not (jobs_table_name and job_id):
+        return
+    placeholders = {f':p{i}': {'S': status} for i, status in enumerate(from_statuses)}
+    try:
+        boto3.client('dynamodb', region_name=env.get("AWS_REGION", "ap-northeast-2")).update_item(
+            TableName=jobs_table_name,
+            Key={'jobId': {'S': job_id}},
+            UpdateExpression='SET jobStatus = :s, errorMessage = :e',
+            ConditionExpression=f"jobStatus IN ({', '.join(placeholders)})",
+            ExpressionAttributeValues={
+                ':s': {'S': 'FAILED'},
+                ':e': {'S': error_msg[:500]},  # 최대 500자
+                **placeholders,
+            }
+        )
+        print(f"[DynamoDB] Job status updated to FAILED: {job_id}")
+    except Exception as e:
+        print(f"[WARNING] Failed to update DynamoDB status to FAILED: {str(e)}")
+
+
+def warm_up():
+    # import and compile everything the first job would otherwise pay for
+    from bbn_inference.attribute_posterior import attribute_submodel_traces
+    from bbn_inference.composite_model import composite_model_for
+    from bbn_inference.data import nrc_report_data
+    from bbn_inference.generic_artifact import load_generic_artifact
+
+    with span("worker_warmup"):
+        data = nrc_report_data()
+        generic_artifact = load_generic_artifact()
+        traces = attribute_submodel_traces(data.attr_states)
+        composite_model_for(generic_artifact, traces, data.function_point, data.complexity)
+
+
+def run_message(queue, handle, env, receive_count, max_receives):
+    task_type = env.get("TASK_TYPE", "")
+    job_id = env.get("JOB_ID")
+    print(f"[WORKER] Received {task_type} job {job_id} (delivery {receive_count})")
+
+    if receive_count > max_receives:
+        mark_failed(env, f"Job was delivered {receive_count} times without finishing",
+                    from_statuses=("PENDING", "RUNNING"))
+    elif task_type not in task_functions:
+        mark_failed(env, f"Unknown TASK_TYPE: {task_type} (expected one of {tuple(task_functions)})")
+    else:
+        with Heartbeat(queue, handle):
+            try:
+                with span("job", job_type=task_type.replace("_", "-"), job_id=job_id, worker=True):
+                    task_functions[task_type](env)
+            except Exception as e:
+                # the script has recorded FAILED unless it stopped before setting RUNNING
+                traceback.print_exc()
+                mark_failed(env, f"{type(e).__name__}: {str(e)}")
+    # failed jobs are not retried, as with the one-shot task
+    queue.delete(handle)
+
+
+def main():
+    environ = dict(os.environ)
+    environ.setdefault("TRACE_CACHE_MEMORY_ENTRIES", str(default_memory_traces))
+    max_receives = int(environ.get("JOBS_QUEUE_MAX_RECEIVES", default_max_receives))
+    max_jobs = int(environ.get("WORKER_MAX_JOBS", "0"))
+    idle_exit_seconds = float(environ.get("WORKER_IDLE_EXIT_SECONDS", "0"))
+    queue = job_queue_from_env(environ)
+
+    # ECS stops a service task with SIGTERM: finish the running job, then exit
+    stopping = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stopping.set())
+
+    print("=" * 80)
+    print(f"HybridTool Worker - Starting ({type(queue).__name__})")
+    print("=" * 80)
+    if environ.get("WORKER_WARMUP", "true").lower() == "true":
+        warm_up()
+
+    jobs = 0
+    last_job = time.time()
+    while not stopping.is_set():
+        received = queue.receive()
+        if received is None:
+            if idle_exit_seconds and time.time() - last_job > idle_exit_seconds:
+                print(f"[WORKER] Idle for {idle_exit_seconds}s, exiting")
+                break
+            continue
+
+        handle, message, receive_count = received
+        env = {**environ, **{name: str(value) for name, value in message.items()}}
+        run_message(queue, handle, env, receive_count, max_receives)
+        jobs += 1
+        last_job = time.time()
+        # cumulative spans of this worker (warm-up, every job) after each job
+        emit_metrics_summary(job_type="worker", job_id=env.get("JOB_ID"), worker_jobs=jobs)
+        if max_jobs and jobs >= max_jobs:
+            break
+
+    print(json.dumps({"status": "stopped", "jobs": jobs}))
+
+
+if __name__ == "__main__":
+    main()
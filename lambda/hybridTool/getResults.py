@@ -5,10 +5,19 @@ Lambda Function: hybrid-tool-get-results
 - REST API 요청 수신 (GET /api/v1/results/{job_id})
 - JOB_ID로 S3에서 결과 조회
 - 직접 JSON 반환 (presigned URL 문제 해결을 위해 Lambda에서 직접 반환)
+- ETag / If-None-Match: 결과가 바뀌지 않았으면 304 (S3 조건부 GET, 본문 전송과 JSON 파싱 없음)
+- fields=: 결과의 일부만 반환 (쉼표로 구분한 경로, 예: input.parameter.test_count,output.confidence,
+  또는 summary: 타입별 요약, full-analysis에서는 pfd 시계열 제외)
+- GZIP_MIN_BYTES 이상인 응답은 Accept-Encoding: gzip 요청에 gzip + base64(isBase64Encoded)로 반환
+  (REST API Gateway는 binary media type 설정 필요, aws-configs/README.md 참고)
 """
 
+import base64
+import gzip
+import hashlib
 import json
 import os
+import re
 import boto3
 from botocore.exceptions import ClientError
 from datetime import timedelta
@@ -18,6 +27,110 @@ s3_client = boto3.client('s3', region_name=os.environ.get('AWS_REGION', 'ap-nort
 # 환경 변수
 S3_BUCKET = os.environ.get('S3_BUCKET')
 PRESIGNED_URL_EXPIRY = int(os.environ.get('PRESIGNED_URL_EXPIRY', '3600'))  # 기본 1시간
+GZIP_MIN_BYTES = int(os.environ.get('GZIP_MIN_BYTES', '0'))  # 0: 압축 안 함
+
+# fields=summary: 타입별 요약 (큰 배열 제외)
+SUMMARY_FIELDS = {
+    'full-analysis': ['input', 'output.confidence'],
+    'update-pfd': ['message', 'data.updated_pfd', 'data.updated_confidence', 'data.prior_mean',
+                   'data.prior_confidence', 'data.method', 'bbn_input'],
+    'sensitivity-analysis': ['message', 'data', 'bbn_input'],
+    'attribute-importance': ['message', 'data.draws', 'data.random_seed', 'data.pfd_goal', 'data.rank_by',
+                             'data.baseline', 'bbn_input'],
+}
+FIELD_PATTERN = re.compile(r'[A-Za-z0-9_]+(\.[A-Za-z0-9_]+)*')
+
+
+def _header(event, name):
+    # API Gateway 헤더 이름의 대소문자는 클라이언트에 따라 다름
+    for key, value in (event.get('headers') or {}).items():
+        if key.lower() == name.lower():
+            return value
+    return None
+
+
+def _parse_fields(fields_param, result_type):
+    if not fields_param:
+        return None
+    if fields_param == 'summary':
+        return SUMMARY_FIELDS.get(result_type, SUMMARY_FIELDS['full-analysis'])
+    fields = [field.strip() for field in fields_param.split(',') if field.strip()]
+    if not fields or not all(FIELD_PATTERN.fullmatch(field) for field in fields):
+        raise ValueError(f'Invalid fields: {fields_param} (comma-separated paths such as output.confidence, or summary)')
+    return fields
+
+
+def _project(data, fields):
+    # fields의 경로만 남긴 결과, 없는 경로는 생략
+    projected = {}
+    for field in fields:
+        path = field.split('.')
+        value = data
+        for part in path:
+            if not isinstance(value, dict) or part not in value:
+                break
+            value = value[part]
+        else:
+            target = projected
+            for part in path[:-1]:
+                target = target.setdefault(part, {})
+            target[path[-1]] = value
+    return projected
+
+
+def _fields_suffix(fields):
+    return '-' + hashlib.sha1(','.join(fields).encode('utf-8')).hexdigest()[:12] if fields else ''
+
+
+def _etag(s3_etag, fields):
+    # 같은 S3 객체라도 fields 프로젝션마다 다른 표현, 압축 여부와는 무관하므로 weak ETag
+    tag = s3_etag.strip('"')
+    return f'W/"{tag}{_fields_suffix(fields)}"'
+
+
+def _s3_if_none_match(if_none_match, fields):
+    # If-None-Match의 ETag 중 같은 프로젝션의 것을 S3 ETag로 변환 (S3 조건부 GET에 전달)
+    if not if_none_match:
+        return None
+    if if_none_match.strip() == '*':
+        return '*'
+    suffix = _fields_suffix(fields)
+    s3_etags = []
+    for token in if_none_match.split(','):
+        token = token.strip()
+        if token.startswith('W/'):
+            token = token[2:]
+        token = token.strip('"')
+        if suffix:
+            if not token.endswith(suffix):
+                continue
+            token = token[:-len(suffix)]
+        if token:
+            s3_etags.append(f'"{token}"')
+    return ', '.join(s3_etags) or None
+
+
+def _result_response(event, payload, etag):
+    headers = {
+        'Access-Control-Allow-Origin': '*',
+        'Access-Control-Expose-Headers': 'ETag',
+        'Content-Type': 'application/json',
+        'ETag': etag,
+        'Cache-Control': 'no-cache',  # 매번 ETag로 재검증
+    }
+    body = json.dumps(payload)
+    if GZIP_MIN_BYTES:
+        headers['Vary'] = 'Accept-Encoding'
+        accept_encoding = _header(event, 'Accept-Encoding') or ''
+        if len(body) >= GZIP_MIN_BYTES and 'gzip' in accept_encoding.lower():
+            headers['Content-Encoding'] = 'gzip'
+            return {
+                'statusCode': 200,
+                'headers': headers,
+                'body': base64.b64encode(gzip.compress(body.encode('utf-8'))).decode('ascii'),
+                'isBase64Encoded': True,
+            }
+    return {'statusCode': 200, 'headers': headers, 'body': body}
 
 
 def handler(event, context):
@@ -25,8 +138,10 @@ def handler(event, context):
     Lambda 핸들러 함수
     
     요청:
-    GET /api/v1/results/{job_id}?type={type} (REST API Gateway)
-    - type: 'sensitivity-analysis' | 'update-pfd' | 'full-analysis'
+    GET /api/v1/results/{job_id}?type={type}&fields={fields} (REST API Gateway)
+    - type: 'sensitivity-analysis' | 'update-pfd' | 'full-analysis' | 'attribute-importance'
+    - fields (선택): 'summary' 또는 쉼표로 구분한 경로 (예: 'input.parameter.test_count,output.confidence')
+    - If-None-Match 헤더 (선택): 이전 응답의 ETag, 결과가 같으면 304
     
     응답:
     {
@@ -48,7 +163,7 @@ def handler(event, context):
                 'headers': {
                     'Access-Control-Allow-Origin': '*',
                     'Access-Control-Allow-Methods': 'GET,POST,OPTIONS',
-                    'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token,x-api-key',
+                    'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token,x-api-key,If-None-Match',
                     'Content-Type': 'application/json'
                 },
                 'body': ''
@@ -143,61 +258,72 @@ def handler(event, context):
             s3_key = f"results/sensitivity-analysis-{job_id}.json"
         elif result_type == 'update-pfd':
             s3_key = f"results/update-pfd-{job_id}.json"
+        elif result_type == 'attribute-importance':
+            s3_key = f"results/attribute-importance-{job_id}.json"
         else:  # full-analysis
             s3_key = f"results/full-analysis-{job_id}.json"
         
         print(f"Checking S3 key: {s3_key}")
         
+        try:
+            fields = _parse_fields((event.get('queryStringParameters') or {}).get('fields'), result_type)
+        except ValueError as ve:
+            return {
+                'statusCode': 400,
+                'headers': {
+                    'Access-Control-Allow-Origin': '*',
+                    'Content-Type': 'application/json'
+                },
+                'body': json.dumps({'message': str(ve)})
+            }
+        if_none_match = _header(event, 'If-None-Match')
+        
         # Lambda에서 S3 파일 직접 읽어서 반환 (CORS 문제 우회)
         try:
             print(f"Fetching S3 object: s3://{S3_BUCKET}/{s3_key}")
             
-            # S3에서 파일 가져오기
-            response = s3_client.get_object(Bucket=S3_BUCKET, Key=s3_key)
+            # S3에서 파일 가져오기 (클라이언트의 ETag와 같으면 S3가 304로 응답)
+            get_params = {'Bucket': S3_BUCKET, 'Key': s3_key}
+            s3_if_none_match = _s3_if_none_match(if_none_match, fields)
+            if s3_if_none_match:
+                get_params['IfNoneMatch'] = s3_if_none_match
+            response = s3_client.get_object(**get_params)
             file_content = response['Body'].read().decode('utf-8')
             
             # 모든 타입을 Lambda에서 직접 반환 (presigned URL 서명 문제 해결)
-            if result_type == 'sensitivity-analysis':
-                # sensitivity-analysis는 data 필드에 포함
-                result_data = json.loads(file_content)
-                print(f"Successfully fetched and parsed result for job_id: {job_id}")
-                
-                return {
-                    'statusCode': 200,
-                    'headers': {
-                        'Access-Control-Allow-Origin': '*',
-                        'Content-Type': 'application/json'
-                    },
-                    'body': json.dumps({
-                        'job_id': job_id,
-                        'status': 'completed',
-                        'data': result_data,
-                        's3_location': f's3://{S3_BUCKET}/{s3_key}'
-                    })
-                }
-            else:
-                # update-pfd, full-analysis: presigned URL 문제 해결을 위해 데이터 직접 반환
-                result_data = json.loads(file_content)
-                print(f"Successfully fetched result for job_id: {job_id}, returning data directly")
-                
+            # sensitivity-analysis는 data 필드에 포함, update-pfd / full-analysis / attribute-importance도
+            # 데이터 직접 제공 (프론트엔드에서 blob URL 생성)
+            result_data = json.loads(file_content)
+            print(f"Successfully fetched and parsed result for job_id: {job_id}")
+            
+            payload = {
+                'job_id': job_id,
+                'status': 'completed',
+                'data': _project(result_data, fields) if fields else result_data,
+                's3_location': f's3://{S3_BUCKET}/{s3_key}'
+            }
+            if fields:
+                payload['fields'] = fields
+            return _result_response(event, payload, _etag(response['ETag'], fields))
+            
+        except ClientError as e:
+            error_code = e.response.get('Error', {}).get('Code', 'Unknown')
+            print(f"S3 ClientError: {error_code}, {str(e)}")
+            
+            # If-None-Match와 같은 결과: 본문 없이 304
+            if error_code in ('304', 'NotModified'):
+                s3_etag = e.response.get('ResponseMetadata', {}).get('HTTPHeaders', {}).get('etag')
                 return {
-                    'statusCode': 200,
+                    'statusCode': 304,
                     'headers': {
                         'Access-Control-Allow-Origin': '*',
-                        'Content-Type': 'application/json'
+                        'Access-Control-Expose-Headers': 'ETag',
+                        'ETag': _etag(s3_etag, fields) if s3_etag else if_none_match,
+                        'Cache-Control': 'no-cache',
                     },
-                    'body': json.dumps({
-                        'job_id': job_id,
-                        'status': 'completed',
-                        'data': result_data,  # 데이터 직접 제공 (프론트엔드에서 blob URL 생성)
-                        's3_location': f's3://{S3_BUCKET}/{s3_key}'
-                    })
+                    'body': ''
                 }
             
-        except ClientError as e:
-            error_code = e.response.get('Error', {}).get('Code', 'Unknown')
-            print(f"S3 ClientError: {error_code}, {str(e)}")
-            
             # 파일이 없으면 404 반환 (폴링 계속)
             if error_code == 'NoSuchKey' or error_code == '404':
                 return {
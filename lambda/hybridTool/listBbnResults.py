@@ -5,8 +5,15 @@ Lambda Function: hybrid-tool-list-bbn-results
 - REST API 요청 수신 (GET /api/v1/results)
 - S3 버킷의 BBN 결과 JSON 파일 목록을 반환
 - key 쿼리 파라미터가 있으면 해당 파일의 내용을 반환
+
+목록:
+- RESULTS_INDEX_TABLE이 설정되어 있으면 Task가 결과 업로드 시 기록하는 DynamoDB 인덱스
+  (Dockers/HybridTool/result_index.py)에서 최신순으로 한 페이지만 조회 (버킷 크기와 무관한 비용)
+- 인덱스가 없거나 조회에 실패하면 기존처럼 S3 prefix를 나열 (key 순서)
+- 쿼리 파라미터: limit (기본 100, 최대 500), job_type (예: full-analysis), cursor (이전 응답의 next_cursor)
 """
 
+import base64
 import json
 import os
 from typing import Dict, Any, List, Optional
@@ -16,10 +23,18 @@ from botocore.exceptions import ClientError
 from datetime import datetime
 
 s3_client = boto3.client("s3", region_name=os.environ.get("AWS_REGION", "ap-northeast-2"))
+dynamodb_client = boto3.client("dynamodb", region_name=os.environ.get("AWS_REGION", "ap-northeast-2"))
 
 DEFAULT_BUCKET = "bayesian-simulation-results-bucket"
 DEFAULT_PREFIX = "results/"
 
+# 결과 인덱스 (result_index.py와 같은 스키마): Task가 기록하는 results/ 바로 아래의 결과만 포함
+RESULTS_INDEX_TABLE = os.environ.get("RESULTS_INDEX_TABLE")
+INDEXED_PREFIX = "results/"
+LAST_MODIFIED_INDEX = "lastModified-index"  # 테이블 키는 (bucket, key): 결과 key당 항목 하나
+JOB_TYPE_INDEX = "jobType-index"
+JOB_TYPES = ("sensitivity-analysis", "update-pfd", "full-analysis", "attribute-importance")
+
 
 def _response(status_code: int, body: Dict[str, Any]) -> Dict[str, Any]:
     return {
@@ -49,10 +64,96 @@ def _get_bucket_and_prefix() -> (str, str):
     return bucket, prefix
 
 
-def _list_files(limit: int) -> Dict[str, Any]:
+def _job_type_of(name: str) -> str:
+    # 결과 파일 이름: "<job type>-<job id>.json"
+    for job_type in JOB_TYPES:
+        if name.startswith(f"{job_type}-"):
+            return job_type
+    return "other"
+
+
+def _encode_cursor(source: str, position: Any) -> str:
+    document = json.dumps({"source": source, "position": position}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(document.encode("utf-8")).decode("ascii")
+
+
+def _parse_cursor(cursor: str) -> Dict[str, Any]:
+    try:
+        decoded = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(decoded, dict) or decoded.get("source") not in ("index", "s3") or not decoded.get("position"):
+        raise ValueError("Invalid cursor")
+    return decoded
+
+
+def _decode_cursor(cursor: Optional[str], source: str) -> Any:
+    # 다른 목록 방식(index / s3)에서 받은 cursor도 잘못된 cursor로 처리
+    if not cursor:
+        return None
+    decoded = _parse_cursor(cursor)
+    if decoded["source"] != source:
+        raise ValueError("Invalid cursor")
+    return decoded["position"]
+
+
+def _use_index() -> bool:
+    _, prefix = _get_bucket_and_prefix()
+    return bool(RESULTS_INDEX_TABLE) and prefix == INDEXED_PREFIX
+
+
+def _list_indexed(limit: int, job_type: Optional[str], cursor: Optional[str]) -> Dict[str, Any]:
+    bucket, prefix = _get_bucket_and_prefix()
+    query: Dict[str, Any] = {
+        "TableName": RESULTS_INDEX_TABLE,
+        "Limit": limit,
+        "ScanIndexForward": False,  # sortKey = "<lastModified>#<name>", 최신순
+    }
+    if job_type:
+        query["IndexName"] = JOB_TYPE_INDEX
+        query["KeyConditionExpression"] = "bucketJobType = :p"
+        query["ExpressionAttributeValues"] = {":p": {"S": f"{bucket}#{job_type}"}}
+    else:
+        query["IndexName"] = LAST_MODIFIED_INDEX
+        query["KeyConditionExpression"] = "#bucket = :p"
+        query["ExpressionAttributeNames"] = {"#bucket": "bucket"}
+        query["ExpressionAttributeValues"] = {":p": {"S": bucket}}
+    start_key = _decode_cursor(cursor, "index")
+    if start_key:
+        query["ExclusiveStartKey"] = start_key
+
+    response = dynamodb_client.query(**query)
+    items = [
+        {
+            "key": item["key"]["S"],
+            "name": item["name"]["S"],
+            "size": int(item["size"]["N"]),
+            "last_modified": item["lastModified"]["S"],
+            "job_id": item["jobId"]["S"],
+            "job_type": item["jobType"]["S"],
+        }
+        for item in response.get("Items", [])
+    ]
+    last_key = response.get("LastEvaluatedKey")
+    return {
+        "bucket": bucket,
+        "prefix": prefix,
+        "count": len(items),
+        "items": items,
+        "next_cursor": _encode_cursor("index", last_key) if last_key else None,
+        "source": "index",
+        "order": "newest_first",
+    }
+
+
+def _list_files(limit: int, job_type: Optional[str] = None, cursor: Optional[str] = None) -> Dict[str, Any]:
     bucket, prefix = _get_bucket_and_prefix()
     paginator = s3_client.get_paginator("list_objects_v2")
-    page_iterator = paginator.paginate(Bucket=bucket, Prefix=prefix)
+    pagination: Dict[str, Any] = {"Bucket": bucket, "Prefix": prefix}
+    start_after = _decode_cursor(cursor, "s3")
+    if start_after:
+        pagination["StartAfter"] = start_after
+    page_iterator = paginator.paginate(**pagination)
 
     items: List[Dict[str, Any]] = []
     for page in page_iterator:
@@ -78,12 +179,15 @@ def _list_files(limit: int) -> Dict[str, Any]:
             if not relative_key.lower().endswith(".json"):
                 continue
             display_name = relative_key
+            if job_type and _job_type_of(display_name) != job_type:
+                continue
             items.append(
                 {
                     "key": key,
                     "name": display_name,
                     "size": obj.get("Size"),
                     "last_modified": obj.get("LastModified"),
+                    "job_type": _job_type_of(display_name),
                 }
             )
             if len(items) >= limit:
@@ -96,9 +200,26 @@ def _list_files(limit: int) -> Dict[str, Any]:
         "prefix": prefix,
         "count": len(items),
         "items": items,
+        # limit에서 멈춘 경우 마지막 key 다음부터 이어서 나열
+        "next_cursor": _encode_cursor("s3", items[-1]["key"]) if len(items) >= limit else None,
+        "source": "s3",
+        "order": "key",
     }
 
 
+def _list_results(limit: int, job_type: Optional[str], cursor: Optional[str]) -> Dict[str, Any]:
+    # S3 목록(인덱스 조회 실패 시)에서 받은 cursor는 S3 목록으로 이어서 나열
+    if _use_index() and not (cursor and _parse_cursor(cursor)["source"] == "s3"):
+        try:
+            return _list_indexed(limit, job_type, cursor)
+        except ClientError as ce:
+            error_code = ce.response.get("Error", {}).get("Code", "Unknown")
+            print(f"[WARNING] Result index query failed ({error_code}), listing S3 instead")
+            # index cursor는 S3 목록에서 사용할 수 없으므로 처음부터 나열
+            cursor = None
+    return _list_files(limit, job_type, cursor)
+
+
 def _get_file(key: str) -> Dict[str, Any]:
     bucket, prefix = _get_bucket_and_prefix()
     normalized_key = key
@@ -141,6 +262,8 @@ def handler(event, context):
         params: Optional[Dict[str, Any]] = event.get("queryStringParameters") or {}
         key = params.get("key") if isinstance(params, dict) else None
         limit_param = params.get("limit") if isinstance(params, dict) else None
+        job_type = params.get("job_type") if isinstance(params, dict) else None
+        cursor = params.get("cursor") if isinstance(params, dict) else None
 
         if key:
             try:
@@ -164,7 +287,13 @@ def handler(event, context):
         if limit > 500:
             limit = 500
 
-        result = _list_files(limit)
+        if job_type and job_type not in JOB_TYPES:
+            return _response(400, {"message": f"Unknown job_type: {job_type} (expected one of {', '.join(JOB_TYPES)})"})
+
+        try:
+            result = _list_results(limit, job_type, cursor)
+        except ValueError as ve:
+            return _response(400, {"message": str(ve)})
         return _response(200, result)
 
     except Exception as exc:
@@ -0,0 +1,281 @@
+"""
+Lambda Function: hybrid-tool-trigger-importance-task
+
+기능:
+- API Gateway 요청 수신 (REST API: POST /api/v1/attribute-importance)
+- 입력 파라미터 검증
+- ECS Fargate Task 실행 (attribute importance, tornado)
+- JOB_ID 반환
+"""
+
+import json
+import os
+import boto3
+from datetime import datetime
+from botocore.exceptions import ClientError
+
+ecs_client = boto3.client('ecs', region_name=os.environ.get('AWS_REGION', 'ap-northeast-2'))
+sqs_client = boto3.client('sqs', region_name=os.environ.get('AWS_REGION', 'ap-northeast-2'))
+dynamodb = boto3.resource('dynamodb', region_name=os.environ.get('AWS_REGION', 'ap-northeast-2'))
+
+# 환경 변수
+CLUSTER_NAME = os.environ.get('CLUSTER_NAME')
+TASK_DEFINITION = os.environ.get('TASK_DEFINITION')
+SUBNET_IDS = os.environ.get('SUBNET_IDS', '').split(',') if os.environ.get('SUBNET_IDS') else []
+SECURITY_GROUP_IDS = os.environ.get('SECURITY_GROUP_IDS', '').split(',') if os.environ.get('SECURITY_GROUP_IDS') else []
+CONTAINER_NAME = os.environ.get('CONTAINER_NAME', 'hybrid-tool-container')
+S3_BUCKET = os.environ.get('S3_BUCKET')
+AWS_REGION = os.environ.get('AWS_REGION', 'ap-northeast-2')
+JOBS_TABLE_NAME = os.environ.get('JOBS_TABLE_NAME')
+JOBS_QUEUE_URL = os.environ.get('JOBS_QUEUE_URL')  # 설정 시 ECS Task 대신 워커 큐(run_worker.py)로 작업 전송
+
+
+def handler(event, context):
+    """
+    요청 본문:
+    {
+        "pfd_goal": 0.0001,                 (선택)
+        "rank_by": "pfd_mean",              (선택, "pfd_mean" | "confidence")
+        "attributes": ["SR_SDP", "IM_CM"],  (선택, 생략 시 전체)
+        "random_seed": 0,                   (선택)
+        "bbn_input_s3_bucket": "...",       (선택)
+        "bbn_input_s3_key": "..."           (선택)
+    }
+    """
+    # CORS Preflight 요청 처리 (OPTIONS 메서드)
+    if event.get('httpMethod') == 'OPTIONS':
+        return {
+            'statusCode': 200,
+            'headers': {
+                'Access-Control-Allow-Origin': '*',
+                'Access-Control-Allow-Methods': 'GET,POST,OPTIONS',
+                'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token,x-api-key',
+                'Content-Type': 'application/json'
+            },
+            'body': ''
+        }
+    
+    try:
+        # 환경 변수 검증
+        missing_vars = []
+        if not CLUSTER_NAME and not JOBS_QUEUE_URL:
+            missing_vars.append('CLUSTER_NAME')
+        if not TASK_DEFINITION and not JOBS_QUEUE_URL:
+            missing_vars.append('TASK_DEFINITION')
+        if not S3_BUCKET:
+            missing_vars.append('S3_BUCKET')
+        if not JOBS_QUEUE_URL and (not SUBNET_IDS or SUBNET_IDS == ['']):
+            missing_vars.append('SUBNET_IDS')
+        
+        if missing_vars:
+            return {
+                'statusCode': 500,
+                'headers': {
+                    'Access-Control-Allow-Origin': '*',
+                    'Content-Type': 'application/json'
+                },
+                'body': json.dumps({
+                    'message': f'Missing environment variables: {", ".join(missing_vars)}'
+                })
+            }
+        
+        # 요청 본문 파싱
+        try:
+            if isinstance(event.get('body'), str):
+                body = json.loads(event['body'])
+            else:
+                body = event.get('body', {})
+            
+            pfd_goal = float(body.get('pfd_goal') or 0)
+            rank_by = str(body.get('rank_by', 'pfd_mean')).lower()
+            attributes = body.get('attributes') or []
+            random_seed = int(body.get('random_seed', 0))
+            bbn_input_s3_bucket = body.get('bbn_input_s3_bucket')
+            bbn_input_s3_key = body.get('bbn_input_s3_key')
+            
+            # 입력 검증
+            if pfd_goal < 0:
+                return {
+                    'statusCode': 400,
+                    'headers': {
+                        'Access-Control-Allow-Origin': '*',
+                        'Content-Type': 'application/json'
+                    },
+                    'body': json.dumps({
+                        'message': 'pfd_goal must be a positive number'
+                    })
+                }
+            
+            if rank_by not in ('pfd_mean', 'confidence') or (rank_by == 'confidence' and not pfd_goal):
+                return {
+                    'statusCode': 400,
+                    'headers': {
+                        'Access-Control-Allow-Origin': '*',
+                        'Content-Type': 'application/json'
+                    },
+                    'body': json.dumps({
+                        'message': "rank_by must be 'pfd_mean' or 'confidence' (confidence requires pfd_goal)"
+                    })
+                }
+            
+            if not isinstance(attributes, list) or not all(isinstance(code, str) for code in attributes):
+                return {
+                    'statusCode': 400,
+                    'headers': {
+                        'Access-Control-Allow-Origin': '*',
+                        'Content-Type': 'application/json'
+                    },
+                    'body': json.dumps({
+                        'message': 'attributes must be a list of attribute codes'
+                    })
+                }
+        
+        except (ValueError, TypeError) as e:
+            return {
+                'statusCode': 400,
+                'headers': {
+                    'Access-Control-Allow-Origin': '*',
+                    'Content-Type': 'application/json'
+                },
+                'body': json.dumps({
+                    'message': f'Invalid request body: {str(e)}'
+                })
+            }
+        
+        # JOB_ID 생성
+        import uuid
+        job_id = str(uuid.uuid4())
+        
+        print(f"Starting ECS Task for attribute importance, job_id: {job_id}")
+        print(f"BBN Input - S3 Bucket: {bbn_input_s3_bucket or 'None'}, S3 Key: {bbn_input_s3_key or 'None'}")
+        
+        # DynamoDB에 작업 상태 저장 (PENDING)
+        if JOBS_TABLE_NAME:
+            try:
+                table = dynamodb.Table(JOBS_TABLE_NAME)
+                table.put_item(
+                    Item={
+                        'jobId': job_id,
+                        'jobType': 'attribute-importance',
+                        'jobStatus': 'PENDING',
+                        'createdAt': datetime.utcnow().isoformat(),
+                        'pfdGoal': str(pfd_goal or ''),
+                        'rankBy': rank_by,
+                        'attributes': ','.join(attributes),
+                        'bbnInputBucket': bbn_input_s3_bucket or '',
+                        'bbnInputKey': bbn_input_s3_key or ''
+                    }
+                )
+                print(f"Job status saved to DynamoDB: {job_id}")
+            except Exception as e:
+                print(f"WARNING: Failed to save job status to DynamoDB: {str(e)}")
+        
+        # ECS Task 실행
+        network_config = {
+            'awsvpcConfiguration': {
+                'subnets': [s.strip() for s in SUBNET_IDS if s.strip()],
+                'assignPublicIp': 'ENABLED'
+            }
+        }
+        
+        if SECURITY_GROUP_IDS and SECURITY_GROUP_IDS != ['']:
+            network_config['awsvpcConfiguration']['securityGroups'] = [
+                sg.strip() for sg in SECURITY_GROUP_IDS if sg.strip()
+            ]
+        
+        environment_overrides = [
+            {'name': 'TASK_TYPE', 'value': 'attribute_importance'},
+            {'name': 'JOB_ID', 'value': job_id},
+            {'name': 'PFD_GOAL', 'value': str(pfd_goal)},
+            {'name': 'RANK_BY', 'value': rank_by},
+            {'name': 'IMPORTANCE_ATTRIBUTES', 'value': ','.join(attributes)},
+            {'name': 'RANDOM_SEED', 'value': str(random_seed)},
+            {'name': 'S3_BUCKET', 'value': S3_BUCKET},
+            {'name': 'AWS_REGION', 'value': AWS_REGION},
+            {'name': 'JOBS_TABLE_NAME', 'value': JOBS_TABLE_NAME or ''}
+        ]
+
+        if bbn_input_s3_key:
+            environment_overrides.append({'name': 'BBN_INPUT_PATH', 'value': bbn_input_s3_key})
+        if bbn_input_s3_bucket:
+            environment_overrides.append({'name': 'BBN_INPUT_BUCKET', 'value': bbn_input_s3_bucket})
+
+        # 워커 큐 모드: Task 환경 변수를 그대로 메시지로 전송
+        if JOBS_QUEUE_URL:
+            response = sqs_client.send_message(
+                QueueUrl=JOBS_QUEUE_URL,
+                MessageBody=json.dumps({o['name']: o['value'] for o in environment_overrides})
+            )
+            print(f"Job queued: {response['MessageId']}")
+            return {
+                'statusCode': 202,
+                'headers': {
+                    'Access-Control-Allow-Origin': '*',
+                    'Content-Type': 'application/json'
+                },
+                'body': json.dumps({
+                    'message': 'Job accepted for processing',
+                    'job_id': job_id,
+                    'message_id': response['MessageId']
+                })
+            }
+
+        response = ecs_client.run_task(
+            cluster=CLUSTER_NAME,
+            taskDefinition=TASK_DEFINITION,
+            launchType='FARGATE',
+            networkConfiguration=network_config,
+            overrides={
+                'containerOverrides': [{
+                    'name': CONTAINER_NAME,
+                    'environment': environment_overrides
+                }]
+            }
+        )
+        
+        task_arn = response['tasks'][0]['taskArn']
+        print(f"ECS Task started: {task_arn}")
+        
+        return {
+            'statusCode': 202,
+            'headers': {
+                'Access-Control-Allow-Origin': '*',
+                'Content-Type': 'application/json'
+            },
+            'body': json.dumps({
+                'message': 'Job accepted for processing',
+                'job_id': job_id,
+                'task_arn': task_arn
+            })
+        }
+        
+    except ClientError as e:
+        error_msg = f"Failed to start ECS task: {str(e)}"
+        print(f"ERROR: {error_msg}")
+        return {
+            'statusCode': 500,
+            'headers': {
+                'Access-Control-Allow-Origin': '*',
+                'Content-Type': 'application/json'
+            },
+            'body': json.dumps({
+                'message': error_msg
+            })
+        }
+    except Exception as e:
+        # 모든 예외를 잡아서 로그 출력
+        import traceback
+        error_msg = f"Unexpected error: {str(e)}"
+        print(f"ERROR: {error_msg}")
+        print(f"Traceback: {traceback.format_exc()}")
+        return {
+            'statusCode': 500,
+            'headers': {
+                'Access-Control-Allow-Origin': '*',
+                'Content-Type': 'application/json'
+            },
+            'body': json.dumps({
+                'message': f'Internal server error: {error_msg}',
+                'error_type': type(e).__name__
+            })
+        }
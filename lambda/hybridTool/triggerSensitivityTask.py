@@ -15,6 +15,7 @@ from datetime import datetime
 from botocore.exceptions import ClientError
 
 ecs_client = boto3.client('ecs', region_name=os.environ.get('AWS_REGION', 'ap-northeast-2'))
+sqs_client = boto3.client('sqs', region_name=os.environ.get('AWS_REGION', 'ap-northeast-2'))
 dynamodb = boto3.resource('dynamodb', region_name=os.environ.get('AWS_REGION', 'ap-northeast-2'))
 
 # 환경 변수
@@ -26,6 +27,7 @@ CONTAINER_NAME = os.environ.get('CONTAINER_NAME', 'hybrid-tool-container')
 S3_BUCKET = os.environ.get('S3_BUCKET')
 AWS_REGION = os.environ.get('AWS_REGION', 'ap-northeast-2')
 JOBS_TABLE_NAME = os.environ.get('JOBS_TABLE_NAME')
+JOBS_QUEUE_URL = os.environ.get('JOBS_QUEUE_URL')  # 설정 시 ECS Task 대신 워커 큐(run_worker.py)로 작업 전송
 
 
 def handler(event, context):
@@ -52,13 +54,13 @@ def handler(event, context):
     try:
         # 환경 변수 검증
         missing_vars = []
-        if not CLUSTER_NAME:
+        if not CLUSTER_NAME and not JOBS_QUEUE_URL:
             missing_vars.append('CLUSTER_NAME')
-        if not TASK_DEFINITION:
+        if not TASK_DEFINITION and not JOBS_QUEUE_URL:
             missing_vars.append('TASK_DEFINITION')
         if not S3_BUCKET:
             missing_vars.append('S3_BUCKET')
-        if not SUBNET_IDS or SUBNET_IDS == ['']:
+        if not JOBS_QUEUE_URL and (not SUBNET_IDS or SUBNET_IDS == ['']):
             missing_vars.append('SUBNET_IDS')
         
         if missing_vars:
@@ -83,6 +85,7 @@ def handler(event, context):
             pfd_goal = float(body.get('pfd_goal', 0))
             confidence_goal = float(body.get('confidence_goal', 0))
             test_mode = body.get('test_mode', False)
+            update_method = str(body.get('method', 'analytic')).lower()
             bbn_input_s3_bucket = body.get('bbn_input_s3_bucket')
             bbn_input_s3_key = body.get('bbn_input_s3_key')
             
@@ -110,6 +113,18 @@ def handler(event, context):
                         'message': 'confidence_goal must be between 0 and 1'
                     })
                 }
+            
+            if update_method not in ('analytic', 'mcmc'):
+                return {
+                    'statusCode': 400,
+                    'headers': {
+                        'Access-Control-Allow-Origin': '*',
+                        'Content-Type': 'application/json'
+                    },
+                    'body': json.dumps({
+                        'message': "method must be 'analytic' or 'mcmc'"
+                    })
+                }
         
         except (ValueError, TypeError) as e:
             return {
@@ -143,6 +158,7 @@ def handler(event, context):
                         'pfdGoal': str(pfd_goal),
                         'confidenceGoal': str(confidence_goal),
                         'testMode': str(test_mode).lower(),
+                        'updateMethod': update_method,
                         'bbnInputBucket': bbn_input_s3_bucket or '',
                         'bbnInputKey': bbn_input_s3_key or ''
                     }
@@ -172,6 +188,7 @@ def handler(event, context):
             {'name': 'S3_BUCKET', 'value': S3_BUCKET},
             {'name': 'AWS_REGION', 'value': AWS_REGION},
             {'name': 'TEST_MODE', 'value': 'true' if test_mode else 'false'},
+            {'name': 'UPDATE_METHOD', 'value': update_method},
             {'name': 'JOBS_TABLE_NAME', 'value': JOBS_TABLE_NAME or ''}
         ]
 
@@ -180,6 +197,26 @@ def handler(event, context):
         if bbn_input_s3_bucket:
             environment_overrides.append({'name': 'BBN_INPUT_BUCKET', 'value': bbn_input_s3_bucket})
 
+        # 워커 큐 모드: Task 환경 변수를 그대로 메시지로 전송
+        if JOBS_QUEUE_URL:
+            response = sqs_client.send_message(
+                QueueUrl=JOBS_QUEUE_URL,
+                MessageBody=json.dumps({o['name']: o['value'] for o in environment_overrides})
+            )
+            print(f"Job queued: {response['MessageId']}")
+            return {
+                'statusCode': 202,
+                'headers': {
+                    'Access-Control-Allow-Origin': '*',
+                    'Content-Type': 'application/json'
+                },
+                'body': json.dumps({
+                    'message': 'Job accepted for processing',
+                    'job_id': job_id,
+                    'message_id': response['MessageId']
+                })
+            }
+
         response = ecs_client.run_task(
             cluster=CLUSTER_NAME,
             taskDefinition=TASK_DEFINITION,
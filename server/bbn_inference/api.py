@@ -1,25 +1,46 @@
 # server/bbn_inference/api.py
 
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import FileResponse
-from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from fastapi.responses import FileResponse, StreamingResponse
+from pydantic import BaseModel, Field, model_validator
+from typing import Optional, Dict, Any, List, Literal
 from datetime import datetime
-import os, json, uuid
-
-from bbn_inference.sensitivity_analysis import (
-    get_number_of_required_demand,
-    filter_outsiders,
-    get_confidence,
-    demand_model_func,
+import json
+import os
+
+# PyMC / PyTensor / ArviZ / SciPy는 import 시점에 불러오지 않음 (서버 시작과 /auth, /content 라우트가 기다리지 않도록)
+# 작업 함수가 처음 실행될 때 import되며, API_WARMUP=true면 시작 직후 백그라운드에서 미리 import (warm_up)
+from bbn_inference.jobs import (
+    JobManager,
+    build_trace_entry,
+    init_trace_job,
+    sensitivity_analysis_job,
+    update_pfd_job,
+    full_analysis_job,
+    full_analysis_events,
+    attribute_importance_job,
+    warm_up_inference,
+    default_max_workers,
+    COMPLETED,
+    FAILED,
 )
-from bbn_inference.examples.example_for_composite_model import run_example_for_composite_model
-from bbn_inference.bbn_utils import run_sampling
+from bbn_inference.instrumentation import span
+from bbn_inference.errors import UnreachableGoalError
+from bbn_inference.trace_cache import TraceCache, TraceEntry, default_max_entries, default_max_bytes, default_ttl_seconds
 from bbn_inference.data import bayesian_data_from_json
 from bbn_inference.bbn_data_model import BayesianData
+from bbn_inference.scenario_defaults import default_scenario_draws, max_scenarios
 
 router = APIRouter()
 
+def warm_up():
+    # main.py의 lifespan에서 API_WARMUP=true일 때 백그라운드 스레드로 호출
+    try:
+        warm_up_inference()
+        print("[WARMUP] Inference modules imported")
+    except Exception as e:
+        print(f"[WARMUP] Failed to import inference modules: {e}")
+
 # ---------------- 저장 경로 ----------------
 # (참고) main.py에서 StaticFiles로 /result_json 마운트해도 되지만,
 #       실제 다운로드는 /api/download 엔드포인트를 쓰면 attachment로 떨어집니다.
@@ -27,61 +48,115 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))                  # server/
 RESULT_DIR = os.path.join(os.path.dirname(BASE_DIR), "result_json")    # server/result_json
 os.makedirs(RESULT_DIR, exist_ok=True)
 
-# ---------------- Trace 캐시 (개발용 간단 캐시) ----------------
-_TRACE_CACHE: Dict[str, Dict[str, Any]] = {}
-
-def _build_and_cache_trace() -> str:
-    trace = run_example_for_composite_model()
-    trace_id = str(uuid.uuid4())
-    _TRACE_CACHE[trace_id] = {
-        "trace": trace,
-        "filtered_pfd_trace": filter_outsiders(trace.posterior["PFD"]),
-        "prior_mean": trace.posterior["PFD"].mean().item(),
-        "prior_conf_getter": lambda pfd_goal: get_confidence(
-            data=trace.posterior["PFD"], goal=pfd_goal
-        ),
-    }
-    print(f"[TRACE] New trace created: trace_id={trace_id}")
-    return trace_id
-
-def _get_trace(trace_id: Optional[str]):
-    if trace_id and trace_id in _TRACE_CACHE:
-        return _TRACE_CACHE[trace_id]["trace"], _TRACE_CACHE[trace_id]
-    new_id = _build_and_cache_trace()
-    return _TRACE_CACHE[new_id]["trace"], _TRACE_CACHE[new_id]
+# ---------------- Trace 캐시 ----------------
+# trace 전체(InferenceData) 대신 필요한 배열(필터링된 PFD, 정렬된 PFD, prior mean)만 보관
+# 항목 수 / 메모리 / TTL 제한, LRU 삭제 (환경 변수로 조정)
+_TRACE_CACHE = TraceCache(
+    max_entries=int(os.environ.get("API_TRACE_CACHE_MAX_ENTRIES", default_max_entries)),
+    max_bytes=int(os.environ.get("API_TRACE_CACHE_MAX_BYTES", default_max_bytes)),
+    ttl_seconds=float(os.environ.get("API_TRACE_CACHE_TTL_SECONDS", default_ttl_seconds)) or None,
+)
+
+def _build_and_cache_trace() -> TraceEntry:
+    entry = _TRACE_CACHE.add(build_trace_entry())
+    print(f"[TRACE] New trace created: trace_id={entry.trace_id}")
+    return entry
+
+def _get_trace(trace_id: Optional[str]) -> TraceEntry:
+    entry = _TRACE_CACHE.get(trace_id)
+    if entry is not None:
+        return entry
+    return _build_and_cache_trace()
+
+# ---------------- 비동기 작업 (Lambda/ECS/DynamoDB 흐름의 로컬 버전) ----------------
+# 재사용되는 작업 프로세스 풀에서 실행 (import / 모델 컴파일은 프로세스당 한 번), 프로세스 수는 API_JOB_MAX_WORKERS로 제한
+_JOB_MANAGER = JobManager(
+    _TRACE_CACHE, RESULT_DIR,
+    max_workers=int(os.environ.get("API_JOB_MAX_WORKERS", default_max_workers)),
+)
 
 # ---------------- 입력 스키마 ----------------
 class InitTraceOutput(BaseModel):
     trace_id: str
 
+# method=mcmc의 적응형 샘플링 목표 (bbn_utils.default_sampling_targets와 같은 기본값), null인 목표는 검사하지 않음
+class AdaptiveSamplingInput(BaseModel):
+    ess: Optional[float] = Field(400, gt=0, description="최소 bulk ESS")
+    rhat: Optional[float] = Field(1.01, gt=1, description="최대 R-hat (2개 이상의 chain 필요)")
+    mcse_confidence: Optional[float] = Field(0.005, gt=0, description="목표 PFD 신뢰도의 최대 Monte Carlo 표준오차")
+    increment: int = Field(1000, ge=100, description="추가 배치당 draws")
+    tune_increment: Optional[int] = Field(None, ge=0, description="추가 배치당 재튜닝 step 수 (생략 시 첫 실행의 tune)")
+    max_draws: int = Field(20000, ge=1000, le=200000, description="chain당 최대 draws")
+    chains: Optional[int] = Field(None, ge=1, le=8, description="chain 수 (생략 시 rhat 목표가 있으면 2, 없으면 1)")
+
+    @model_validator(mode="after")
+    def check_rhat_chains(self):
+        # chain이 하나면 R-hat이 정의되지 않아 목표로 쓸 수 없음
+        if self.rhat is not None and self.chains is not None and self.chains < 2:
+            raise ValueError("the R-hat target needs at least 2 chains; set chains >= 2 or rhat to null")
+        return self
+
+adaptive_description = "method=mcmc에서 목표(ESS/R-hat/신뢰도 MCSE)를 만족할 때까지 배치를 추가 샘플링 (생략 시 고정 draws/tune)"
+
 class SensitivityInput(BaseModel):
     pfd_goal: float = Field(..., gt=0, description="목표 PFD (예: 1e-4)")
     confidence_goal: float = Field(..., gt=0, lt=1, description="목표 신뢰도 (예: 0.95)")
     trace_id: Optional[str] = Field(None, description="재사용할 trace_id (선택)")
+    method: Literal["analytic", "mcmc"] = Field("analytic", description="demand 업데이트 방식 (analytic: 가중치 계산, mcmc: 샘플링 교차검증)")
+    search: Literal["bisect", "linear"] = Field("bisect", description="필요 시험 수 탐색 방식 (bisect: 구간 이분 탐색, 상한 없음 / linear: 기존 25000까지 선형 탐색)")
+    tolerance: int = Field(10, ge=1, description="bisect 탐색의 허용 오차 (demand 단위)")
+    adaptive: Optional[AdaptiveSamplingInput] = Field(None, description=adaptive_description)
 
 class UpdatePFDInput(BaseModel):
     pfd_goal: float = Field(..., gt=0, description="목표 PFD")
     demand: int = Field(..., gt=0, description="시험 횟수(테스트 수)")
     failures: int = Field(..., ge=0, description="관측된 실패 수")
     trace_id: Optional[str] = Field(None, description="재사용할 trace_id (선택)")
+    method: Literal["analytic", "mcmc"] = Field("analytic", description="demand 업데이트 방식 (analytic: 가중치 계산, mcmc: 샘플링 교차검증)")
+    histogram_bins: int = Field(100, gt=0, description="응답에 포함할 업데이트된 PFD 히스토그램 bin 수")
+    adaptive: Optional[AdaptiveSamplingInput] = Field(None, description=adaptive_description)
 
 class FullAnalysisInput(BaseModel):
-    pfd_goal: float
-    confidence_goal: float
-    failures: int
+    pfd_goal: float = Field(..., gt=0, description="목표 PFD (예: 1e-4)")
+    confidence_goal: float = Field(..., gt=0, lt=1, description="목표 신뢰도 (예: 0.95)")
+    failures: int = Field(..., ge=0, description="관측된 실패 수")
     trace_id: Optional[str] = Field(None, description="재사용할 trace_id (선택)")
+    method: Literal["analytic", "mcmc"] = Field("analytic", description="demand 업데이트 방식 (analytic: 가중치 계산, mcmc: 샘플링 교차검증)")
+    search: Literal["bisect", "linear"] = Field("bisect", description="필요 시험 수 탐색 방식 (bisect: 구간 이분 탐색, 상한 없음 / linear: 기존 25000까지 선형 탐색)")
+    tolerance: int = Field(10, ge=1, description="bisect 탐색의 허용 오차 (demand 단위)")
+    adaptive: Optional[AdaptiveSamplingInput] = Field(None, description=adaptive_description)
+    step: int = Field(500, gt=0, description="PFD 곡선의 demand 간격 (analytic에서는 촘촘한 간격도 비용 차이 없음)")
 
 class InputJsonPayload(BaseModel):
     input: Dict[str, Any]
 
+class ScenarioItem(BaseModel):
+    label: Optional[str] = Field(None, description="시나리오 이름 (선택)")
+    input: Dict[str, Any] = Field(..., description="/bbn/parse-input과 같은 입력 JSON")
+
+class ScenariosInput(BaseModel):
+    scenarios: List[ScenarioItem] = Field(..., min_length=1, max_length=max_scenarios)
+    pfd_goal: Optional[float] = Field(None, gt=0, description="신뢰도를 계산할 목표 PFD (선택)")
+    confidence_goal: Optional[float] = Field(None, gt=0, lt=1, description="목표 신뢰도, pfd_goal과 함께 주면 필요 시험 수도 계산")
+    draws: int = Field(default_scenario_draws, ge=1000, le=200000, description="시나리오당 forward 샘플 수")
+    random_seed: Optional[int] = Field(None, description="같은 seed면 같은 결과 (선택)")
+
+class ImportanceInput(BaseModel):
+    input: Dict[str, Any] = Field(..., description="기준 입력 JSON (/bbn/parse-input과 같은 형식)")
+    pfd_goal: Optional[float] = Field(None, gt=0, description="신뢰도를 계산할 목표 PFD (선택)")
+    attributes: Optional[List[str]] = Field(None, description="평가할 속성 코드 (예: SR_SDP), 생략 시 전체")
+    rank_by: Literal["pfd_mean", "confidence"] = Field("pfd_mean", description="정렬 기준 (confidence는 pfd_goal 필요)")
+    draws: int = Field(default_scenario_draws, ge=1000, le=200000, description="변형당 forward 샘플 수")
+    random_seed: int = Field(0, description="같은 seed면 같은 결과, 기준 입력 캐시 키에 포함")
+
 # ---------------- 0) trace 초기화 ----------------
 @router.post("/init-trace")
 def init_trace() -> Dict[str, Any]:
     try:
-        trace_id = _build_and_cache_trace()
-        prior_mean = _TRACE_CACHE[trace_id]["prior_mean"]
-        print(f"[INIT] trace_id={trace_id}, prior_mean={prior_mean}")
-        return {"message": "Trace initialized", "trace_id": trace_id, "prior_mean": prior_mean}
+        with span("api.init-trace"):
+            entry = _build_and_cache_trace()
+            data = init_trace_job({}, entry, RESULT_DIR)
+        return {"message": "Trace initialized", "trace_id": entry.trace_id, "prior_mean": data["prior_mean"]}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Init trace failed: {e}")
 
@@ -89,34 +164,17 @@ def init_trace() -> Dict[str, Any]:
 @router.post("/sensitivity-analysis")
 def sensitivity_analysis(input: SensitivityInput):
     try:
-        trace, ctx = _get_trace(input.trace_id)
-        num_tests = get_number_of_required_demand(
-            trace, pfd_goal=input.pfd_goal, confidence_goal=input.confidence_goal
-        )
-        prior_mean = ctx["prior_mean"]
-        prior_conf = ctx["prior_conf_getter"](input.pfd_goal)
-
-        print(f"[SENS] trace_id={input.trace_id or 'new'}")
-        print(f"[SENS] PFD goal: {input.pfd_goal}, Confidence goal: {input.confidence_goal}")
-        print(f"[SENS] Prior PFD mean: {prior_mean}")
-        print(f"[SENS] Required number of tests: {int(num_tests)}")
-        print(f"[SENS] Prior confidence @goal: {prior_conf}")
-
-        ensured_id = None
-        for k, v in _TRACE_CACHE.items():
-            if v["trace"] is trace:
-                ensured_id = k
-                break
-
+        with span("api.sensitivity-analysis"):
+            entry = _get_trace(input.trace_id)
+            data = sensitivity_analysis_job(input.model_dump(), entry, RESULT_DIR)
         return {
             "message": "Sensitivity analysis complete",
-            "trace_id": ensured_id,
-            "data": {
-                "num_tests": int(num_tests),
-                "prior_mean": prior_mean,
-                "prior_confidence": prior_conf,
-            },
+            "trace_id": entry.trace_id,
+            "data": data,
         }
+    except UnreachableGoalError as e:
+        # 도달할 수 없는 목표 (PFD 목표가 모든 prior 샘플보다 작음, 신뢰도 목표 미달), 그 외 ValueError는 500
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Sensitivity analysis failed: {e}")
 
@@ -127,45 +185,13 @@ def update_pfd(input: UpdatePFDInput):
         if input.failures > input.demand:
             raise HTTPException(status_code=400, detail="failures cannot exceed demand")
 
-        trace, ctx = _get_trace(input.trace_id)
-        filtered_pfd_trace = ctx["filtered_pfd_trace"]
-
-        model = demand_model_func(
-            demand=input.demand,
-            observed_failures=input.failures,
-            pfd_trace=filtered_pfd_trace,
-        )
-        updated_trace = run_sampling(model, draws=2000, tune=500)
-
-        prior_mean = ctx["prior_mean"]
-        updated_pfd_mean = updated_trace.posterior["pfd_prior"].mean().item()
-        before_conf = ctx["prior_conf_getter"](input.pfd_goal)
-        updated_conf = get_confidence(
-            data=updated_trace.posterior["pfd_prior"], goal=input.pfd_goal
-        )
-
-        print(f"[UPD] trace_id={input.trace_id or 'new'}")
-        print(f"[UPD] Mean of prior PFD: {prior_mean}")
-        print(f"[UPD] Mean of updated PFD: {updated_pfd_mean}")
-        print(f"[UPD] PFD goal: {input.pfd_goal}")
-        print(f"[UPD] Before testing, confidence level: {before_conf}")
-        print(f"[UPD] Testing results: #test cases: {input.demand}, #failures: {input.failures}")
-        print(f"[UPD] After testing, confidence level: {updated_conf}")
-
-        ensured_id = None
-        for k, v in _TRACE_CACHE.items():
-            if v["trace"] is trace:
-                ensured_id = k
-                break
-
+        with span("api.update-pfd"):
+            entry = _get_trace(input.trace_id)
+            data = update_pfd_job(input.model_dump(), entry, RESULT_DIR)
         return {
             "message": "PFD updated",
-            "trace_id": ensured_id,
-            "data": {
-                "updated_pfd": updated_pfd_mean,
-                "updated_confidence": updated_conf,
-                "prior_confidence": before_conf,
-            },
+            "trace_id": entry.trace_id,
+            "data": data,
         }
     except HTTPException:
         raise
@@ -176,81 +202,158 @@ def update_pfd(input: UpdatePFDInput):
 @router.post("/full-analysis")
 def run_full_analysis(input: FullAnalysisInput):
     try:
-        pfd_goal = input.pfd_goal
-        confidence_goal = input.confidence_goal
-        failures = input.failures
-
-        trace, ctx = _get_trace(input.trace_id)
-
-        demand_required = get_number_of_required_demand(
-            trace, pfd_goal=pfd_goal, confidence_goal=confidence_goal
-        )
-
-        filtered_pfd_trace = ctx["filtered_pfd_trace"]
-        prior_mean = ctx["prior_mean"]
-        prior_conf = ctx["prior_conf_getter"](pfd_goal)
-
-        demand_list = list(range(500, int(demand_required) + 500, 500))
-        pfd_output, last_conf = [], None
-
-        print(f"[FULL] trace_id={input.trace_id or 'new'}")
-        print(f"[FULL] Required number of tests: {int(demand_required)}")
-        print(f"[FULL] Prior mean: {prior_mean}, Prior confidence @goal: {prior_conf}")
-
-        for demand in demand_list:
-            model = demand_model_func(
-                demand=demand, observed_failures=failures, pfd_trace=filtered_pfd_trace
-            )
-            updated_trace = run_sampling(model, draws=2000, tune=500)
-            updated_mean = updated_trace.posterior["pfd_prior"].mean().item()
-            last_conf = get_confidence(
-                data=updated_trace.posterior["pfd_prior"], goal=pfd_goal
-            )
-            pfd_output.append([str(demand), updated_mean])
-            print(f"[FULL] Demand={demand} → PFD={updated_mean}, Confidence={last_conf}")
-
-        result_json = {
-            "input": {
-                "parameter": {
-                    "test_count": int(demand_required),
-                    "target": pfd_goal,
-                    "prior": {
-                        "distribution": "trace",
-                        "mean": prior_mean,
-                        "confidence": prior_conf,
-                    },
-                    "observed_failures": failures,
-                }
-            },
-            "output": {"pfd": pfd_output, "confidence": last_conf},
+        with span("api.full-analysis"):
+            entry = _get_trace(input.trace_id)
+            data = full_analysis_job(input.model_dump(), entry, RESULT_DIR)
+        return {
+            "message": "Analysis complete",
+            "trace_id": entry.trace_id,
+            **data,
         }
+    except UnreachableGoalError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Full analysis failed: {e}")
 
-        # 고유 파일명으로 저장 (서버 내부 파일명)
-        public_name = f"{uuid.uuid4()}.json"
-        filepath = os.path.join(RESULT_DIR, public_name)
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(result_json, f, indent=2)
-
-        ensured_id = None
-        for k, v in _TRACE_CACHE.items():
-            if v["trace"] is trace:
-                ensured_id = k
-                break
+# ---------------- 3-1) 전체 분석 스트리밍 ----------------
+# /full-analysis와 같은 입력, demand 점이 계산될 때마다 한 줄씩 전송 (format=ndjson 기본값, format=sse: text/event-stream)
+# 이벤트: start (필요 시험 수, prior, 점 개수) → point ([demand, updated mean, confidence]) ... → result (/full-analysis 응답과 같은 필드)
+# 실패 시 error 이벤트로 끝남. 클라이언트가 연결을 끊으면 남은 점은 계산하지 않고 결과 파일도 저장하지 않음
+stream_media_types = {"ndjson": "application/x-ndjson", "sse": "text/event-stream"}
 
-        print(f"[FULL] Saved result to {filepath}")
+def _format_stream_event(event: Dict[str, Any], format: str) -> str:
+    payload = json.dumps(event, default=float)
+    if format == "sse":
+        return f"event: {event['type']}\ndata: {payload}\n\n"
+    return payload + "\n"
 
-        # 브라우저에서 바로 다운로드되는 엔드포인트 반환
-        download_url = f"/api/download/{public_name}"
+def _full_analysis_stream(input: FullAnalysisInput, format: str):
+    try:
+        entry = _get_trace(input.trace_id)
+        for event in full_analysis_events(input.model_dump(), entry, RESULT_DIR):
+            if event["type"] == "result":
+                event = {**event, "message": "Analysis complete"}
+            yield _format_stream_event(event, format)
+    except Exception as e:
+        yield _format_stream_event({"type": "error", "detail": f"Full analysis failed: {e}"}, format)
+
+@router.post("/full-analysis/stream")
+def run_full_analysis_stream(input: FullAnalysisInput, format: Literal["ndjson", "sse"] = "ndjson"):
+    return StreamingResponse(
+        _full_analysis_stream(input, format),
+        media_type=stream_media_types[format],
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},  # 프록시 버퍼링 방지
+    )
 
-        return {
-            "message": "Analysis complete",
-            "trace_id": ensured_id,
-            "filepath": filepath,          # 서버 내부 경로(로그용)
-            "download_url": download_url,  # 프론트는 이 URL을 사용
-            "result": result_json,
-        }
+# ---------------- 4) What-if 시나리오 일괄 평가 ----------------
+# 여러 입력(속성 상태, function point)을 한 번에 평가: generic artifact와 난수를 공유하는 forward 샘플링,
+# NUTS 없이 시나리오별 PFD 평균/분위수/목표 PFD 신뢰도(/필요 시험 수)를 반환
+@router.post("/scenarios")
+def run_scenarios(input: ScenariosInput):
+    try:
+        scenarios = [bayesian_data_from_json(item.input) for item in input.scenarios]
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Full analysis failed: {e}")
+        raise HTTPException(status_code=400, detail=f"Failed to parse scenario input: {e}")
+    try:
+        from bbn_inference.scenarios import evaluate_scenarios
+
+        with span("api.scenarios", scenarios=len(scenarios)):
+            data = evaluate_scenarios(
+                scenarios,
+                labels=[item.label for item in input.scenarios],
+                pfd_goal=input.pfd_goal,
+                confidence_goal=input.confidence_goal,
+                draws=input.draws,
+                random_seed=input.random_seed,
+            )
+        return {"message": "Scenarios evaluated", **data}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Scenario evaluation failed: {e}")
+
+# ---------------- 5) 속성 중요도 (tornado) ----------------
+# 기준 입력의 속성을 하나씩 다른 상태(High/Medium/Low)로 바꿨을 때의 PFD 평균/신뢰도 변화, 변화 폭 순으로 정렬
+# 속성이 속한 submodel만 다시 계산하고 기준 입력의 샘플은 프로세스 안에 캐시 (같은 입력/seed 재요청 시 빠름)
+@router.post("/attribute-importance")
+def run_attribute_importance(input: ImportanceInput):
+    if input.rank_by == "confidence" and input.pfd_goal is None:
+        raise HTTPException(status_code=400, detail="rank_by=confidence requires pfd_goal")
+    try:
+        with span("api.attribute-importance"):
+            data = attribute_importance_job(input.model_dump(), None, RESULT_DIR)
+        return {"message": "Attribute importance complete", **data}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Attribute importance failed: {e}")
+
+# ---------------- 비동기 작업 제출/조회/취소 ----------------
+# POST /api/jobs/{job_type}: 위 엔드포인트와 같은 입력, 즉시 jobId 반환 (PENDING)
+# GET /api/jobs/{job_id}: 상태 (PENDING | RUNNING | COMPLETED | FAILED), getJobStatus와 같은 필드
+# GET /api/jobs/{job_id}/result: 완료된 작업의 결과 (동기 엔드포인트 응답과 같은 trace_id / data)
+# DELETE /api/jobs/{job_id}: 대기 중이거나 실행 중인 작업 취소 (FAILED, errorMessage="Cancelled")
+def _submit_job(job_type: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    job_id = _JOB_MANAGER.submit(job_type, params)
+    print(f"[JOB] Submitted {job_type}: job_id={job_id}")
+    return {"message": "Job accepted for processing", "job_id": job_id, **_JOB_MANAGER.status(job_id)}
+
+@router.post("/jobs/init-trace", status_code=202)
+def submit_init_trace():
+    return _submit_job("init-trace", {})
+
+@router.post("/jobs/sensitivity-analysis", status_code=202)
+def submit_sensitivity_analysis(input: SensitivityInput):
+    return _submit_job("sensitivity-analysis", input.model_dump())
+
+@router.post("/jobs/update-pfd", status_code=202)
+def submit_update_pfd(input: UpdatePFDInput):
+    if input.failures > input.demand:
+        raise HTTPException(status_code=400, detail="failures cannot exceed demand")
+    return _submit_job("update-pfd", input.model_dump())
+
+@router.post("/jobs/full-analysis", status_code=202)
+def submit_full_analysis(input: FullAnalysisInput):
+    return _submit_job("full-analysis", input.model_dump())
+
+@router.post("/jobs/attribute-importance", status_code=202)
+def submit_attribute_importance(input: ImportanceInput):
+    if input.rank_by == "confidence" and input.pfd_goal is None:
+        raise HTTPException(status_code=400, detail="rank_by=confidence requires pfd_goal")
+    return _submit_job("attribute-importance", input.model_dump())
+
+@router.get("/jobs")
+def list_jobs():
+    return {"jobs": _JOB_MANAGER.list()}
+
+@router.get("/jobs/{job_id}")
+def get_job_status(job_id: str):
+    status = _JOB_MANAGER.status(job_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return status
+
+@router.get("/jobs/{job_id}/result")
+def get_job_result(job_id: str):
+    record = _JOB_MANAGER.result(job_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    if record["jobStatus"] == FAILED:
+        raise HTTPException(status_code=409, detail=f"Job failed: {record.get('errorMessage', '')}")
+    if record["jobStatus"] != COMPLETED:
+        raise HTTPException(status_code=409, detail=f"Job not finished: {record['jobStatus']}")
+    return {"jobId": job_id, "jobType": record["jobType"], "jobStatus": record["jobStatus"], **record["result"]}
+
+@router.delete("/jobs/{job_id}")
+def cancel_job(job_id: str):
+    if _JOB_MANAGER.status(job_id) is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    if not _JOB_MANAGER.cancel(job_id):
+        raise HTTPException(status_code=409, detail="Job already finished")
+    return {"message": "Job cancelled", **_JOB_MANAGER.status(job_id)}
+
+# ---------------- Trace 캐시 상태 ----------------
+@router.get("/trace-cache/stats")
+def trace_cache_stats() -> Dict[str, Any]:
+    return _TRACE_CACHE.stats()
 
 # ---------------- 4) 다운로드 전용 엔드포인트 ----------------
 @router.get("/download/{file_name}")
@@ -0,0 +1,106 @@
+import multiprocessing as mp
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import arviz as az
+import numpy as np
+from scipy import stats
+
+from . import bbn_parameter
+from .bbn_parameter import attribute_submodels
+from .instrumentation import span
+
+levels = ("H", "M", "L")
+
+# forward draws per submodel; the MCMC runs used 1000, the means here are far tighter
+default_draws = 20000
+
+def attribute_npt_params(name, attr_states):
+    """
+    mu/sigma of every TruncatedNormal of a submodel for the given attribute states.
+    Returns two (3, n_attributes) arrays, rows ordered H/M/L.
+    """
+    spec = attribute_submodels[name]
+    mu = np.empty((len(levels), len(spec["attributes"])))
+    sigma = np.empty_like(mu)
+    for j, code in enumerate(spec["attributes"]):
+        state = attr_states[f"{code}_state"]
+        for i, level in enumerate(levels):
+            mu[i, j], sigma[i, j] = getattr(bbn_parameter, f"{code}_{spec['kind']}{level}_npt")[state]
+    return mu, sigma
+
+def sample_attribute_submodel(name, attr_states, draws=default_draws, rng=None):
+    """
+    Forward (Monte Carlo) sampling of one Dev/VV attribute submodel in NumPy.
+    The submodels have no observed data, so their posterior is the joint prior:
+    Beta priors for H/M/L times independent TruncatedNormal(0, 1) attribute factors,
+    normalized by k = 1 / (m1 + m2 + m3). Returns {"<phase>_<kind>H_post": draws, ...}.
+    """
+    rng = np.random.default_rng(rng)
+    spec = attribute_submodels[name]
+    mu, sigma = attribute_npt_params(name, attr_states)
+
+    alpha, beta = np.asarray(spec["priors"], dtype=np.float64).T
+    prior = rng.beta(alpha, beta, size=(draws, len(levels)))
+    like = stats.truncnorm.rvs((0 - mu) / sigma, (1 - mu) / sigma, loc=mu, scale=sigma,
+                               size=(draws,) + mu.shape, random_state=rng)
+    m = prior * np.prod(like, axis=-1)
+    post = m / m.sum(axis=-1, keepdims=True)
+
+    phase = name.split("_")[0]
+    return {f"{phase}_{spec['kind']}{level}_post": post[:, i] for i, level in enumerate(levels)}
+
+def attribute_submodel_trace(name, attr_states, draws=default_draws, rng=None):
+    # InferenceData with the same *_post variables as run_sampling(create_<name>_model(...)), so
+    # create_composite_model can consume it unchanged
+    samples = sample_attribute_submodel(name, attr_states, draws=draws, rng=rng)
+    return az.from_dict(posterior={var: values[None, :] for var, values in samples.items()})
+
+def attribute_submodel_means(name, attr_states, draws=default_draws, rng=None):
+    # normalized posterior means (H, M, L), the only quantity create_composite_model uses
+    samples = sample_attribute_submodel(name, attr_states, draws=draws, rng=rng)
+    means = np.array([values.mean() for values in samples.values()])
+    return tuple(float(m) for m in means / means.sum())
+
+def submodel_seeds(random_seed=None):
+    # one child SeedSequence per submodel, fixed by the order of attribute_submodels,
+    # so results do not depend on evaluation order or on the number of workers
+    seeds = np.random.SeedSequence(random_seed).spawn(len(attribute_submodels))
+    return dict(zip(attribute_submodels, seeds))
+
+def attribute_submodel_traces(attr_states, draws=default_draws, random_seed=None):
+    traces = {}
+    for name, seed in submodel_seeds(random_seed).items():
+        with span("submodel", submodel=name, method="analytic", draws=draws):
+            traces[name] = attribute_submodel_trace(name, attr_states, draws=draws, rng=np.random.default_rng(seed))
+    return traces
+
+def sample_attribute_submodel_mcmc(name, attr_states, random_seed, adaptive=None):
+    # NUTS (numpyro) run of create_<name>_model; top level so it can run in a worker process
+    # adaptive: sampling targets (see bbn_utils.default_sampling_targets), so easy submodels stop early
+    from . import composite_model
+    from .bbn_utils import run_sampling
+
+    with span("submodel", submodel=name, method="mcmc"):
+        model = getattr(composite_model, f"create_{name}_model")(attr_states)
+        return run_sampling(model, True, random_seed=random_seed, adaptive=adaptive)
+
+def default_submodel_workers():
+    return max(1, min(len(attribute_submodels), os.cpu_count() or 1))
+
+def attribute_submodel_traces_mcmc(attr_states, workers=None, random_seed=None, adaptive=None):
+    """
+    NUTS traces of the ten submodels. The models share no variables, so with workers > 1 they
+    are sampled concurrently in a process pool (spawn: JAX is not fork-safe).
+    Each model gets its own seed from submodel_seeds, so the traces are the same for any worker count.
+    """
+    workers = workers or default_submodel_workers()
+    seeds = {name: int(seed.generate_state(1)[0]) for name, seed in submodel_seeds(random_seed).items()}
+    if workers == 1:
+        return {name: sample_attribute_submodel_mcmc(name, attr_states, seed, adaptive) for name, seed in seeds.items()}
+
+    attr_states = dict(attr_states)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context("spawn")) as pool:
+        futures = {name: pool.submit(sample_attribute_submodel_mcmc, name, attr_states, seed, adaptive)
+                   for name, seed in seeds.items()}
+        return {name: future.result() for name, future in futures.items()}
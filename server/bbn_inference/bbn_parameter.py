@@ -58,7 +58,7 @@ SR_RaA_DevL_npt = [[0.132, 0.137], [0.296, 0.122], [0.572, 0.201]]
 # Dimension: row, col
 # row represents attribute states (H/M/L), column represents mu and sigma
 SR_SVVP_VVH_npt = [[0.750, 0.122], [0.208, 0.102], [0.042, 0.038]]
-SR_SVVP_VVM_npt = [[0.179, 0.057], [0.643, 0.113], [0.179], [0.099]]
+SR_SVVP_VVM_npt = [[0.179, 0.057], [0.643, 0.113], [0.179, 0.099]]
 SR_SVVP_VVL_npt = [[0.075, 0.069], [0.242, 0.092], [0.683, 0.133]]
 
 SR_CDE_VVH_npt = [[0.692, 0.102], [0.267, 0.082], [0.042, 0.020]]
@@ -634,3 +634,80 @@ IC_VVL_DDP_current_npt = [[2.205, 3.069], [2.934, 3.080], [4.015, 3.324]]
 IC_VVH_DDP_previous_npt = [[3.2360, 1.7659], [6.2600, 1.5622], [13.8766, 1.4457]]
 IC_VVM_DDP_previous_npt = [[1.6810, 1.5003], [2.2365, 1.3126], [3.1949, 1.3703]]
 IC_VVL_DDP_previous_npt = [[0.8258, 1.3336], [0.8505, 1.0864], [0.9799, 1.0904]]
+
+### Attribute submodel structure
+# Dev/V&V attribute submodels of each phase, built by model_builder.attribute_block (create_*_Dev_model / create_*_VV_model in composite_model.py)
+# priors: Beta(alpha, beta) priors of the quality state H/M/L
+# attributes: attribute codes, node probability tables are <code>_<kind><H/M/L>_npt and the state is attr_states["<code>_state"]
+attribute_submodels = {
+    "SR_Dev": {
+        "kind": "Dev",
+        "priors": [[4.42, 22.04], [4.47, 2.73], [1.25, 4.49]],
+        "attributes": ["SR_SDP", "SR_CD", "SR_SRS", "SR_TA", "SR_CA", "SR_HA", "SR_SA", "SR_RA", "SR_SQTPG", "SR_SATPG", "SR_CM", "SR_RaA"],
+    },
+    "SR_VV": {
+        "kind": "VV",
+        "priors": [[0.67, 3.23], [3.21, 2.21], [2.10, 7.19]],
+        "attributes": ["SR_SVVP", "SR_CDE", "SR_HRAA", "SR_SRE", "SR_IAVV", "SR_TAVV", "SR_CAVV", "SR_HAVV", "SR_SAVV", "SR_RAVV", "SR_VVSQTPG", "SR_VVSATPG", "SR_CMA", "SR_RaAVV", "SR_VVASRG"],
+    },
+    "SD_Dev": {
+        "kind": "Dev",
+        "priors": [[0.56, 1.74], [2.40, 1.81], [4.12, 22.06]],
+        "attributes": ["SD_SAD", "SD_SDD", "SD_TA", "SD_CA", "SD_HA", "SD_SA", "SD_RA", "SD_SCTPG", "SD_SITPG", "SD_SCTDG", "SD_SITDG", "SD_SQTDG", "SD_SATDG", "SD_CM", "SD_RaA"],
+    },
+    "SD_VV": {
+        "kind": "VV",
+        "priors": [[0.56, 1.74], [2.40, 1.81], [4.12, 22.06]],
+        "attributes": ["SD_DE", "SD_IAVV", "SD_TAVV", "SD_CAVV", "SD_HAVV", "SD_SAVV", "SD_RAVV", "SD_VVSCTPG", "SD_VVSITPG", "SD_VVSCTDG", "SD_VVSITDG", "SD_VVSQTDG", "SD_VVSATDG", "SD_CMVV", "SD_RaAVV", "SD_VVASRG"],
+    },
+    "IM_Dev": {
+        "kind": "Dev",
+        "priors": [[0.47, 1.14], [1.70, 1.56], [2.82, 15.00]],
+        "attributes": ["IM_SCaSCDG", "IM_TA", "IM_CA", "IM_HA", "IM_SA", "IM_RA", "IM_CTCG", "IM_SITCG", "IM_SQTCG", "IM_SATCG", "IM_SCTPG", "IM_SITPG", "IM_SQTPG", "IM_CM", "IM_RaA", "IM_SCTE"],
+    },
+    "IM_VV": {
+        "kind": "VV",
+        "priors": [[0.49, 1.27], [2.12, 1.82], [1.90, 9.90]],
+        "attributes": ["IM_SCaSCDE", "IM_IAVV", "IM_TAVV", "IM_CAVV", "IM_HAVV", "IM_SAVV", "IM_RAVV", "IM_VVSCTCG", "IM_VVSITCG", "IM_VVSQTCG", "IM_VVSATCG", "IM_VVSCTPG", "IM_VVSITPG", "IM_VVSQTPG", "IM_VVSCTE", "IM_CMVV", "IM_RaAVV", "IM_VVASRG"],
+    },
+    "ST_Dev": {
+        "kind": "Dev",
+        "priors": [[0.45, 1.29], [1.75, 1.19], [0.83, 5.42]],
+        "attributes": ["ST_SITE", "ST_SQTE", "ST_SAPG", "ST_SATE", "ST_TA", "ST_HA", "ST_SA", "ST_RA", "ST_CM", "ST_RaA"],
+    },
+    "ST_VV": {
+        "kind": "VV",
+        "priors": [[0.45, 1.29], [1.75, 1.19], [0.83, 5.42]],
+        "attributes": ["ST_VVSITE", "ST_VVSQTE", "ST_VVSAPG", "ST_VVSATE", "ST_TAVV", "ST_HAVV", "ST_SAVV", "ST_RAVV", "ST_CMVV", "ST_RaAVV", "ST_VVASRG"],
+    },
+    "IC_Dev": {
+        "kind": "Dev",
+        "priors": [[0.99, 1.66], [1.28, 1.05], [2.83, 32.73]],
+        "attributes": ["IC_IPG", "IC_IaC", "IC_HA", "IC_SA", "IC_RA"],
+    },
+    "IC_VV": {
+        "kind": "VV",
+        "priors": [[1.05, 2.26], [1.45, 1.10], [1.28, 8.56]],
+        "attributes": ["IC_ICAVV", "IC_ICVV", "IC_HAVV", "IC_SAVV", "IC_RAVV", "IC_VVASRG", "IC_VVFRG"],
+    },
+}
+
+### Defect chain structure
+# phases in order; the DDP_previous of a phase acts on the Total_Remained_Defect of the phase before
+phases = ["SR", "SD", "IM", "ST", "IC"]
+
+# Defect Density likelihood: P(Defect Density|Dev=H/M/L) = Gamma(alpha, beta), rows H/M/L
+defect_density_params = {
+    "SR": [[1.1043, 3.5507], [1.3130, 3.3811], [1.3596, 3.1705]],
+    "SD": [[2.2558, 3.3680], [2.7565, 3.2526], [3.0353, 3.1522]],
+    "IM": [[2.5989, 3.3317], [3.1588, 3.1963], [3.3807, 3.1969]],
+    "ST": [[1.2439, 4.3055], [1.5775, 3.9236], [1.5630, 3.1705]],
+    "IC": [[0.6106, 3.4640], [0.6838, 2.6797], [0.6514, 2.3803]],
+}
+
+# phases whose DDP tables depend on the Dev and the V&V state (ST_Dev<H/M/L>_VV<H/M/L>_DDP_*_npt)
+# instead of the V&V state only (<phase>_VV<H/M/L>_DDP_*_npt)
+dev_vv_ddp_phases = ["ST"]
+
+# generic software failure probability: generic_SFP ~ LogNormal(mu, sigma)
+generic_sfp_params = {"mu": -10.45, "sigma": 2.217}
@@ -1,3 +1,5 @@
+import json
+import os
 import arviz as az
 import numpy as np
 import time
@@ -6,8 +8,12 @@ import pymc.sampling.jax as pmjax
 from scipy import stats
 import pytensor
 
+from .compile_cache import track_compilation
+from .instrumentation import span, event, record_sampler_stats
+
 # histogram intepolation
-def from_posterior(param, samples, bins=100):
+def histogram_grid(samples, bins=100):
+    # (x, pdf(x)) grid of pm.Interpolated, shared by from_posterior and the generic model artifact
     if hasattr(samples, 'values'):
         samples = samples.values
 
@@ -15,6 +21,10 @@ def from_posterior(param, samples, bins=100):
     x = np.linspace(smin, smax, bins)
 
     y = stats.rv_histogram(np.histogram(samples, bins=bins)).pdf(x)
+    return x, y
+
+def from_posterior(param, samples, bins=100):
+    x, y = histogram_grid(samples, bins=bins)
     return pm.Interpolated(param, x, y)
 
 def print_pymc_version():
@@ -60,36 +70,203 @@ def print_summary(data, round_to=5):
     else:
         print(az.summary(data, var_names=filtered_var_names(data), stat_funcs=func_dict, round_to=round_to, extend=False))
 
-def run_sampling(model, numpyro=False, draws=1000, tune=1000, chains=1):
-    pytensor.config.exception_verbosity = 'high'  # 디버깅 정보 상세 출력
-
-    start = time.time()
+def sample_model(model, numpyro=False, draws=1000, tune=1000, chains=1, random_seed=None, step=None, initvals=None):
     with model:
         if numpyro:
-            trace = pmjax.sample_numpyro_nuts(draws=draws, tune=tune, chains=chains)
-        else:
-            # !!!: Try to use NUTS sampler, but it failed with ufunc error. So use Metropolis sampler instead.
-            # Need to be checked and reconsidered using another sampler like this. 251027
-            try:
-                # 원래 NUTS 샘플러 시도
-                trace = pm.sample(
+            return pmjax.sample_numpyro_nuts(draws=draws, tune=tune, chains=chains, random_seed=random_seed,
+                                             initvals=initvals)
+        # !!!: Try to use NUTS sampler, but it failed with ufunc error. So use Metropolis sampler instead.
+        # Need to be checked and reconsidered using another sampler like this. 251027
+        try:
+            # 원래 NUTS 샘플러 시도
+            if step is None:
+                return pm.sample(
                     draws=draws,
                     tune=tune,
                     chains=chains,
                     init="adapt_diag",
-                    target_accept=0.9
-                )
-            except Exception as e:
-                print(f"NUTS sampling failed with ufunc error: {e}")
-                print("Trying with Metropolis sampler...")
-                # NUTS 실패 시 Metropolis 샘플러 사용
-                trace = pm.sample(
-                    draws=draws,
-                    tune=tune,
-                    chains=chains,
-                    init="adapt_diag",
-                    step=pm.Metropolis()
+                    target_accept=0.9,
+                    random_seed=random_seed,
+                    initvals=initvals
                 )
+            return pm.sample(
+                draws=draws,
+                tune=tune,
+                chains=chains,
+                step=step,
+                random_seed=random_seed,
+                initvals=initvals
+            )
+        except Exception as e:
+            print(f"NUTS sampling failed with ufunc error: {e}")
+            print("Trying with Metropolis sampler...")
+            event("metropolis_fallback", error=f"{type(e).__name__}: {e}")
+            # NUTS 실패 시 Metropolis 샘플러 사용
+            return pm.sample(
+                draws=draws,
+                tune=tune,
+                chains=chains,
+                init="adapt_diag",
+                step=pm.Metropolis(),
+                random_seed=random_seed,
+                initvals=initvals
+            )
+
+# targets of adaptive sampling (run_sampling(..., adaptive={...})); a target set to None is not checked
+# var_names: variables whose ESS/R-hat are checked (default: monitored variables in the trace)
+# mcse_confidence: MCSE of P(var_names[0] <= goal), only checked when goal is given
+# increment / tune_increment: draws / re-tuning steps per extra batch (tune_increment None: the tune of the
+# first run), max_draws: budget per chain
+# chains: None for the chains argument of run_sampling, raised to 2 when the R-hat target is set
+default_sampling_targets = {
+    "var_names": None,
+    "ess": 400,
+    "rhat": 1.01,
+    "mcse_confidence": 0.005,
+    "goal": None,
+    "increment": 1000,
+    "tune_increment": None,
+    "max_draws": 20000,
+    "chains": None,
+}
+
+# JSON object of adaptive sampling targets for the task scripts (e.g. '{"ess": 400, "chains": 2}'),
+# unset or empty: fixed draws/tune
+sampling_targets_env = "SAMPLING_TARGETS"
+
+def adaptive_chains(targets, chains=1):
+    """
+    Number of chains of an adaptive run: targets["chains"] if given, otherwise chains, raised to 2
+    when the R-hat target is set (R-hat is undefined for a single chain, so it would never stop the run).
+    Raises ValueError for unknown targets and for an explicit single chain with an R-hat target.
+    """
+    unknown = set(targets) - set(default_sampling_targets)
+    if unknown:
+        raise ValueError(f"Unknown sampling targets: {sorted(unknown)} (expected {sorted(default_sampling_targets)})")
+    targets = {**default_sampling_targets, **targets}
+    if targets["chains"] is None:
+        return max(chains, 2) if targets["rhat"] is not None else chains
+    if targets["rhat"] is not None and targets["chains"] < 2:
+        raise ValueError("the R-hat target needs at least 2 chains; set chains >= 2 or rhat to null")
+    return targets["chains"]
+
+def sampling_targets_from_env(environ=None):
+    # adaptive targets of SAMPLING_TARGETS, None when it is not set (validated here, before any sampling)
+    environ = os.environ if environ is None else environ
+    value = environ.get(sampling_targets_env, "").strip()
+    if not value:
+        return None
+    targets = json.loads(value)
+    if not isinstance(targets, dict):
+        raise ValueError(f"{sampling_targets_env} must be a JSON object of sampling targets")
+    adaptive_chains(targets)
+    return targets
+
+def sampling_diagnostics(trace, var_names=None, goal=None):
+    """
+    Smallest bulk ESS and largest R-hat (None with one chain) over var_names, and the
+    confidence P(var_names[0] <= goal) with its Monte Carlo standard error sqrt(p(1-p)/ESS(indicator)).
+    """
+    var_names = var_names or filtered_var_names(trace) or list(trace.posterior.data_vars)
+    posterior = trace.posterior[var_names]
+    diagnostics = {
+        "draws": int(posterior.sizes["draw"]),
+        "chains": int(posterior.sizes["chain"]),
+        "ess": float(min(az.ess(posterior)[v].min() for v in var_names)),
+        "rhat": None,
+        "confidence": None,
+        "mcse_confidence": None,
+    }
+    if diagnostics["chains"] > 1:
+        diagnostics["rhat"] = float(max(az.rhat(posterior)[v].max() for v in var_names))
+    if goal is not None:
+        values = trace.posterior[var_names[0]].values
+        below = (values.reshape(values.shape[0], values.shape[1], -1)[..., 0] <= goal).astype(np.float64)
+        p = float(below.mean())
+        mcse = 0.0
+        if 0 < p < 1:
+            mcse = np.sqrt(p * (1 - p) / max(float(az.ess(below)), 1.0))
+        diagnostics["confidence"] = p
+        diagnostics["mcse_confidence"] = float(mcse)
+    return diagnostics
+
+def sampling_targets_met(diagnostics, targets):
+    if targets["ess"] is not None and diagnostics["ess"] < targets["ess"]:
+        return False
+    if targets["rhat"] is not None and diagnostics["rhat"] is not None and diagnostics["rhat"] > targets["rhat"]:
+        return False
+    if targets["mcse_confidence"] is not None and diagnostics["mcse_confidence"] is not None \
+            and diagnostics["mcse_confidence"] > targets["mcse_confidence"]:
+        return False
+    return True
+
+def last_point(model, trace):
+    # last draw of every free variable, one dict per chain (initvals of the next batch)
+    names = [rv.name for rv in model.free_RVs]
+    return [{name: trace.posterior[name].isel(chain=c, draw=-1).values for name in names}
+            for c in range(trace.posterior.sizes["chain"])]
+
+def run_adaptive_sampling(model, targets, numpyro=False, draws=1000, tune=1000, chains=1, random_seed=None, step=None):
+    """
+    Sample draws after tune steps, then keep adding batches of targets["increment"] draws
+    (each re-tuned for targets["tune_increment"] steps from the last point, default: tune) until the ESS,
+    R-hat and confidence-MCSE targets are met or max_draws is reached. Runs adaptive_chains(targets, chains) chains.
+    The achieved diagnostics are stored in trace.posterior.attrs.
+    """
+    chains = adaptive_chains(targets, chains)
+    targets = {**default_sampling_targets, **targets}
+    tune_increment = tune if targets["tune_increment"] is None else targets["tune_increment"]
+    seeds = np.random.SeedSequence(random_seed)
+    trace = sample_model(model, numpyro=numpyro, draws=draws, tune=tune, chains=chains,
+                         random_seed=int(seeds.generate_state(1)[0]), step=step)
+    while True:
+        diagnostics = sampling_diagnostics(trace, targets["var_names"], targets["goal"])
+        met = sampling_targets_met(diagnostics, targets)
+        print(f"adaptive sampling: draws={diagnostics['draws']}, ess={diagnostics['ess']:.1f}, "
+              f"rhat={diagnostics['rhat']}, mcse_confidence={diagnostics['mcse_confidence']}, targets met={met}")
+        if met or diagnostics["draws"] + targets["increment"] > targets["max_draws"]:
+            break
+        seeds = seeds.spawn(1)[0]
+        batch = sample_model(model, numpyro=numpyro, draws=targets["increment"], tune=tune_increment,
+                             chains=chains, random_seed=int(seeds.generate_state(1)[0]), step=step,
+                             initvals=last_point(model, trace))
+        trace = az.concat(trace, batch, dim="draw", reset_dim=True)
+
+    for key, value in diagnostics.items():
+        trace.posterior.attrs[f"adaptive_{key}"] = "None" if value is None else value
+    trace.posterior.attrs["adaptive_targets_met"] = int(met)
+    return trace
+
+def sampler_stats(trace):
+    # divergences, sampler kind and the sampling_diagnostics summary (ESS / R-hat) of a finished run
+    stats = {"sampler": "metropolis", "divergences": None}
+    sample_stats = getattr(trace, "sample_stats", None)
+    if sample_stats is not None and "diverging" in sample_stats:
+        stats["sampler"] = "nuts"
+        stats["divergences"] = int(sample_stats["diverging"].values.sum())
+    try:
+        diagnostics = sampling_diagnostics(trace)
+        stats.update(draws=diagnostics["draws"], chains=diagnostics["chains"],
+                     ess=diagnostics["ess"], rhat=diagnostics["rhat"])
+    except Exception as e:
+        print(f"Could not compute sampling diagnostics: {e}")
+    return stats
+
+# step: a prebuilt step method (e.g. pm.NUTS) whose compiled logp/gradient functions are reused across calls
+# adaptive: None for a fixed draws/tune run, or a dict of targets (see default_sampling_targets)
+def run_sampling(model, numpyro=False, draws=1000, tune=1000, chains=1, random_seed=None, step=None, adaptive=None):
+    pytensor.config.exception_verbosity = 'high'  # 디버깅 정보 상세 출력
+
+    start = time.time()
+    with span("sampling", numpyro=numpyro, draws=draws, tune=tune, chains=chains, adaptive=adaptive is not None), \
+            track_compilation():
+        if adaptive is None:
+            trace = sample_model(model, numpyro=numpyro, draws=draws, tune=tune, chains=chains,
+                                 random_seed=random_seed, step=step)
+        else:
+            trace = run_adaptive_sampling(model, adaptive, numpyro=numpyro, draws=draws, tune=tune, chains=chains,
+                                          random_seed=random_seed, step=step)
+        record_sampler_stats(sampler_stats(trace))
     end = time.time()
     print("sampling time: ", end - start)
     print_summary(trace)
@@ -0,0 +1,160 @@
+import hashlib
+import json
+import os
+import shutil
+import zipfile
+
+from .trace_store import TraceKeyMismatch, trace_to_npz_bytes, trace_from_npz_bytes
+
+# Stage checkpoints of a long-running task (run_full_analysis.py), one prefix per job id: a task
+# restarted with the same JOB_ID (Spot reclaim, OOM, timeout, redelivered queue message) resumes from
+# the last completed stage or demand point. Every checkpoint carries the fingerprint of the job
+# parameters, so a job id reused with other parameters starts over instead of resuming stale work.
+
+# how often the partial demand sweep is written (and always once at its end)
+default_interval_seconds = 30
+
+def job_fingerprint(params):
+    canonical = json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+class LocalCheckpointStore:
+    # files in <directory>/<job_id>/, written with write-then-rename
+    def __init__(self, directory, job_id):
+        self.directory = os.path.join(directory, job_id)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def read(self, name):
+        try:
+            with open(os.path.join(self.directory, name), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def write(self, name, blob):
+        path = os.path.join(self.directory, name)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(blob)
+        os.replace(temp_path, path)
+
+    def clear(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+class S3CheckpointStore:
+    # objects under <prefix><job_id>/ of an S3 (or S3-compatible) bucket
+    def __init__(self, bucket, job_id, prefix="checkpoints/", s3_client=None, region_name=None, endpoint_url=None):
+        import boto3
+
+        self.bucket = bucket
+        self.prefix = f"{prefix if prefix.endswith('/') else prefix + '/'}{job_id}/"
+        self.s3 = s3_client or boto3.client("s3", region_name=region_name, endpoint_url=endpoint_url)
+
+    def read(self, name):
+        from botocore.exceptions import ClientError
+
+        try:
+            return self.s3.get_object(Bucket=self.bucket, Key=f"{self.prefix}{name}")["Body"].read()
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+                return None
+            raise
+
+    def write(self, name, blob):
+        self.s3.put_object(Bucket=self.bucket, Key=f"{self.prefix}{name}", Body=blob,
+                           ContentType="application/octet-stream")
+
+    def clear(self):
+        paginator = self.s3.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=self.prefix):
+            objects = [{"Key": item["Key"]} for item in page.get("Contents", [])]
+            if objects:
+                self.s3.delete_objects(Bucket=self.bucket, Delete={"Objects": objects})
+
+class JobCheckpoints:
+    """
+    JSON values and PFD traces of one job on a checkpoint store, stamped with the job fingerprint.
+    Missing, unreadable or foreign (other fingerprint) checkpoints load as None, and failed writes
+    only print a warning: checkpointing never fails the job. store=None disables it.
+    """
+
+    def __init__(self, store, params):
+        self.store = store
+        self.fingerprint = job_fingerprint(params)
+
+    def read(self, name):
+        if self.store is None:
+            return None
+        try:
+            return self.store.read(name)
+        except Exception as e:
+            print(f"[CHECKPOINT] Read of {name} failed, recomputing: {e}")
+            return None
+
+    def write(self, name, blob):
+        if self.store is None:
+            return
+        try:
+            self.store.write(name, blob)
+        except Exception as e:
+            print(f"[CHECKPOINT] Write of {name} failed: {e}")
+
+    def load_json(self, name):
+        blob = self.read(f"{name}.json")
+        if blob is None:
+            return None
+        try:
+            document = json.loads(blob)
+            if document.get("fingerprint") != self.fingerprint:
+                print(f"[CHECKPOINT] {name} belongs to other job parameters, ignoring it")
+                return None
+            return document["value"]
+        except (ValueError, KeyError, AttributeError) as e:
+            # truncated / corrupted object (json.JSONDecodeError and UnicodeDecodeError are ValueErrors)
+            print(f"[CHECKPOINT] {name} is unreadable, recomputing: {e}")
+            return None
+
+    def save_json(self, name, value):
+        self.write(f"{name}.json", json.dumps({"fingerprint": self.fingerprint, "value": value}).encode("utf-8"))
+
+    def load_trace(self, name="trace"):
+        blob = self.read(f"{name}.npz")
+        if blob is None:
+            return None
+        try:
+            return trace_from_npz_bytes(blob, self.fingerprint)
+        except TraceKeyMismatch:
+            print(f"[CHECKPOINT] {name} belongs to other job parameters, ignoring it")
+            return None
+        except (ValueError, zipfile.BadZipFile, OSError, EOFError, KeyError) as e:
+            # truncated / partially written npz
+            print(f"[CHECKPOINT] {name} is unreadable, recomputing: {e}")
+            return None
+
+    def save_trace(self, trace, name="trace"):
+        # PFD draws only, like the trace cache
+        self.write(f"{name}.npz", trace_to_npz_bytes(trace, self.fingerprint))
+
+    def clear(self):
+        if self.store is None:
+            return
+        try:
+            self.store.clear()
+        except Exception as e:
+            print(f"[CHECKPOINT] Failed to remove the checkpoints: {e}")
+
+def checkpoint_store_from_env(job_id, environ=None):
+    """
+    CHECKPOINT_S3_BUCKET (+ CHECKPOINT_S3_PREFIX, CHECKPOINT_S3_ENDPOINT) selects S3, otherwise
+    CHECKPOINT_DIR a local directory. Returns None (no checkpoints) when neither is set.
+    """
+    environ = os.environ if environ is None else environ
+    bucket = environ.get("CHECKPOINT_S3_BUCKET")
+    if bucket:
+        return S3CheckpointStore(bucket, job_id, prefix=environ.get("CHECKPOINT_S3_PREFIX", "checkpoints/"),
+                                 region_name=environ.get("AWS_REGION"),
+                                 endpoint_url=environ.get("CHECKPOINT_S3_ENDPOINT") or None)
+    directory = environ.get("CHECKPOINT_DIR")
+    if directory:
+        return LocalCheckpointStore(directory, job_id)
+    return None
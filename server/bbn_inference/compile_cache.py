@@ -0,0 +1,200 @@
+"""
+Persistent compilation caches of the samplers.
+
+COMPILE_CACHE_DIR=<dir> puts the PyTensor compiledir (C code of the PyMC NUTS path) at <dir>/pytensor
+and the JAX persistent compilation cache (NumPyro kernels of the mcmc submodels) at <dir>/jax, so a
+container that mounts or bakes <dir> reuses what earlier containers compiled instead of compiling again.
+Both libraries read these settings when they are imported: call configure_compile_cache() before
+anything imports pymc (the task scripts and main.py do it first thing); spawned child processes
+inherit the settings through the environment.
+
+Pre-populate a cache (image build, shared volume):
+    cd server
+    COMPILE_CACHE_DIR=/mnt/compile-cache python -m bbn_inference.compile_cache
+    # also the NumPyro kernels of SUBMODEL_METHOD=mcmc (not used by the analytic default)
+    COMPILE_CACHE_DIR=/mnt/compile-cache python -m bbn_inference.compile_cache --steps composite submodels
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+from .instrumentation import span, record_compile_stats, empty_compile_stats, metrics_snapshot
+
+compile_cache_env = "COMPILE_CACHE_DIR"
+
+# every compiled kernel is worth keeping: the JAX defaults skip compilations shorter than 1 s
+jax_cache_settings = {
+    "jax_compilation_cache_dir": None,  # <dir>/jax
+    "jax_persistent_cache_min_compile_time_secs": "0",
+    "jax_persistent_cache_min_entry_size_bytes": "0",
+}
+
+def cache_dirs(root):
+    return {"pytensor": os.path.join(root, "pytensor"), "jax": os.path.join(root, "jax")}
+
+def configure_compile_cache():
+    """
+    Sets PYTENSOR_FLAGS compiledir and the JAX_* cache settings from COMPILE_CACHE_DIR (settings that are
+    already in the environment win). Returns the cache directory, or None when COMPILE_CACHE_DIR is not set.
+    """
+    root = os.environ.get(compile_cache_env)
+    if not root:
+        return None
+    root = os.path.abspath(root)
+    dirs = cache_dirs(root)
+    for directory in dirs.values():
+        os.makedirs(directory, exist_ok=True)
+
+    flags = os.environ.get("PYTENSOR_FLAGS", "")
+    if "compiledir" not in flags:
+        # compiledir, not base_compiledir: the latter adds a platform subdirectory that names the
+        # kernel version, which differs between the image build host and Fargate
+        os.environ["PYTENSOR_FLAGS"] = ",".join(filter(None, [flags, f"compiledir={dirs['pytensor']}"]))
+    if "pytensor" in sys.modules:
+        import pytensor
+
+        if os.path.abspath(pytensor.config.compiledir) != dirs["pytensor"]:
+            print(f"[COMPILE CACHE] pytensor was imported before configure_compile_cache, "
+                  f"compiledir stays {pytensor.config.compiledir}")
+
+    for name, value in jax_cache_settings.items():
+        os.environ.setdefault(name.upper(), dirs["jax"] if value is None else value)
+    if "jax" in sys.modules:
+        import jax
+
+        jax.config.update("jax_compilation_cache_dir", os.environ["JAX_COMPILATION_CACHE_DIR"])
+        jax.config.update("jax_persistent_cache_min_compile_time_secs",
+                          float(os.environ["JAX_PERSISTENT_CACHE_MIN_COMPILE_TIME_SECS"]))
+        jax.config.update("jax_persistent_cache_min_entry_size_bytes",
+                          int(os.environ["JAX_PERSISTENT_CACHE_MIN_ENTRY_SIZE_BYTES"]))
+    return root
+
+# ---------------- hit / miss counters ----------------
+# JAX reports persistent cache lookups through jax.monitoring; PyTensor counts them in its ModuleCache
+# ([loaded from memory, loaded from the compiledir, compiled])
+
+jax_counts = {"jax_hits": 0, "jax_misses": 0, "jax_saved_seconds": 0.0}
+jax_counts_lock = threading.Lock()
+jax_listening = False
+
+jax_events = {
+    "/jax/compilation_cache/cache_hits": "jax_hits",
+    "/jax/compilation_cache/cache_misses": "jax_misses",
+}
+
+def on_jax_event(event, **kwargs):
+    if event in jax_events:
+        with jax_counts_lock:
+            jax_counts[jax_events[event]] += 1
+
+def on_jax_duration(event, duration, **kwargs):
+    if event == "/jax/compilation_cache/compile_time_saved_sec":
+        with jax_counts_lock:
+            jax_counts["jax_saved_seconds"] += duration
+
+def listen_to_jax():
+    # registered once, and only when something has imported jax already (importing it here costs seconds)
+    global jax_listening
+    if jax_listening or "jax" not in sys.modules:
+        return
+    import jax.monitoring
+
+    jax.monitoring.register_event_listener(on_jax_event)
+    jax.monitoring.register_event_duration_secs_listener(on_jax_duration)
+    jax_listening = True
+
+def compile_counts():
+    listen_to_jax()
+    with jax_counts_lock:
+        counts = {**empty_compile_stats(), **jax_counts}
+    if "pytensor" in sys.modules:
+        import pytensor
+        from pytensor.link.c.cmodule import get_module_cache
+
+        from_memory, from_disk, compiled = get_module_cache(pytensor.config.compiledir).stats
+        counts.update(pytensor_hits=from_memory + from_disk, pytensor_compiles=compiled)
+    return counts
+
+@contextmanager
+def track_compilation():
+    """
+    Adds the compilation cache hits / misses of the body to the current span (compile_jax_hits, ...)
+    and to the /metrics totals.
+    """
+    before = compile_counts()
+    try:
+        yield
+    finally:
+        after = compile_counts()
+        record_compile_stats({key: after[key] - before[key] for key in after})
+
+def cache_entries(root):
+    # files in the JAX cache / compiled modules in the PyTensor compiledir
+    dirs = cache_dirs(root)
+    jax_entries = len(os.listdir(dirs["jax"])) if os.path.isdir(dirs["jax"]) else 0
+    pytensor_modules = 0
+    for _, _, files in os.walk(dirs["pytensor"]):
+        pytensor_modules += sum(1 for name in files if name.endswith((".so", ".pyd")))
+    return {"jax_entries": jax_entries, "pytensor_modules": pytensor_modules}
+
+# ---------------- warm-up ----------------
+
+def warm_up(steps=("composite",), submodel_workers=None):
+    """
+    Compiles what a task compiles. "composite": the PyTensor functions of the composite model on the
+    default path (analytic submodels; a short run, the C modules do not depend on the number of draws),
+    skipped when there is no generic artifact (or NetCDF trace) to build it from. "submodels": the NumPyro
+    kernels of the ten mcmc submodels (SUBMODEL_METHOD=mcmc only, run with the production draws/tune,
+    which are part of the compiled program).
+    """
+    from .attribute_posterior import attribute_submodel_traces, attribute_submodel_traces_mcmc
+    from .composite_model import composite_model_for
+    from .data import nrc_report_data
+    from .generic_artifact import load_generic_artifact, default_artifact_path, default_trace_path
+
+    data = nrc_report_data()
+    with span("compile_cache_warmup", steps=list(steps)):
+        if "submodels" in steps:
+            attribute_submodel_traces_mcmc(data.attr_states, workers=submodel_workers, random_seed=0)
+        if "composite" in steps and not (os.path.isfile(default_artifact_path) or os.path.isfile(default_trace_path)):
+            print("[COMPILE CACHE] No generic model artifact, skipping the composite model "
+                  "(python -m bbn_inference.generic_artifact builds it)")
+        elif "composite" in steps:
+            traces = attribute_submodel_traces(data.attr_states, random_seed=0)
+            composite, _ = composite_model_for(load_generic_artifact(), traces, data.function_point, data.complexity)
+            composite.sample(traces, data.function_point, data.complexity, draws=20, tune=20, random_seed=0)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-populate the PyTensor / JAX compilation caches")
+    parser.add_argument("--dir", help=f"cache directory (default: ${compile_cache_env})")
+    parser.add_argument("--steps", nargs="*", choices=("submodels", "composite"), default=["composite"],
+                        help="composite (default path) and/or submodels (SUBMODEL_METHOD=mcmc kernels)")
+    parser.add_argument("--submodel-workers", type=int, help="processes for the mcmc submodels (default: vCPUs)")
+    args = parser.parse_args(argv)
+
+    if args.dir:
+        os.environ[compile_cache_env] = args.dir
+    root = configure_compile_cache()
+    if root is None:
+        parser.error(f"set {compile_cache_env} or pass --dir")
+
+    before = cache_entries(root)
+    start = time.perf_counter()
+    warm_up(args.steps, submodel_workers=args.submodel_workers)
+    print(json.dumps({
+        "status": "warmed",
+        "compile_cache_dir": root,
+        "seconds": time.perf_counter() - start,
+        "before": before,
+        "after": cache_entries(root),
+        # lookups of this process; the submodel worker processes report theirs on their sampling spans
+        "lookups": metrics_snapshot()["compile_cache"],
+    }))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
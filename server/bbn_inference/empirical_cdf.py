@@ -0,0 +1,64 @@
+import numpy as np
+
+class EmpiricalCDF:
+    """
+    Empirical CDF of PFD draws, built once per trace: the draws sorted as float64
+    (and, for a reweighted posterior, the cumulative normalized weights).
+    confidence(goal) = P(PFD <= goal) and quantile(confidence) are binary searches,
+    and both accept scalars or arrays of goals/confidences.
+    """
+
+    def __init__(self, samples, weights=None, assume_sorted=False):
+        if hasattr(samples, "values"):
+            samples = samples.values
+        samples = np.asarray(samples, dtype=np.float64).ravel()
+        if samples.size == 0:
+            raise ValueError("EmpiricalCDF needs at least one sample")
+
+        order = None if assume_sorted else np.argsort(samples, kind="stable")
+        self.samples = samples if order is None else samples[order]
+        self.cumulative = None
+        if weights is not None:
+            weights = np.asarray(weights, dtype=np.float64).ravel()
+            if order is not None:
+                weights = weights[order]
+            self.cumulative = np.cumsum(weights / weights.sum())
+
+    @classmethod
+    def from_trace(cls, trace, var_name="PFD"):
+        return cls(trace.posterior[var_name])
+
+    @property
+    def size(self):
+        return self.samples.size
+
+    @property
+    def nbytes(self):
+        return self.samples.nbytes + (0 if self.cumulative is None else self.cumulative.nbytes)
+
+    @property
+    def mean(self):
+        if self.cumulative is None:
+            return float(self.samples.mean())
+        return float(np.dot(np.diff(self.cumulative, prepend=0.0), self.samples))
+
+    def confidence(self, goal):
+        # P(PFD <= goal)
+        count = np.searchsorted(self.samples, goal, side="right")
+        if self.cumulative is None:
+            result = count / self.size
+        else:
+            result = np.where(count > 0, self.cumulative[np.maximum(count - 1, 0)], 0.0)
+        return float(result) if np.ndim(result) == 0 else result
+
+    def quantile(self, confidence):
+        # smallest sampled PFD whose confidence is at least the given level
+        confidence = np.asarray(confidence, dtype=np.float64)
+        if np.any((confidence < 0) | (confidence > 1)):
+            raise ValueError("confidence must be between 0 and 1")
+        if self.cumulative is None:
+            index = np.ceil(confidence * self.size).astype(np.int64) - 1
+        else:
+            index = np.searchsorted(self.cumulative, confidence, side="left")
+        result = self.samples[np.clip(index, 0, self.size - 1)]
+        return float(result) if np.ndim(result) == 0 else result
@@ -0,0 +1,6 @@
+# Exceptions the API maps to client errors. Kept apart from sensitivity_analysis.py, which needs PyMC:
+# api.py imports them at import time.
+
+class UnreachableGoalError(ValueError):
+    # the PFD / confidence goal of a demand search cannot be reached with any number of demands
+    pass
@@ -0,0 +1,34 @@
+from typing import Optional
+
+from bbn_inference.bbn_utils import run_sampling
+from bbn_inference.attribute_posterior import attribute_submodel_means, default_draws
+from bbn_inference.bbn_parameter import attribute_submodels
+from bbn_inference.data import nrc_report_data
+from bbn_inference.bbn_data_model import BayesianData
+from bbn_inference import composite_model
+
+# regression check of the NumPy attribute submodel evaluator against the NUTS traces of
+# create_*_Dev_model / create_*_VV_model. Both are Monte Carlo estimates of the same normalized
+# posterior means, so they agree up to the sampling error of the 1000-draw NUTS runs.
+def run_example_for_attribute_posterior(data_override: Optional[BayesianData] = None,
+                                        tolerance: float = 0.02,
+                                        draws: int = default_draws,
+                                        random_seed: int = 0):
+    data = data_override or nrc_report_data()
+    differences = {}
+    for name in attribute_submodels:
+        phase, kind = name.split("_")
+        model = getattr(composite_model, f"create_{name}_model")(data.attr_states)
+        trace = run_sampling(model, True)
+        temp = [trace.posterior[f"{phase}_{kind}{level}_post"].mean().item() for level in "HML"]
+        mcmc_means = [t / sum(temp) for t in temp]
+        analytic_means = attribute_submodel_means(name, data.attr_states, draws=draws, rng=random_seed)
+        differences[name] = max(abs(a - b) for a, b in zip(analytic_means, mcmc_means))
+        print(f"{name}: analytic={[round(m, 4) for m in analytic_means]} "
+              f"mcmc={[round(m, 4) for m in mcmc_means]} max|diff|={differences[name]:.4f}")
+
+    failed = [name for name, diff in differences.items() if diff > tolerance]
+    if failed:
+        raise AssertionError(f"Analytic submodel means differ from NUTS by more than {tolerance}: {failed}")
+    print(f"All {len(differences)} submodels agree within {tolerance}")
+    return differences
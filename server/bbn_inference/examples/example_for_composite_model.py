@@ -1,13 +1,15 @@
-import arviz as az
 import os
 from typing import Optional
 
 from bbn_inference.bbn_utils import run_sampling
+from bbn_inference.attribute_posterior import attribute_submodel_traces, attribute_submodel_traces_mcmc, default_draws
 from bbn_inference.data import nrc_report_data
 from bbn_inference.composite_model import *
 from bbn_inference.generic_model import create_generic_model
 from bbn_inference.bbn_data_model import BayesianData
-import pymc as pm
+from bbn_inference.trace_store import trace_cache_key
+from bbn_inference.generic_artifact import load_generic_artifact, build_generic_artifact, save_generic_artifact
+from bbn_inference.instrumentation import span
 
 import pytensor
 
@@ -22,59 +24,102 @@ def run_example_for_generic_model():
     base_dir = os.path.dirname(__file__)
     filename = os.path.join(base_dir, "generic_model_trace_data_1000.nc")
     generic_trace.to_netcdf(filename=filename)
+    # and the interpolation grid the composite model reads (generic_artifact.py)
+    save_generic_artifact(build_generic_artifact(generic_trace))
 
 # this one is fast
-def run_example_for_composite_model(data_override: Optional[BayesianData] = None):
+# submodel_method: "analytic" evaluates the ten Dev/VV attribute submodels by forward sampling in NumPy
+# (attribute_posterior.py), "mcmc" samples each of them with NUTS as before,
+# "mcmc" with submodel_workers > 1 samples them concurrently in a process pool (None: one per CPU, at most 10)
+# adaptive: sampling targets of the composite model and of the "mcmc" submodels (bbn_utils.default_sampling_targets),
+# None: fixed draws/tune
+def run_example_for_composite_model(data_override: Optional[BayesianData] = None,
+                                    submodel_method: str = "analytic",
+                                    submodel_draws: int = default_draws,
+                                    random_seed: Optional[int] = None,
+                                    submodel_workers: Optional[int] = None,
+                                    adaptive: Optional[dict] = None):
 
     data = data_override or nrc_report_data()
-    SR_Dev_model = create_SR_Dev_model(data.attr_states)
-    SR_VV_model = create_SR_VV_model(data.attr_states)
-    SD_Dev_model = create_SD_Dev_model(data.attr_states)
-    SD_VV_model = create_SD_VV_model(data.attr_states)
-    IM_Dev_model = create_IM_Dev_model(data.attr_states)
-    IM_VV_model = create_IM_VV_model(data.attr_states)
-    ST_Dev_model = create_ST_Dev_model(data.attr_states)
-    ST_VV_model = create_ST_VV_model(data.attr_states)
-    IC_Dev_model = create_IC_Dev_model(data.attr_states)
-    IC_VV_model = create_IC_VV_model(data.attr_states)
+    with span("submodels", method=submodel_method):
+        if submodel_method == "analytic":
+            traces = attribute_submodel_traces(data.attr_states, draws=submodel_draws, random_seed=random_seed)
+        elif submodel_method == "mcmc":
+            traces = attribute_submodel_traces_mcmc(data.attr_states, workers=submodel_workers, random_seed=random_seed,
+                                                    adaptive=adaptive)
+        else:
+            raise ValueError(f"Unknown submodel method: {submodel_method} (expected 'analytic' or 'mcmc')")
 
-    SR_Dev_trace = run_sampling(SR_Dev_model, True)
-    SR_VV_trace = run_sampling(SR_VV_model, True)
-    SD_Dev_trace = run_sampling(SD_Dev_model, True)
-    SD_VV_trace = run_sampling(SD_VV_model, True)
-    IM_Dev_trace = run_sampling(IM_Dev_model, True)
-    IM_VV_trace = run_sampling(IM_VV_model, True)
-    ST_Dev_trace = run_sampling(ST_Dev_model, True)
-    ST_VV_trace = run_sampling(ST_VV_model, True)
-    IC_Dev_trace = run_sampling(IC_Dev_model, True)
-    IC_VV_trace = run_sampling(IC_VV_model, True)
+    # generic model artifact (interpolation grid + summary stats), loaded once per process
+    with span("generic_artifact"):
+        generic_artifact = load_generic_artifact()
 
-    # generic trace 파일 로드
-    base_dir = os.path.dirname(__file__)
-    file_path = os.path.join(base_dir, "generic_model_trace_data_1000.nc")
-    generic_trace = az.from_netcdf(file_path)
+    # the composite model is compiled once per process and artifact; later inputs only update its data
+    with span("composite_build") as record:
+        composite, built = composite_model_for(generic_artifact, traces, data.function_point, data.complexity)
+        record["attributes"]["reused"] = not built
 
-    # 디버그용 통계 출력 (clip 기준 잡기 위함)
-    print("Generic trace stats:")
-    for var_name in generic_trace.posterior.data_vars:
-        values = generic_trace.posterior[var_name].values
-        print(f"{var_name} → max: {values.max()}, min: {values.min()}")
+    with span("composite_sampling"):
+        trace = composite.sample(traces, data.function_point, data.complexity, random_seed=random_seed,
+                                 adaptive=adaptive)
+    return trace
 
-    model = create_composite_model(SR_Dev_trace=SR_Dev_trace, SR_VV_trace=SR_VV_trace,
-                                   SD_Dev_trace=SD_Dev_trace, SD_VV_trace=SD_VV_trace,
-                                   IM_Dev_trace=IM_Dev_trace, IM_VV_trace=IM_VV_trace,
-                                   ST_Dev_trace=ST_Dev_trace, ST_VV_trace=ST_VV_trace,
-                                   IC_Dev_trace=IC_Dev_trace, IC_VV_trace=IC_VV_trace,
-                                   generic_trace=generic_trace,
-                                   function_point=data.function_point,
-                                   complexity=data.complexity,
-                                   interpolation_bins=32)
+# everything besides BayesianData that changes the composite trace; part of the trace cache key
+def composite_sampler_settings(submodel_method: str = "analytic",
+                               submodel_draws: int = default_draws,
+                               random_seed: Optional[int] = None,
+                               adaptive: Optional[dict] = None):
+    settings = {
+        "submodel_method": submodel_method,
+        "submodel_draws": submodel_draws if submodel_method == "analytic" else None,
+        "random_seed": random_seed,
+        "generic_artifact": load_generic_artifact()["hash"],
+        "draws": 1000,
+        "tune": 1000,
+        "chains": 1,
+    }
+    # only adaptive runs carry the key, so the keys of fixed runs stay those of the traces cached before
+    if adaptive is not None:
+        settings["adaptive"] = adaptive
+    return settings
 
-    with model:
-        # PyTensor overflow 방지용 clip 적용
-        for RV in model.basic_RVs:
-            if hasattr(RV.tag, 'test_value') and isinstance(RV.tag.test_value, float):
-                RV.tag.test_value = pm.math.clip(RV.tag.test_value, -20, 20)
+# run_example_for_composite_model behind a trace store (trace_store.py); store=None disables caching
+# returns (trace, cache_hit). Cached traces only carry the PFD posterior
+def run_cached_composite_model(data_override: Optional[BayesianData] = None,
+                               store=None,
+                               submodel_method: str = "analytic",
+                               submodel_draws: int = default_draws,
+                               random_seed: Optional[int] = None,
+                               submodel_workers: Optional[int] = None,
+                               adaptive: Optional[dict] = None):
+    data = data_override or nrc_report_data()
+    with span("trace_generation", submodel_method=submodel_method, cached=store is not None) as record:
+        trace, cache_hit = cached_composite_trace(data, store, submodel_method, submodel_draws,
+                                                  random_seed, submodel_workers, adaptive)
+        record["attributes"]["cache_hit"] = cache_hit
+    return trace, cache_hit
 
-    trace = run_sampling(model)
-    return trace
+def cached_composite_trace(data, store, submodel_method, submodel_draws, random_seed, submodel_workers, adaptive=None):
+    key = None
+    if store is not None:
+        key = trace_cache_key(data, composite_sampler_settings(submodel_method, submodel_draws, random_seed, adaptive))
+        try:
+            trace = store.get(key)
+        except Exception as e:
+            print(f"[TRACE CACHE] Read failed, sampling instead: {e}")
+            trace = None
+        if trace is not None:
+            print(f"[TRACE CACHE] Hit: {key}")
+            return trace, True
+        print(f"[TRACE CACHE] Miss: {key}")
+
+    # the worker count does not change the trace (per-model seeds), so it is not part of the key
+    trace = run_example_for_composite_model(data, submodel_method=submodel_method,
+                                            submodel_draws=submodel_draws, random_seed=random_seed,
+                                            submodel_workers=submodel_workers, adaptive=adaptive)
+    if store is not None:
+        try:
+            store.put(key, trace)
+        except Exception as e:
+            print(f"[TRACE CACHE] Write failed: {e}")
+    return trace, False
@@ -0,0 +1,41 @@
+from typing import Optional
+
+import numpy as np
+
+from bbn_inference.attribute_posterior import attribute_submodel_traces
+from bbn_inference.composite_model import CompositeModel
+from bbn_inference.data import nrc_report_data
+from bbn_inference.bbn_data_model import BayesianData
+from bbn_inference.generic_artifact import load_generic_artifact
+from bbn_inference.scenarios import evaluate_scenarios
+
+# regression check of the NumPy forward simulation of evaluate_scenarios against a NUTS run of the
+# composite model on the same submodel posteriors. Both estimate P(PFD <= goal) of the same joint
+# prior, so they agree up to the sampling error of the 1000-draw NUTS run.
+def run_example_for_scenarios(data_override: Optional[BayesianData] = None,
+                              pfd_goals=(1e-5, 1e-4, 1e-3),
+                              tolerance: float = 0.04,
+                              random_seed: int = 0):
+    data = data_override or nrc_report_data()
+    generic_artifact = load_generic_artifact()
+    generic_grid = (generic_artifact["x"], generic_artifact["y"])
+
+    traces = attribute_submodel_traces(data.attr_states, random_seed=random_seed)
+    composite = CompositeModel(traces, data.function_point, data.complexity, generic_grid)
+    pfd = composite.sample(traces, data.function_point, data.complexity, random_seed=random_seed)
+    pfd = pfd.posterior["PFD"].values.ravel()
+
+    differences = {}
+    for goal in pfd_goals:
+        result = evaluate_scenarios([data], pfd_goal=goal, random_seed=random_seed,
+                                    generic_artifact=generic_artifact)["scenarios"][0]
+        mcmc_confidence = float(np.mean(pfd <= goal))
+        differences[goal] = abs(result["confidence"] - mcmc_confidence)
+        print(f"PFD <= {goal}: forward={result['confidence']:.4f} mcmc={mcmc_confidence:.4f} "
+              f"|diff|={differences[goal]:.4f}")
+
+    failed = [goal for goal, diff in differences.items() if diff > tolerance]
+    if failed:
+        raise AssertionError(f"Forward confidences differ from NUTS by more than {tolerance}: {failed}")
+    print(f"All {len(differences)} confidences agree within {tolerance}")
+    return differences
@@ -3,29 +3,40 @@ from __future__ import annotations
 
 import os
 import json
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, Tuple
 
 from bbn_inference.sensitivity_analysis import (
     get_number_of_required_demand,
     filter_outsiders,
     get_confidence,
-    demand_model_func,
+    run_demand_update,
+    run_demand_sweep,
+    demand_grid,
+    sweep_to_pfd_series,
 )
 from bbn_inference.examples.example_for_composite_model import run_example_for_composite_model
-from bbn_inference.bbn_utils import run_sampling
 
 
 # 1) Number of Tests 계산 (API: /sensitivity-analysis 와 동일 구조)
-def run_sensitivity_analysis(pfd_goal: float, confidence_goal: float) -> Dict[str, Any]:
+def run_sensitivity_analysis(
+    pfd_goal: float,
+    confidence_goal: float,
+    *,
+    method: str = "analytic",
+    search: str = "bisect",
+    tolerance: int = 10,
+) -> Dict[str, Any]:
     """
     입력: pfd_goal (예: 1e-4), confidence_goal (예: 0.95)
+    옵션: method ("analytic" | "mcmc"), search ("bisect" | "linear"), tolerance (bisect 허용 오차)
     출력: num_tests, prior_mean, prior_confidence
     """
     trace = run_example_for_composite_model()
 
     num_tests = int(
         get_number_of_required_demand(
-            trace, pfd_goal=pfd_goal, confidence_goal=confidence_goal
+            trace, pfd_goal=pfd_goal, confidence_goal=confidence_goal,
+            method=method, search=search, tolerance=tolerance,
         )
     )
     prior_mean = trace.posterior["PFD"].mean().item()
@@ -53,25 +64,25 @@ def run_update_pfd(
     demand: int,
     failures: int,
     *,
+    method: str = "analytic",
     draws: int = 2000,
     tune: int = 500,
 ) -> Dict[str, Any]:
     """
     입력: pfd_goal, demand(시험수), failures(실패수)
+    옵션: method ("analytic" | "mcmc"), draws/tune (mcmc일 때만 사용)
     출력: updated_pfd, updated_confidence
     """
     trace = run_example_for_composite_model()
     filtered_pfd_trace = filter_outsiders(trace.posterior["PFD"])
 
-    model = demand_model_func(
-        demand=demand, observed_failures=failures, pfd_trace=filtered_pfd_trace
+    updated = run_demand_update(
+        demand=demand, observed_failures=failures, pfd_trace=filtered_pfd_trace,
+        pfd_goal=pfd_goal, method=method, draws=draws, tune=tune,
     )
-    updated_trace = run_sampling(model, draws=draws, tune=tune)
 
-    updated_pfd_mean = updated_trace.posterior["pfd_prior"].mean().item()
-    updated_conf = get_confidence(
-        data=updated_trace.posterior["pfd_prior"], goal=pfd_goal
-    )
+    updated_pfd_mean = updated["mean"]
+    updated_conf = updated["confidence"]
 
     # === 여기부터 터미널 로그 출력 ===
     print("==== Update PFD Result ====")
@@ -98,6 +109,9 @@ def run_full_analysis(
     failures: int,
     *,
     step: int = 500,
+    method: str = "analytic",
+    search: str = "bisect",
+    tolerance: int = 10,
     draws: int = 2000,
     tune: int = 500,
     save_dir: str = "result_json",
@@ -105,7 +119,9 @@ def run_full_analysis(
 ) -> Tuple[str, Dict[str, Any]]:
     """
     입력: pfd_goal, confidence_goal, failures
-    옵션: step(수요 증가 간격), draws/tune(PMC 샘플링 파라미터), save_dir/save_name(저장경로)
+    옵션: step(수요 증가 간격), method("analytic" | "mcmc"), search/tolerance(필요 시험 수 탐색),
+          draws/tune(PMC 샘플링 파라미터),
+          save_dir/save_name(저장경로)
     출력: (filepath, result_json)
     """
     trace = run_example_for_composite_model()
@@ -113,7 +129,8 @@ def run_full_analysis(
     # 1) 필요한 시험 수 계산
     demand_required = int(
         get_number_of_required_demand(
-            trace, pfd_goal=pfd_goal, confidence_goal=confidence_goal
+            trace, pfd_goal=pfd_goal, confidence_goal=confidence_goal,
+            method=method, search=search, tolerance=tolerance,
         )
     )
 
@@ -122,20 +139,12 @@ def run_full_analysis(
     prior_mean = trace.posterior["PFD"].mean().item()
     prior_conf = get_confidence(data=trace.posterior["PFD"], goal=pfd_goal)
 
-    demand_list = list(range(step, demand_required + step, step))
-    pfd_output: List[List[str | float]] = []
-    last_conf = None
-
-    for demand in demand_list:
-        model = demand_model_func(
-            demand=demand, observed_failures=failures, pfd_trace=filtered_pfd_trace
-        )
-        updated_trace = run_sampling(model, draws=draws, tune=tune)
-        updated_mean = updated_trace.posterior["pfd_prior"].mean().item()
-        last_conf = get_confidence(
-            data=updated_trace.posterior["pfd_prior"], goal=pfd_goal
-        )
-        pfd_output.append([str(demand), updated_mean])
+    demand_list = demand_grid(demand_required, step=step)
+    sweep = run_demand_sweep(
+        demand_list, observed_failures=failures, pfd_trace=filtered_pfd_trace,
+        pfd_goal=pfd_goal, method=method, draws=draws, tune=tune,
+    )
+    pfd_output, last_conf = sweep_to_pfd_series(sweep)
 
     result_json: Dict[str, Any] = {
         "input": {
@@ -0,0 +1,145 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+from functools import lru_cache
+
+import numpy as np
+
+from .bbn_utils import histogram_grid
+
+# bump when the artifact layout or the way the grid is computed changes
+generic_artifact_version = 1
+
+generic_var_name = "generic_IC_Total_Remained_Defect"
+default_artifact_bins = 32
+
+base_dir = os.path.join(os.path.dirname(__file__), "examples")
+default_artifact_path = os.path.join(base_dir, "generic_model_artifact.npz")
+default_trace_path = os.path.join(base_dir, "generic_model_trace_data_1000.nc")
+
+summary_stats = ("mean", "std", "min", "max", "p5", "median", "p95")
+
+def artifact_hash(version, bins, x, y, summary):
+    # content hash over the metadata and the exact float64 bytes of the grid
+    digest = hashlib.sha256()
+    digest.update(json.dumps({"version": int(version), "bins": int(bins), "var_name": generic_var_name},
+                             sort_keys=True).encode("utf-8"))
+    for array in (x, y, summary):
+        digest.update(np.ascontiguousarray(array, dtype=np.float64).tobytes())
+    return digest.hexdigest()
+
+def build_generic_artifact(generic_trace, bins=default_artifact_bins):
+    """
+    Precompute what create_composite_model needs from the generic model trace:
+    the pm.Interpolated grid of generic_IC_Total_Remained_Defect (same as from_posterior(..., bins))
+    and summary statistics of the draws.
+    """
+    samples = np.asarray(generic_trace.posterior[generic_var_name].values, dtype=np.float64).ravel()
+    x, y = histogram_grid(samples, bins=bins)
+    summary = np.array([samples.mean(), samples.std(), samples.min(), samples.max(),
+                        *np.percentile(samples, [5, 50, 95])])
+    return {
+        "version": generic_artifact_version,
+        "bins": bins,
+        "x": x,
+        "y": y,
+        "summary": summary,
+        "hash": artifact_hash(generic_artifact_version, bins, x, y, summary),
+    }
+
+def save_generic_artifact(artifact, path=default_artifact_path):
+    # uncompressed: np.load reads it with a single memcpy per array, no NetCDF/xarray parsing.
+    # write-then-rename, so concurrent processes never read a half-written file
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as f:
+        np.savez(f, version=np.int64(artifact["version"]), bins=np.int64(artifact["bins"]),
+                 x=artifact["x"], y=artifact["y"], summary=artifact["summary"], hash=np.array(artifact["hash"]))
+    os.replace(temp_path, path)
+
+def read_generic_artifact(path):
+    with np.load(path) as npz:
+        artifact = {
+            "version": int(npz["version"]),
+            "bins": int(npz["bins"]),
+            "x": npz["x"],
+            "y": npz["y"],
+            "summary": npz["summary"],
+            "hash": str(npz["hash"]),
+        }
+    if artifact["version"] != generic_artifact_version:
+        raise ValueError(f"Generic model artifact {path} has schema version {artifact['version']}, "
+                         f"expected {generic_artifact_version}; rebuild it with convert_generic_trace()")
+    expected = artifact_hash(artifact["version"], artifact["bins"], artifact["x"], artifact["y"], artifact["summary"])
+    if artifact["hash"] != expected:
+        raise ValueError(f"Generic model artifact {path} is corrupted (content hash mismatch)")
+    # shared by every composite model of the process, so nobody may modify it
+    for name in ("x", "y", "summary"):
+        artifact[name].flags.writeable = False
+    return artifact
+
+def convert_generic_trace(trace_path=default_trace_path, artifact_path=default_artifact_path,
+                          bins=default_artifact_bins):
+    # one-off conversion of an existing generic trace NetCDF file
+    import arviz as az
+
+    artifact = build_generic_artifact(az.from_netcdf(trace_path), bins=bins)
+    save_generic_artifact(artifact, artifact_path)
+    print(f"[GENERIC] Saved artifact {artifact_path} (hash={artifact['hash'][:12]})")
+    return artifact
+
+@lru_cache(maxsize=None)
+def load_generic_artifact(path=default_artifact_path):
+    """
+    The generic model artifact, loaded once per process (per path).
+    Falls back to converting the NetCDF trace next to it the first time, if only that exists.
+    """
+    if not os.path.isfile(path) and path == default_artifact_path and os.path.isfile(default_trace_path):
+        convert_generic_trace()
+    artifact = read_generic_artifact(path)
+    stats = ", ".join(f"{name}={value:.4g}" for name, value in zip(summary_stats, artifact["summary"]))
+    print(f"[GENERIC] Loaded {os.path.basename(path)} v{artifact['version']} bins={artifact['bins']} "
+          f"hash={artifact['hash'][:12]} ({stats})")
+    return artifact
+
+def sample_generic_artifact(artifact_path=default_artifact_path, bins=default_artifact_bins, random_seed=0):
+    # samples the generic model (about 10 minutes) when neither the artifact nor its NetCDF trace exists
+    from .bbn_utils import run_sampling
+    from .generic_model import create_generic_model
+
+    generic_trace = run_sampling(model=create_generic_model(), numpyro=True, draws=1000, tune=1000,
+                                 random_seed=random_seed)
+    artifact = build_generic_artifact(generic_trace, bins=bins)
+    save_generic_artifact(artifact, artifact_path)
+    print(f"[GENERIC] Sampled and saved artifact {artifact_path} (hash={artifact['hash'][:12]})")
+    return artifact
+
+def main(argv=None):
+    """
+    Makes sure the artifact exists (image build): keeps a valid one, converts the NetCDF trace if only
+    that exists, and samples the generic model otherwise.
+        cd server
+        python -m bbn_inference.generic_artifact
+    """
+    parser = argparse.ArgumentParser(description="Build the generic model artifact")
+    parser.add_argument("--path", default=default_artifact_path)
+    parser.add_argument("--trace", default=default_trace_path, help="generic model trace (NetCDF) to convert")
+    parser.add_argument("--bins", type=int, default=default_artifact_bins)
+    args = parser.parse_args(argv)
+
+    if os.path.isfile(args.path):
+        try:
+            artifact = read_generic_artifact(args.path)
+            print(f"[GENERIC] Artifact {args.path} is up to date (hash={artifact['hash'][:12]})")
+            return 0
+        except ValueError as e:
+            print(f"[GENERIC] Rebuilding: {e}")
+    if os.path.isfile(args.trace):
+        convert_generic_trace(args.trace, args.path, bins=args.bins)
+    else:
+        sample_generic_artifact(args.path, bins=args.bins)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+import contextvars
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# where span/event records go, one JSON object per line:
+# "stdout" (default, ends up in CloudWatch for the Fargate tasks), "off", or a file path
+metrics_log_env = "METRICS_LOG"
+
+# the innermost open span of the current thread / asyncio task
+current_span = contextvars.ContextVar("current_span", default=None)
+
+def empty_compile_stats():
+    return {"jax_hits": 0, "jax_misses": 0, "jax_saved_seconds": 0.0, "pytensor_hits": 0, "pytensor_compiles": 0}
+
+def empty_span_stats():
+    return {"count": 0, "errors": 0, "total_seconds": 0.0, "max_seconds": 0.0, "last_seconds": 0.0}
+
+def peak_rss_bytes():
+    # peak resident set size of this process (ru_maxrss is in KiB on Linux, bytes on macOS)
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return int(peak if sys.platform == "darwin" else peak * 1024)
+
+class MetricsRegistry:
+    """
+    In-process aggregate of the emitted records, served by /metrics:
+    per span name count / errors / total / max / last seconds, event counts, totals of the sampler
+    statistics and of the compilation cache hits / misses (compile_cache.py).
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.spans = {}
+        self.events = {}
+        self.sampler = {"runs": 0, "divergences": 0, "metropolis_fallbacks": 0, "min_ess": None}
+        self.compile_cache = empty_compile_stats()
+
+    def record_span(self, record):
+        with self.lock:
+            stats = self.spans.setdefault(record["name"], empty_span_stats())
+            stats["count"] += 1
+            stats["errors"] += int("error" in record)
+            stats["total_seconds"] += record["duration"]
+            stats["max_seconds"] = max(stats["max_seconds"], record["duration"])
+            stats["last_seconds"] = record["duration"]
+
+    def record_event(self, name):
+        with self.lock:
+            self.events[name] = self.events.get(name, 0) + 1
+
+    def record_sampler(self, stats):
+        with self.lock:
+            self.sampler["runs"] += 1
+            self.sampler["divergences"] += stats.get("divergences") or 0
+            self.sampler["metropolis_fallbacks"] += int(stats.get("sampler") == "metropolis")
+            if stats.get("ess") is not None:
+                current = self.sampler["min_ess"]
+                self.sampler["min_ess"] = stats["ess"] if current is None else min(current, stats["ess"])
+
+    def record_compile(self, stats):
+        with self.lock:
+            for key, value in stats.items():
+                self.compile_cache[key] += value
+
+    def reset(self):
+        # start a new aggregate (a pooled job process, before each job)
+        with self.lock:
+            self.spans = {}
+            self.events = {}
+            self.sampler = {"runs": 0, "divergences": 0, "metropolis_fallbacks": 0, "min_ess": None}
+            self.compile_cache = empty_compile_stats()
+
+    def merge(self, snapshot):
+        # add the snapshot of another process (e.g. a finished job process)
+        with self.lock:
+            for name, other in snapshot["spans"].items():
+                stats = self.spans.setdefault(name, empty_span_stats())
+                stats["count"] += other["count"]
+                stats["errors"] += other["errors"]
+                stats["total_seconds"] += other["total_seconds"]
+                stats["max_seconds"] = max(stats["max_seconds"], other["max_seconds"])
+                stats["last_seconds"] = other["last_seconds"]
+            for name, count in snapshot["events"].items():
+                self.events[name] = self.events.get(name, 0) + count
+            sampler = snapshot["sampler"]
+            for key in ("runs", "divergences", "metropolis_fallbacks"):
+                self.sampler[key] += sampler[key]
+            if sampler["min_ess"] is not None:
+                current = self.sampler["min_ess"]
+                self.sampler["min_ess"] = sampler["min_ess"] if current is None else min(current, sampler["min_ess"])
+            for key, value in snapshot.get("compile_cache", {}).items():
+                self.compile_cache[key] += value
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                "uptime_seconds": time.time() - self.started,
+                "peak_rss_bytes": peak_rss_bytes(),
+                "spans": {name: dict(stats) for name, stats in self.spans.items()},
+                "events": dict(self.events),
+                "sampler": dict(self.sampler),
+                "compile_cache": dict(self.compile_cache),
+            }
+
+registry = MetricsRegistry()
+log_lock = threading.Lock()
+
+def emit(record):
+    target = os.environ.get(metrics_log_env, "stdout")
+    if target.lower() in ("off", "none", ""):
+        return
+    line = json.dumps(record, default=str)
+    with log_lock:
+        if target.lower() == "stdout":
+            print(line, flush=True)
+        else:
+            with open(target, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+@contextmanager
+def span(name, **attributes):
+    """
+    Timed, nested section of work. Yields the span record, whose "attributes" the body may extend;
+    on exit the record (duration, peak RSS, error if any) is emitted as a JSON line and aggregated.
+    """
+    parent = current_span.get()
+    record = {
+        "type": "span",
+        "name": name,
+        "span_id": uuid.uuid4().hex[:16],
+        "parent_id": parent["span_id"] if parent else None,
+        "trace_id": parent["trace_id"] if parent else uuid.uuid4().hex,
+        "start": time.time(),
+        "attributes": attributes,
+    }
+    token = current_span.set(record)
+    start = time.perf_counter()
+    try:
+        yield record
+    except BaseException as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        current_span.reset(token)
+        record["duration"] = time.perf_counter() - start
+        record["peak_rss_bytes"] = peak_rss_bytes()
+        registry.record_span(record)
+        emit(record)
+
+def event(name, **fields):
+    # point-in-time record inside the current span (e.g. a sampler fallback)
+    parent = current_span.get()
+    registry.record_event(name)
+    emit({
+        "type": "event",
+        "name": name,
+        "span_id": parent["span_id"] if parent else None,
+        "trace_id": parent["trace_id"] if parent else None,
+        "time": time.time(),
+        "fields": fields,
+    })
+
+def record_sampler_stats(stats):
+    # sampler statistics of a finished run (see bbn_utils.sampler_stats), added to the current span
+    parent = current_span.get()
+    if parent is not None:
+        parent["attributes"].update(stats)
+    registry.record_sampler(stats)
+
+def record_compile_stats(stats):
+    # compilation cache hits / misses of a section (see compile_cache.track_compilation), added to the current span
+    parent = current_span.get()
+    if parent is not None:
+        parent["attributes"].update({f"compile_{key}": value for key, value in stats.items()})
+    registry.record_compile(stats)
+
+def metrics_snapshot():
+    return registry.snapshot()
+
+def emit_metrics_summary(**fields):
+    # final aggregate of a worker run, as one JSON line
+    emit({"type": "metrics", "time": time.time(), **fields, **metrics_snapshot()})
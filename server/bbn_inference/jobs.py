@@ -0,0 +1,472 @@
+import json
+import multiprocessing as mp
+import os
+import threading
+import traceback
+import uuid
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from multiprocessing.connection import wait
+
+from .trace_cache import TraceEntry
+from .data import bayesian_data_from_json
+from .instrumentation import span, registry, metrics_snapshot
+
+# same statuses as the DynamoDB jobs table of the Lambda/ECS flow (triggerTask.py, getJobStatus.py)
+PENDING, RUNNING, COMPLETED, FAILED = "PENDING", "RUNNING", "COMPLETED", "FAILED"
+
+default_max_workers = 2
+default_max_finished = 1000
+
+# ---------------- job functions ----------------
+# fn(params, entry, result_dir) -> response data; entry is the TraceEntry of the requested trace.
+# they run inside the API process (synchronous endpoints) or in a job process (/api/jobs).
+# the inference modules (PyMC, PyTensor, ArviZ, SciPy) are imported by the functions on first use,
+# so importing this module (and bbn_inference.api) stays cheap
+
+def build_trace_entry():
+    from .examples.example_for_composite_model import run_cached_composite_model
+    from .trace_store import trace_store_from_env
+
+    # TRACE_CACHE_DIR / TRACE_CACHE_S3_BUCKET 설정 시 영구 trace 저장소도 함께 사용
+    trace, _ = run_cached_composite_model(store=trace_store_from_env())
+    return TraceEntry.from_trace(trace)
+
+def init_trace_job(params, entry, result_dir):
+    print(f"[INIT] trace_id={entry.trace_id}, prior_mean={entry.prior_mean}")
+    return {"prior_mean": entry.prior_mean}
+
+def sensitivity_analysis_job(params, entry, result_dir):
+    from .sensitivity_analysis import required_demand_from_samples
+
+    prior_mean = entry.prior_mean
+    prior_conf = entry.prior_confidence(params["pfd_goal"])
+    num_tests = required_demand_from_samples(
+        entry.filtered_pfd, prior_conf, pfd_goal=params["pfd_goal"], confidence_goal=params["confidence_goal"],
+        method=params["method"], search=params["search"], tolerance=params["tolerance"],
+        adaptive=params.get("adaptive"),
+    )
+
+    print(f"[SENS] trace_id={entry.trace_id}")
+    print(f"[SENS] PFD goal: {params['pfd_goal']}, Confidence goal: {params['confidence_goal']}")
+    print(f"[SENS] Prior PFD mean: {prior_mean}")
+    print(f"[SENS] Required number of tests: {int(num_tests)}")
+    print(f"[SENS] Prior confidence @goal: {prior_conf}")
+
+    return {
+        "num_tests": int(num_tests),
+        "prior_mean": prior_mean,
+        "prior_confidence": prior_conf,
+    }
+
+def update_pfd_job(params, entry, result_dir):
+    from .sensitivity_analysis import run_demand_update, histogram_to_json
+
+    if params["failures"] > params["demand"]:
+        raise ValueError("failures cannot exceed demand")
+
+    updated = run_demand_update(
+        demand=params["demand"],
+        observed_failures=params["failures"],
+        pfd_trace=entry.filtered_pfd,
+        pfd_goal=params["pfd_goal"],
+        method=params["method"],
+        bins=params["histogram_bins"],
+        adaptive=params.get("adaptive"),
+    )
+
+    prior_mean = entry.prior_mean
+    updated_pfd_mean = updated["mean"]
+    before_conf = entry.prior_confidence(params["pfd_goal"])
+    updated_conf = updated["confidence"]
+
+    print(f"[UPD] trace_id={entry.trace_id}, method={params['method']}")
+    print(f"[UPD] Mean of prior PFD: {prior_mean}")
+    print(f"[UPD] Mean of updated PFD: {updated_pfd_mean}")
+    print(f"[UPD] PFD goal: {params['pfd_goal']}")
+    print(f"[UPD] Before testing, confidence level: {before_conf}")
+    print(f"[UPD] Testing results: #test cases: {params['demand']}, #failures: {params['failures']}")
+    print(f"[UPD] After testing, confidence level: {updated_conf}")
+
+    return {
+        "updated_pfd": updated_pfd_mean,
+        "updated_confidence": updated_conf,
+        "prior_confidence": before_conf,
+        "updated_histogram": histogram_to_json(updated["histogram"]),
+        "method": params["method"],
+    }
+
+def full_analysis_demands(params, entry):
+    # (required number of tests, demand points of the curve) of a full analysis
+    from .sensitivity_analysis import required_demand_from_samples, demand_grid
+
+    prior_conf = entry.prior_confidence(params["pfd_goal"])
+    demand_required = required_demand_from_samples(
+        entry.filtered_pfd, prior_conf, pfd_goal=params["pfd_goal"], confidence_goal=params["confidence_goal"],
+        method=params["method"], search=params["search"], tolerance=params["tolerance"],
+        adaptive=params.get("adaptive"),
+    )
+
+    print(f"[FULL] trace_id={entry.trace_id}")
+    print(f"[FULL] Required number of tests: {int(demand_required)}")
+    print(f"[FULL] Prior mean: {entry.prior_mean}, Prior confidence @goal: {prior_conf}")
+    return demand_required, demand_grid(demand_required, step=params["step"])
+
+def save_full_analysis(params, entry, demand_required, sweep, result_dir):
+    # result JSON of the swept curve, written under a unique name; the response data of full_analysis_job
+    from .sensitivity_analysis import sweep_to_pfd_series
+
+    pfd_goal = params["pfd_goal"]
+    pfd_output, last_conf = sweep_to_pfd_series(sweep)
+    print(f"[FULL] Swept {len(pfd_output)} demand points (step={params['step']}, method={params['method']}), final confidence={last_conf}")
+
+    result_json = {
+        "input": {
+            "parameter": {
+                "test_count": int(demand_required),
+                "target": pfd_goal,
+                "prior": {
+                    "distribution": "trace",
+                    "mean": entry.prior_mean,
+                    "confidence": entry.prior_confidence(pfd_goal),
+                },
+                "observed_failures": params["failures"],
+            }
+        },
+        "output": {"pfd": pfd_output, "confidence": last_conf},
+    }
+
+    # 고유 파일명으로 저장 (서버 내부 파일명)
+    public_name = f"{uuid.uuid4()}.json"
+    filepath = os.path.join(result_dir, public_name)
+    with open(filepath, "w", encoding="utf-8") as f:
+        json.dump(result_json, f, indent=2)
+    print(f"[FULL] Saved result to {filepath}")
+
+    return {
+        "filepath": filepath,                               # 서버 내부 경로(로그용)
+        "download_url": f"/api/download/{public_name}",     # 프론트는 이 URL을 사용
+        "result": result_json,
+    }
+
+def full_analysis_job(params, entry, result_dir):
+    from .sensitivity_analysis import run_demand_sweep
+
+    demand_required, demand_list = full_analysis_demands(params, entry)
+    sweep = run_demand_sweep(
+        demand_list, observed_failures=params["failures"], pfd_trace=entry.filtered_pfd,
+        pfd_goal=params["pfd_goal"], method=params["method"], adaptive=params.get("adaptive"),
+    )
+    return save_full_analysis(params, entry, demand_required, sweep, result_dir)
+
+def full_analysis_events(params, entry, result_dir):
+    """
+    full_analysis_job as a stream of events for /api/full-analysis/stream:
+    "start" (required number of tests, prior mean / confidence, number of points), one "point" per
+    demand with its [demand, updated mean, confidence] row as soon as it is computed, and "result" with
+    the data of full_analysis_job. Closing the generator early skips the remaining points and the file.
+    """
+    from .sensitivity_analysis import iter_demand_sweep, sweep_from_points
+
+    demand_required, demand_list = full_analysis_demands(params, entry)
+    yield {
+        "type": "start",
+        "trace_id": entry.trace_id,
+        "test_count": int(demand_required),
+        "prior_mean": entry.prior_mean,
+        "prior_confidence": entry.prior_confidence(params["pfd_goal"]),
+        "points": len(demand_list),
+    }
+
+    points = []
+    for point in iter_demand_sweep(demand_list, observed_failures=params["failures"], pfd_trace=entry.filtered_pfd,
+                                   pfd_goal=params["pfd_goal"], method=params["method"],
+                                   adaptive=params.get("adaptive")):
+        points.append(point)
+        yield {"type": "point", "index": len(points) - 1, "row": list(point)}
+
+    data = save_full_analysis(params, entry, demand_required, sweep_from_points(points), result_dir)
+    yield {"type": "result", "trace_id": entry.trace_id, **data}
+
+def attribute_importance_job(params, entry, result_dir):
+    from .importance import attribute_importance
+
+    # entry is not used: the tornado runs its own forward simulation of params["input"]
+    data = bayesian_data_from_json(params["input"])
+    result = attribute_importance(
+        data, pfd_goal=params["pfd_goal"], attributes=params["attributes"], rank_by=params["rank_by"],
+        draws=params["draws"], random_seed=params["random_seed"],
+    )
+    top = ", ".join(item["attribute"] for item in result["attributes"][:5])
+    print(f"[IMP] {len(result['attributes'])} attributes ranked by {params['rank_by']}, top: {top}")
+    return result
+
+def warm_up_inference():
+    # imports what the job functions import on first use (the first request would otherwise pay for it)
+    with span("inference_import"):
+        from . import sensitivity_analysis, scenarios, importance, composite_model  # noqa: F401
+
+job_functions = {
+    "init-trace": init_trace_job,
+    "sensitivity-analysis": sensitivity_analysis_job,
+    "update-pfd": update_pfd_job,
+    "full-analysis": full_analysis_job,
+    "attribute-importance": attribute_importance_job,
+}
+
+# jobs that do not read the composite model trace (run_job does not build one for them)
+trace_free_jobs = {"attribute-importance"}
+
+def run_job(job_type, params, entry, result_dir, job_id=None):
+    # returns (data, new entry or None); builds the trace first when entry is None
+    with span("job", job_type=job_type, job_id=job_id):
+        new_entry = None
+        if entry is None and job_type not in trace_free_jobs:
+            entry = new_entry = build_trace_entry()
+        return job_functions[job_type](params, entry, result_dir), new_entry
+
+def job_worker_main(conn, warm_up=True):
+    """
+    Entry point of a pooled job process. Runs the jobs JobManager sends, (job_id, job_type, params,
+    entry, result_dir), one at a time until the pipe closes, and answers each with ("ok", data,
+    new entry or None, metrics) or ("error", message, None, metrics), metrics being the job's own
+    metrics. The inference stack, the generic artifact and the compiled composite models
+    (composite_model_for) stay loaded between jobs.
+    """
+    if warm_up:
+        warm_up_inference()
+    while True:
+        try:
+            job_id, job_type, params, entry, result_dir = conn.recv()
+        except (EOFError, OSError):
+            return
+        # the metrics of this job only; the API merges them into its own /metrics
+        registry.reset()
+        try:
+            data, new_entry = run_job(job_type, params, entry, result_dir, job_id)
+            reply = ("ok", data, new_entry, metrics_snapshot())
+        except Exception as e:
+            traceback.print_exc()
+            reply = ("error", f"{type(e).__name__}: {e}", None, metrics_snapshot())
+        try:
+            conn.send(reply)
+        except (BrokenPipeError, OSError):
+            return
+
+class JobWorker:
+    # one pooled job process and the parent end of its pipe
+    def __init__(self, context, warm_up=True):
+        self.conn, child_conn = context.Pipe(duplex=True)
+        self.process = context.Process(target=job_worker_main, args=(child_conn, warm_up),
+                                       name="job-worker", daemon=True)
+        self.process.start()
+        child_conn.close()
+
+    def close(self, terminate=False):
+        if terminate:
+            self.process.terminate()
+        self.conn.close()
+        self.process.join(timeout=5)
+
+# ---------------- job manager ----------------
+
+class JobManager:
+    """
+    Local stand-in for the Lambda -> ECS -> DynamoDB flow.
+    submit() records a PENDING job and returns its id. Jobs run in a pool of at most max_workers
+    spawned worker processes that are reused between jobs, so only the first job of a worker pays for
+    the PyMC import and the composite model compilation. Cancelling a running job terminates its
+    worker, which is replaced by a new one on demand.
+    Records use the DynamoDB item fields (jobId, jobType, jobStatus, createdAt, errorMessage).
+    """
+
+    def __init__(self, trace_cache, result_dir, max_workers=default_max_workers,
+                 max_finished=default_max_finished, context="spawn", warm_up=True):
+        self.trace_cache = trace_cache
+        self.result_dir = result_dir
+        self.max_workers = max_workers
+        self.max_finished = max_finished
+        self.context = mp.get_context(context)
+        self.records = OrderedDict()
+        self.pending = deque()
+        self.warm_up = warm_up
+        self.idle = []  # JobWorkers without a job
+        self.running = {}  # job_id -> JobWorker
+        self.starting = set()  # job ids whose worker slot is reserved while launch() starts them
+        self.lock = threading.Lock()
+        self.wakeup_reader, self.wakeup_writer = mp.Pipe(duplex=False)
+        self.dispatcher = None
+
+    def start(self):
+        with self.lock:
+            if self.dispatcher is None:
+                self.dispatcher = threading.Thread(target=self.dispatch_loop, name="job-dispatcher", daemon=True)
+                self.dispatcher.start()
+
+    def wakeup(self):
+        self.wakeup_writer.send(None)
+
+    def submit(self, job_type, params):
+        if job_type not in job_functions:
+            raise ValueError(f"Unknown job type: {job_type} (expected one of {tuple(job_functions)})")
+        self.start()
+        job_id = str(uuid.uuid4())
+        with self.lock:
+            self.records[job_id] = {
+                "jobId": job_id,
+                "jobType": job_type,
+                "jobStatus": PENDING,
+                "createdAt": datetime.now(timezone.utc).isoformat(),
+                "params": params,
+            }
+            self.pending.append(job_id)
+        self.wakeup()
+        return job_id
+
+    def status(self, job_id):
+        # the record without params/result, like getJobStatus
+        with self.lock:
+            record = self.records.get(job_id)
+            if record is None:
+                return None
+            return {k: v for k, v in record.items() if k not in ("params", "result")}
+
+    def result(self, job_id):
+        with self.lock:
+            record = self.records.get(job_id)
+            return None if record is None else dict(record)
+
+    def list(self):
+        with self.lock:
+            return [{k: v for k, v in record.items() if k not in ("params", "result")}
+                    for record in reversed(self.records.values())]
+
+    def cancel(self, job_id):
+        """
+        Cancel a PENDING or RUNNING job. The job ends as FAILED with errorMessage "Cancelled",
+        the terminal statuses stay the same as in DynamoDB. Returns False for unknown/finished jobs.
+        """
+        with self.lock:
+            record = self.records.get(job_id)
+            if record is None or record["jobStatus"] not in (PENDING, RUNNING):
+                return False
+            if record["jobStatus"] == PENDING:
+                # a job that launch() is starting is not queued any more; launch() stops its worker
+                if job_id in self.pending:
+                    self.pending.remove(job_id)
+            else:
+                # the dispatcher reaps the terminated worker; launch() starts a new one when needed
+                self.running[job_id].process.terminate()
+            self.finish(record, FAILED, error="Cancelled")
+        self.wakeup()
+        return True
+
+    def finish(self, record, status, error=None):
+        record["jobStatus"] = status
+        record["finishedAt"] = datetime.now(timezone.utc).isoformat()
+        if error is not None:
+            record["errorMessage"] = error[:500]  # 최대 500자 (DynamoDB와 동일)
+        # forget the oldest finished jobs
+        finished = [k for k, v in self.records.items() if v["jobStatus"] in (COMPLETED, FAILED)]
+        for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+            del self.records[job_id]
+
+    def reserve(self, job_id):
+        # under self.lock: take the job off the queue and hold a worker slot (an idle worker if there is one)
+        self.starting.add(job_id)
+        while self.idle:
+            worker = self.idle.pop()
+            if worker.process.is_alive():
+                return worker
+            worker.close()
+        return None
+
+    def launch(self, job_id, worker):
+        """
+        Start a reserved job without holding self.lock: spawning a worker takes hundreds of milliseconds
+        and sending the job blocks until the worker has warmed up, so status/list/cancel must not wait
+        for it. The lock is only taken to read the record and to record the handle.
+        """
+        with self.lock:
+            record = self.records.get(job_id)
+            if record is None or record["jobStatus"] != PENDING:
+                # cancelled before it started: the reserved idle worker has no job yet
+                self.starting.discard(job_id)
+                if worker is not None:
+                    self.idle.append(worker)
+                return
+            job_type, params = record["jobType"], record["params"]
+        try:
+            entry = None
+            if job_type not in trace_free_jobs and job_type != "init-trace":
+                entry = self.trace_cache.get(params.get("trace_id"))
+            if worker is None:
+                worker = JobWorker(self.context, warm_up=self.warm_up)
+            worker.conn.send((job_id, job_type, params, entry, self.result_dir))
+        except Exception as e:
+            if worker is not None:
+                worker.close(terminate=True)
+            with self.lock:
+                self.starting.discard(job_id)
+                if record["jobStatus"] == PENDING:
+                    self.finish(record, FAILED, error=f"Failed to start job: {e}")
+            return
+        with self.lock:
+            self.starting.discard(job_id)
+            if record["jobStatus"] != PENDING:
+                # cancelled while it was starting
+                worker.close(terminate=True)
+                return
+            self.running[job_id] = worker
+            record["jobStatus"] = RUNNING
+            record["startedAt"] = datetime.now(timezone.utc).isoformat()
+
+    def collect(self, job_id):
+        worker = self.running.pop(job_id)
+        record = self.records.get(job_id)
+        if record is None or record["jobStatus"] != RUNNING:
+            # cancelled: the worker was terminated
+            worker.close(terminate=True)
+            return
+        try:
+            status, payload, new_entry, metrics = worker.conn.recv()
+        except (EOFError, OSError):
+            worker.close()
+            self.finish(record, FAILED, error=f"Job process exited with code {worker.process.exitcode}")
+            return
+        self.idle.append(worker)
+        # spans / sampler stats of the job process show up in the API's /metrics
+        registry.merge(metrics)
+        if status != "ok":
+            self.finish(record, FAILED, error=payload)
+            return
+        trace_id = record["params"].get("trace_id")
+        if new_entry is not None:
+            trace_id = self.trace_cache.add(new_entry).trace_id
+        record["result"] = {"trace_id": trace_id, "data": payload}
+        if record["jobType"] == "full-analysis":
+            record["resultsPath"] = payload["download_url"]
+        self.finish(record, COMPLETED)
+
+    def dispatch_loop(self):
+        while True:
+            with self.lock:
+                reserved = []
+                while self.pending and len(self.running) + len(self.starting) < self.max_workers:
+                    job_id = self.pending.popleft()
+                    reserved.append((job_id, self.reserve(job_id)))
+            for job_id, worker in reserved:
+                self.launch(job_id, worker)
+
+            with self.lock:
+                waitables = {worker.conn: job_id for job_id, worker in self.running.items()}
+                waitables.update({worker.process.sentinel: job_id for job_id, worker in self.running.items()})
+
+            ready = wait(list(waitables) + [self.wakeup_reader])
+            with self.lock:
+                if self.wakeup_reader in ready:
+                    while self.wakeup_reader.poll():
+                        self.wakeup_reader.recv()
+                for job_id in {waitables[r] for r in ready if r in waitables}:
+                    if job_id in self.running:
+                        self.collect(job_id)
@@ -0,0 +1,165 @@
+import numpy as np
+import pymc as pm
+import pytensor.tensor as pt
+
+from . import bbn_parameter
+from .bbn_parameter import attribute_submodels, phases, defect_density_params, dev_vv_ddp_phases
+from .attribute_posterior import levels, attribute_npt_params
+
+# Table-driven builder of the BBN: every Dev/VV attribute model and every phase of the defect chain
+# is generated from bbn_parameter (attribute_submodels, the *_npt tables, defect_density_params).
+# One vector-valued random variable per block instead of one scalar per attribute and quality level;
+# only the monitored outputs (bbn_utils.monitor_var_names) keep their scalar names.
+# Everything that depends on the input (the NPT entries selected by the attribute states and the
+# complexity, the function point) is a pm.Data container, so a built model serves any input after
+# pm.set_data with the values of attribute_data / chain_data.
+
+def add_coords(model, **coords):
+    for name, values in coords.items():
+        if name not in model.coords:
+            model.add_coord(name, values)
+
+def attribute_block(name, attr_states, prefix="", prior=None, deterministic=True):
+    """
+    Dev/VV attribute model `name` (a key of attribute_submodels) in the current model context:
+    one Beta prior over the quality states H/M/L and one TruncatedNormal matrix (level x attribute)
+    holding the node probability table entries of the given attribute states (pm.Data, see attribute_data).
+    prior reuses the priors of another block (the generic part of the whole model).
+    Returns (prior, post); post[i] is <prefix><phase>_<kind><H/M/L>_post, registered as a
+    Deterministic when deterministic is set.
+    """
+    model = pm.modelcontext(None)
+    spec = attribute_submodels[name]
+    phase = name.split("_")[0]
+    attribute_dim = f"{name}_attribute"
+    add_coords(model, level=list(levels), **{attribute_dim: spec["attributes"]})
+
+    # prior probability of the quality state
+    if prior is None:
+        alpha, beta = np.asarray(spec["priors"], dtype=np.float64).T
+        prior = pm.Beta(f"{name}_prior", alpha=alpha, beta=beta, dims="level")
+
+    # P(attribute state|quality=H/M/L) of every attribute
+    mu, sigma = attribute_npt_params(name, attr_states)
+    mu = pm.Data(f"{prefix}{name}_mu", mu, dims=("level", attribute_dim))
+    sigma = pm.Data(f"{prefix}{name}_sigma", sigma, dims=("level", attribute_dim))
+    like = pm.TruncatedNormal(f"{prefix}{name}_like", mu=mu, sigma=sigma, lower=0, upper=1,
+                              dims=("level", attribute_dim))
+
+    # m1-m3: P(quality=H/M/L)P(attribute states|quality=H/M/L), k = 1 / marginal probability
+    m = prior * pt.prod(like, axis=1)
+    k = 1 / pt.sum(m)
+    post = k * m
+    if deterministic:
+        for i, level in enumerate(levels):
+            pm.Deterministic(f"{prefix}{phase}_{spec['kind']}{level}_post", post[i])
+    return prior, post
+
+def attribute_blocks(attr_states, prefix="", priors=None, deterministic=True):
+    # all ten attribute models; returns (priors, dev_posts, vv_posts), the posts keyed by phase
+    priors = dict(priors or {})
+    posts = {"Dev": {}, "VV": {}}
+    for name, spec in attribute_submodels.items():
+        priors[name], post = attribute_block(name, attr_states, prefix=prefix, prior=priors.get(name),
+                                             deterministic=deterministic)
+        posts[spec["kind"]][name.split("_")[0]] = post
+    return priors, posts["Dev"], posts["VV"]
+
+def attribute_data(attr_states, prefix="", names=None):
+    # pm.set_data values of the attribute models (all of them, or only names) for other attribute states
+    values = {}
+    for name in names or attribute_submodels:
+        values[f"{prefix}{name}_mu"], values[f"{prefix}{name}_sigma"] = attribute_npt_params(name, attr_states)
+    return values
+
+def create_attribute_submodel(name, attr_states):
+    model = pm.Model()
+    with model:
+        attribute_block(name, attr_states)
+    return model
+
+def posterior_means(trace, name):
+    # normalized posterior means (H, M, L) of an attribute submodel trace
+    spec = attribute_submodels[name]
+    phase = name.split("_")[0]
+    means = np.array([trace.posterior[f"{phase}_{spec['kind']}{level}_post"].mean().item() for level in levels])
+    return means / means.sum()
+
+def defect_density_likes():
+    # Defect Density likelihood P(Defect Density|Dev=H/M/L), one Gamma vector per phase
+    model = pm.modelcontext(None)
+    add_coords(model, level=list(levels))
+    likes = {}
+    for phase in phases:
+        alpha, beta = np.asarray(defect_density_params[phase], dtype=np.float64).T
+        likes[phase] = pm.Gamma(f"{phase}_DD_like", alpha=alpha, beta=beta, dims="level")
+    return likes
+
+def ddp_params(phase, which, complexity):
+    """
+    (alpha, beta) of the DDP_<which> likelihood (which: "current" / "previous") at the given complexity,
+    over the V&V level, or over (Dev level, V&V level) for the phases in dev_vv_ddp_phases.
+    """
+    if phase in dev_vv_ddp_phases:
+        table = [[getattr(bbn_parameter, f"{phase}_Dev{dev}_VV{vv}_DDP_{which}_npt")[complexity] for vv in levels]
+                 for dev in levels]
+    else:
+        table = [getattr(bbn_parameter, f"{phase}_VV{vv}_DDP_{which}_npt")[complexity] for vv in levels]
+    table = np.asarray(table, dtype=np.float64)
+    return table[..., 0], table[..., 1]
+
+def chain_data(function_point, complexity, prefix=""):
+    # pm.set_data values of the defect chain for another function point / complexity
+    values = {f"{prefix}function_point": float(function_point)}
+    for phase in phases:
+        for which in ("current", "previous") if phase != phases[0] else ("current",):
+            alpha, beta = ddp_params(phase, which, complexity)
+            values[f"{prefix}{phase}_DDP_{which}_alpha"] = alpha
+            values[f"{prefix}{phase}_DDP_{which}_beta"] = beta
+    return values
+
+def detection_probability(prefix, phase, which, complexity, dev_post, vv_post):
+    alpha, beta = ddp_params(phase, which, complexity)
+    dims = ("level", "vv_level") if phase in dev_vv_ddp_phases else "level"
+    alpha = pm.Data(f"{prefix}{phase}_DDP_{which}_alpha", alpha, dims=dims)
+    beta = pm.Data(f"{prefix}{phase}_DDP_{which}_beta", beta, dims=dims)
+    like = pm.Beta(f"{prefix}{phase}_DDP_{which}_like", alpha=alpha, beta=beta, dims=dims)
+    if phase in dev_vv_ddp_phases:
+        # the integral of P(DDP|Dev, VV) dDev,VV
+        return pt.sum(dev_post[:, None] * vv_post[None, :] * like)
+    # the integral of P(DDP|VV) dVV
+    return pt.sum(vv_post * like)
+
+def defect_chain(dev_posts, vv_posts, function_point, complexity, dd_likes, prefix="", deterministic=True):
+    """
+    Defects introduced and detected phase by phase. dev_posts / vv_posts map every phase to its
+    (H, M, L) quality probabilities (tensors or floats), dd_likes to its defect density likelihood.
+    From the second phase on, the defects remaining from the phase before are detected with DDP_previous.
+    <prefix><phase>_Defect_introduced_in_current and <prefix><phase>_Total_Remained_Defect are
+    Deterministic when deterministic is set; the total of the last phase always is. Returns that total.
+    The function point and the DDP parameters selected by the complexity are pm.Data (see chain_data).
+    """
+    model = pm.modelcontext(None)
+    add_coords(model, level=list(levels), vv_level=list(levels))
+    function_point = pm.Data(f"{prefix}function_point", float(function_point))
+    total = None
+    for phase in phases:
+        dev_post = pt.as_tensor_variable(dev_posts[phase])
+        vv_post = pt.as_tensor_variable(vv_posts[phase])
+
+        # Defect density: the integral of P(Dev)*P(Defect Density|Dev) dDev
+        introduced = function_point * pt.sum(dev_post * dd_likes[phase])
+        if deterministic:
+            introduced = pm.Deterministic(f"{prefix}{phase}_Defect_introduced_in_current", introduced)
+
+        ddp_current = detection_probability(prefix, phase, "current", complexity, dev_post, vv_post)
+        remained = introduced - introduced * ddp_current
+        # since there's no phase before the SR phase
+        if total is not None:
+            ddp_previous = detection_probability(prefix, phase, "previous", complexity, dev_post, vv_post)
+            remained = remained + (total - total * ddp_previous)
+
+        if deterministic or phase == phases[-1]:
+            remained = pm.Deterministic(f"{prefix}{phase}_Total_Remained_Defect", remained)
+        total = remained
+    return total
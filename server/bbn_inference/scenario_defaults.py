@@ -0,0 +1,8 @@
+# Sizes and limits of the scenario / importance forward simulations (scenarios.py, importance.py).
+# Kept apart from scenarios.py, which needs PyMC and SciPy: the API request schemas read them at import time.
+
+# forward draws of the composite model per scenario; the NUTS runs use 1000
+default_scenario_draws = 20000
+# scenarios evaluated together in one vectorized pass (bounds the (scenarios, draws) arrays)
+default_chunk_size = 32
+max_scenarios = 200
@@ -0,0 +1,176 @@
+import numpy as np
+from scipy import stats
+
+from .attribute_posterior import attribute_submodel_means, submodel_seeds, default_draws
+from .bbn_parameter import attribute_submodels, phases, defect_density_params, dev_vv_ddp_phases, generic_sfp_params
+from .generic_artifact import load_generic_artifact
+from .instrumentation import span
+from .model_builder import ddp_params
+from .scenario_defaults import default_scenario_draws, default_chunk_size, max_scenarios
+from .sensitivity_analysis import required_demand_from_samples
+
+# same labels as bbn_utils.func_dict
+quantile_labels = {"5%": 0.05, "median": 0.5, "95%": 0.95}
+
+def interpolated_ppf(x, y, u, refine=16):
+    # inverse CDF of pm.Interpolated(x, y), whose pdf is linear between the grid points
+    x = np.asarray(x, dtype=np.float64)
+    fine_x = np.linspace(x[0], x[-1], (len(x) - 1) * refine + 1)
+    fine_y = np.interp(fine_x, x, y)
+    cdf = np.concatenate([[0.0], np.cumsum((fine_y[1:] + fine_y[:-1]) / 2 * np.diff(fine_x))])
+    return np.interp(u * cdf[-1], cdf, fine_x)
+
+def likelihood_samples(complexities, generic_grid, draws=default_scenario_draws, rng=None):
+    """
+    Draws of every input-independent random variable of the composite model: the defect density and
+    DDP likelihoods (the latter for each of the given complexities), generic_SFP and
+    generic_number_of_defects. All scenarios share these draws (common random numbers), so differences
+    between scenarios are not blurred by independent sampling noise. The uniforms are drawn in a fixed
+    order and mapped by inverse CDF, so the draws of one complexity do not depend on the others.
+    """
+    rng = np.random.default_rng(rng)
+    likes = {}
+    for phase in phases:
+        ddp_shape = (draws, 3, 3) if phase in dev_vv_ddp_phases else (draws, 3)
+        alpha, beta = np.asarray(defect_density_params[phase], dtype=np.float64).T
+        likes[f"{phase}_DD"] = stats.gamma.ppf(rng.random((draws, 3)), alpha, scale=1 / beta)
+        for which in ("current", "previous") if phase != phases[0] else ("current",):
+            u = rng.random(ddp_shape)
+            for complexity in set(complexities):
+                likes[f"{phase}_DDP_{which}", complexity] = stats.beta.ppf(u, *ddp_params(phase, which, complexity))
+
+    likes["generic_SFP"] = np.exp(generic_sfp_params["mu"]
+                                  + generic_sfp_params["sigma"] * stats.norm.ppf(rng.random(draws)))
+    likes["generic_number_of_defects"] = interpolated_ppf(*generic_grid, rng.random(draws))
+    return likes
+
+def detection_probability_samples(likes, phase, which, complexities, dev, vv):
+    # the integral of P(DDP|VV) dVV (or over Dev and VV) of every scenario, shape (scenarios, draws)
+    p = np.empty((len(complexities), likes[f"{phase}_DD"].shape[0]))
+    for complexity in np.unique(complexities):
+        like = likes[f"{phase}_DDP_{which}", complexity]
+        rows = complexities == complexity
+        if phase in dev_vv_ddp_phases:
+            p[rows] = np.einsum("dij,ni,nj->nd", like, dev[rows], vv[rows])
+        else:
+            p[rows] = vv[rows] @ like.T
+    return p
+
+def composite_forward_samples(post_means, function_points, complexities, likes):
+    """
+    Forward (Monte Carlo) sampling of the composite model for many scenarios at once in NumPy.
+    The composite model has no observed data, so its posterior is the joint prior and NUTS only
+    reproduces these draws. post_means maps every attribute submodel to its (scenarios, 3) normalized
+    posterior means, likes holds the shared draws of likelihood_samples.
+    Returns {"<phase>_Total_Remained_Defect": ..., "PFD": ...}, each (scenarios, draws).
+    """
+    function_points = np.asarray(function_points, dtype=np.float64)[:, None]
+    complexities = np.asarray(complexities)
+
+    samples = {}
+    total = None
+    for phase in phases:
+        dev, vv = post_means[f"{phase}_Dev"], post_means[f"{phase}_VV"]
+
+        # Defect density: the integral of P(Dev)*P(Defect Density|Dev) dDev
+        introduced = function_points * (dev @ likes[f"{phase}_DD"].T)
+
+        detection = detection_probability_samples(likes, phase, "current", complexities, dev, vv)
+        remained = introduced - introduced * detection
+        # since there's no phase before the SR phase
+        if total is not None:
+            detection = detection_probability_samples(likes, phase, "previous", complexities, dev, vv)
+            remained = remained + (total - total * detection)
+        total = samples[f"{phase}_Total_Remained_Defect"] = remained
+
+    samples["PFD"] = likes["generic_SFP"] / likes["generic_number_of_defects"] * total
+    return samples
+
+def scenario_post_means(scenarios, submodel_draws=default_draws, random_seed=None):
+    """
+    (scenarios, 3) normalized posterior means of every attribute submodel. Each submodel is evaluated
+    once per distinct combination of its own attribute states, always with the same seed, so scenarios
+    that only differ in one attribute share the other nine submodels exactly.
+    """
+    seeds = submodel_seeds(random_seed)
+    post_means = {name: np.empty((len(scenarios), 3)) for name in attribute_submodels}
+    evaluated = {}
+    for i, data in enumerate(scenarios):
+        for name, spec in attribute_submodels.items():
+            key = (name, tuple(data.attr_states[f"{code}_state"] for code in spec["attributes"]))
+            if key not in evaluated:
+                evaluated[key] = attribute_submodel_means(name, data.attr_states, draws=submodel_draws,
+                                                          rng=np.random.default_rng(seeds[name]))
+            post_means[name][i] = evaluated[key]
+    return post_means
+
+def pfd_summary(pfd, pfd_goal=None, confidence_goal=None):
+    # mean of the outlier-filtered draws (as TraceEntry.prior_mean), quantiles and confidence of all draws
+    filtered = pfd[np.abs(stats.zscore(pfd)) < 3]
+    summary = {
+        "pfd_mean": float(filtered.mean()),
+        "pfd_quantiles": {label: float(np.quantile(pfd, q)) for label, q in quantile_labels.items()},
+        "confidence": None,
+        "num_tests": None,
+    }
+    if pfd_goal is not None:
+        summary["confidence"] = float(np.count_nonzero(pfd <= pfd_goal) / pfd.size)
+        if confidence_goal is not None:
+            summary["num_tests"] = int(required_demand_from_samples(filtered, summary["confidence"], pfd_goal,
+                                                                    confidence_goal))
+    return summary
+
+def evaluate_scenarios(scenarios, labels=None, pfd_goal=None, confidence_goal=None,
+                       draws=default_scenario_draws, submodel_draws=default_draws, random_seed=None,
+                       generic_artifact=None, chunk_size=default_chunk_size):
+    """
+    What-if evaluation of many BayesianData inputs (e.g. one attribute flipped, another function point)
+    in one vectorized pass that shares the generic model artifact and the random numbers.
+    Returns one entry per scenario with the PFD mean, quantiles, the confidence at pfd_goal and,
+    when confidence_goal is also given, the number of tests required to reach it.
+    """
+    if not scenarios:
+        raise ValueError("No scenarios given")
+    if len(scenarios) > max_scenarios:
+        raise ValueError(f"Too many scenarios: {len(scenarios)} (at most {max_scenarios})")
+    labels = labels or [None] * len(scenarios)
+    if len(labels) != len(scenarios):
+        raise ValueError("labels and scenarios differ in length")
+
+    with span("scenarios", scenarios=len(scenarios), draws=draws):
+        generic_artifact = generic_artifact or load_generic_artifact()
+        generic_grid = (generic_artifact["x"], generic_artifact["y"])
+        # the composite draws get their own child seed next to the ten submodel seeds
+        composite_seed = np.random.SeedSequence(random_seed).spawn(len(attribute_submodels) + 1)[-1]
+
+        with span("scenario_submodels"):
+            post_means = scenario_post_means(scenarios, submodel_draws=submodel_draws, random_seed=random_seed)
+
+        with span("scenario_likelihoods"):
+            likes = likelihood_samples([data.complexity for data in scenarios], generic_grid, draws=draws,
+                                       rng=np.random.default_rng(composite_seed))
+
+        results = []
+        for start in range(0, len(scenarios), chunk_size):
+            chunk = slice(start, start + chunk_size)
+            with span("scenario_chunk", start=start, size=len(scenarios[chunk])):
+                samples = composite_forward_samples(
+                    {name: means[chunk] for name, means in post_means.items()},
+                    [data.function_point for data in scenarios[chunk]],
+                    [data.complexity for data in scenarios[chunk]],
+                    likes)
+            for i, data in enumerate(scenarios[chunk]):
+                results.append({
+                    "label": labels[start + i],
+                    "function_point": data.function_point,
+                    "complexity": data.complexity,
+                    "total_remained_defect_mean": float(samples[f"{phases[-1]}_Total_Remained_Defect"][i].mean()),
+                    **pfd_summary(samples["PFD"][i], pfd_goal, confidence_goal),
+                })
+
+    return {
+        "draws": draws,
+        "random_seed": random_seed,
+        "generic_artifact": generic_artifact["hash"],
+        "scenarios": results,
+    }
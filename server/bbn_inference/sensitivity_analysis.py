@@ -2,6 +2,16 @@ import pymc as pm
 import numpy as np
 from scipy import stats
 from .bbn_utils import run_sampling, from_posterior
+from .empirical_cdf import EmpiricalCDF
+from .errors import UnreachableGoalError
+from .instrumentation import span, event
+
+# "analytic": importance reweighting of the prior PFD draws (deterministic, fast)
+# "mcmc": pm.Interpolated prior + Binomial likelihood sampled with run_sampling (cross-check)
+update_methods = ("analytic", "mcmc")
+
+# PFD samples are clipped into (0, 1) before taking logs of the Binomial likelihood
+pfd_eps = 1e-300
 
 def filter_outsiders(data, threshold=3):
     z_scores = stats.zscore(data[0])
@@ -15,49 +25,376 @@ def demand_model_func(demand, observed_failures, pfd_trace):
         failures = pm.Binomial("failures", n=demand, p=pfd_prior, observed=observed_failures)
     return demand_model
 
+class DemandModel:
+    """
+    demand_model_func built once per PFD prior: demand and observed_failures are pm.Data,
+    and the NUTS step (with its compiled logp/gradient) is created once, so every new demand
+    point only swaps the data values and samples. pm.sample resets the step's tuning per run.
+    """
+
+    def __init__(self, pfd_trace, bins=1000):
+        self.model = pm.Model()
+        with self.model:
+            demand = pm.Data("demand", 0)
+            observed_failures = pm.Data("observed_failures", 0)
+            pfd_prior = from_posterior("pfd_prior", pfd_trace, bins=bins)
+            failures = pm.Binomial("failures", n=demand, p=pfd_prior, observed=observed_failures)
+            _, self.step = pm.init_nuts(init="adapt_diag", chains=1, target_accept=0.9)
+
+    def sample(self, demand, observed_failures, draws=2000, tune=500, random_seed=None, adaptive=None):
+        # adaptive: targets of run_sampling's adaptive mode (ESS / MCSE of the confidence), see bbn_utils
+        with self.model:
+            pm.set_data({"demand": demand, "observed_failures": observed_failures})
+        if adaptive is not None:
+            adaptive = {"var_names": ["pfd_prior"], **adaptive}
+        return run_sampling(self.model, draws=draws, tune=tune, random_seed=random_seed, step=self.step,
+                            adaptive=adaptive)
+
+# one-off query; for repeated queries on the same draws build an EmpiricalCDF once
 def get_confidence(data, goal):
     return np.count_nonzero(data <= goal) / data["draw"].size
 
+def check_update_method(method):
+    if method not in update_methods:
+        raise ValueError(f"Unknown update method: {method} (expected one of {update_methods})")
+
+def pfd_samples(pfd_trace):
+    # flatten xarray/ndarray PFD draws into a float64 vector
+    if hasattr(pfd_trace, "values"):
+        pfd_trace = pfd_trace.values
+    return np.asarray(pfd_trace, dtype=np.float64).ravel()
+
+def binomial_log_weights(samples, demand, observed_failures):
+    # log of the Binomial likelihood up to a constant: k*log(p) + (n-k)*log(1-p)
+    p = np.clip(samples, pfd_eps, 1 - 1e-16)
+    return observed_failures * np.log(p) + (demand - observed_failures) * np.log1p(-p)
+
+def normalize_log_weights(log_weights):
+    weights = np.exp(log_weights - np.max(log_weights, axis=-1, keepdims=True))
+    return weights / weights.sum(axis=-1, keepdims=True)
+
+def analytic_demand_update(demand, observed_failures, pfd_trace, pfd_goal=None, bins=1000):
+    """
+    Exact Binomial update of a sample-based PFD prior.
+    Every prior draw p_i gets the weight (1-p_i)^(n-k) * p_i^k, so the posterior is the
+    reweighted prior and no sampling is needed.
+    Returns the posterior mean, the confidence at pfd_goal (None if no goal is given),
+    the reweighted histogram (density, bin edges) and the weighted EmpiricalCDF.
+    """
+    samples = pfd_samples(pfd_trace)
+    weights = normalize_log_weights(binomial_log_weights(samples, demand, observed_failures))
+
+    confidence = None
+    if pfd_goal is not None:
+        confidence = float(weights[samples <= pfd_goal].sum())
+    density, edges = np.histogram(samples, bins=bins, weights=weights, density=True)
+
+    return {
+        "mean": float(np.dot(weights, samples)),
+        "confidence": confidence,
+        "histogram": {"density": density, "edges": edges},
+        "cdf": EmpiricalCDF(samples, weights=weights),
+    }
+
+def run_demand_update(demand, observed_failures, pfd_trace, pfd_goal=None, method="analytic",
+                      draws=2000, tune=500, bins=1000, demand_model=None, adaptive=None):
+    """
+    Update the PFD prior with #demand tests and #observed_failures failures.
+    method="analytic" uses analytic_demand_update, method="mcmc" samples a DemandModel
+    (pass demand_model to reuse one across calls, adaptive to sample until the confidence
+    MCSE / ESS targets are met) and is kept as a cross-check.
+    Both return the same dictionary.
+    """
+    check_update_method(method)
+    if method == "analytic":
+        return analytic_demand_update(demand, observed_failures, pfd_trace, pfd_goal=pfd_goal, bins=bins)
+
+    demand_model = demand_model or DemandModel(pfd_trace)
+    if adaptive is not None and pfd_goal is not None:
+        adaptive = {"goal": pfd_goal, **adaptive}
+    demand_trace = demand_model.sample(demand, observed_failures, draws=draws, tune=tune, adaptive=adaptive)
+    posterior = demand_trace.posterior["pfd_prior"]
+    cdf = EmpiricalCDF(posterior)
+    confidence = None
+    if pfd_goal is not None:
+        confidence = cdf.confidence(pfd_goal)
+    density, edges = np.histogram(cdf.samples, bins=bins, density=True)
+    return {
+        "mean": posterior.mean().item(),
+        "confidence": confidence,
+        "histogram": {"density": density, "edges": edges},
+        "cdf": cdf,
+    }
+
+def demand_grid(demand_required, step=500):
+    # demand points of the full-analysis curve: step, 2*step, ... up to demand_required (rounded up)
+    return list(range(step, int(demand_required) + step, step))
+
+def analytic_demand_sweep(demands, observed_failures, pfd_trace, pfd_goal=None, chunk_size=1024):
+    """
+    analytic_demand_update for a whole grid of demands in one pass.
+    Builds a (demands x samples) log-weight matrix; rows are processed chunk_size at a time
+    to bound memory, so dense grids (e.g. every 10 demands) cost the same matrix products.
+    Returns arrays of posterior means and confidences (None without a goal), aligned with demands.
+    """
+    samples = pfd_samples(pfd_trace)
+    p = np.clip(samples, pfd_eps, 1 - 1e-16)
+    log_p, log_q = np.log(p), np.log1p(-p)
+    below_goal = None if pfd_goal is None else (samples <= pfd_goal).astype(np.float64)
+
+    demands = np.asarray(demands, dtype=np.float64)
+    means = np.empty(demands.size)
+    confidences = None if pfd_goal is None else np.empty(demands.size)
+    for start in range(0, demands.size, chunk_size):
+        n = demands[start:start + chunk_size, None]
+        weights = normalize_log_weights(observed_failures * log_p + (n - observed_failures) * log_q)
+        means[start:start + chunk_size] = weights @ samples
+        if below_goal is not None:
+            confidences[start:start + chunk_size] = weights @ below_goal
+
+    return {"demands": demands.astype(np.int64), "means": means, "confidences": confidences}
+
+def run_demand_sweep(demands, observed_failures, pfd_trace, pfd_goal=None, method="analytic",
+                     draws=2000, tune=500, adaptive=None):
+    """
+    Posterior mean / confidence for every demand in demands.
+    method="analytic" is a single vectorized pass (analytic_demand_sweep),
+    method="mcmc" samples one compiled DemandModel per point (with adaptive: until the sampling targets are met).
+    """
+    check_update_method(method)
+    if method == "analytic":
+        # one vectorized pass, so a single span covers all points
+        with span("demand_sweep", method=method, points=len(demands)):
+            return analytic_demand_sweep(demands, observed_failures, pfd_trace, pfd_goal=pfd_goal)
+
+    means, confidences = [], []
+    with span("demand_sweep", method=method, points=len(demands)):
+        demand_model = DemandModel(pfd_trace)
+        for demand in demands:
+            with span("demand_point", demand=demand, method=method):
+                updated = run_demand_update(demand=demand, observed_failures=observed_failures,
+                                            pfd_trace=pfd_trace, pfd_goal=pfd_goal, method=method,
+                                            draws=draws, tune=tune, demand_model=demand_model,
+                                            adaptive=adaptive)
+            print(f"Demand={demand} → PFD={updated['mean']}, Confidence={updated['confidence']}")
+            means.append(updated["mean"])
+            confidences.append(updated["confidence"])
+    return {
+        "demands": np.asarray(demands, dtype=np.int64),
+        "means": np.asarray(means, dtype=np.float64),
+        "confidences": None if pfd_goal is None else np.asarray(confidences, dtype=np.float64),
+    }
+
+# points per pass of the streamed analytic sweep (iter_demand_sweep)
+stream_block_size = 64
+
+def iter_demand_sweep(demands, observed_failures, pfd_trace, pfd_goal=None, method="analytic",
+                      draws=2000, tune=500, block_size=stream_block_size, adaptive=None):
+    """
+    run_demand_sweep one point at a time, for streaming responses: yields (demand, posterior mean,
+    confidence or None) as soon as each point is computed, and stopping the iteration skips the rest.
+    method="analytic" computes block_size points per analytic_demand_sweep pass.
+    """
+    check_update_method(method)
+    if method == "analytic":
+        samples = pfd_samples(pfd_trace)
+        for start in range(0, len(demands), block_size):
+            block = demands[start:start + block_size]
+            with span("demand_sweep", method=method, points=len(block), streamed=True):
+                sweep = analytic_demand_sweep(block, observed_failures, samples, pfd_goal=pfd_goal)
+            for i, demand in enumerate(sweep["demands"]):
+                confidence = None if sweep["confidences"] is None else float(sweep["confidences"][i])
+                yield int(demand), float(sweep["means"][i]), confidence
+        return
+
+    demand_model = DemandModel(pfd_trace)
+    for demand in demands:
+        with span("demand_point", demand=demand, method=method, streamed=True):
+            updated = run_demand_update(demand=demand, observed_failures=observed_failures,
+                                        pfd_trace=pfd_trace, pfd_goal=pfd_goal, method=method,
+                                        draws=draws, tune=tune, demand_model=demand_model, adaptive=adaptive)
+        print(f"Demand={demand} → PFD={updated['mean']}, Confidence={updated['confidence']}")
+        yield int(demand), float(updated["mean"]), updated["confidence"]
+
+def sweep_from_points(points):
+    # run_demand_sweep's result from the (demand, mean, confidence) points of iter_demand_sweep
+    demands, means, confidences = zip(*points) if points else ((), (), ())
+    return {
+        "demands": np.asarray(demands, dtype=np.int64),
+        "means": np.asarray(means, dtype=np.float64),
+        "confidences": None if None in confidences else np.asarray(confidences, dtype=np.float64),
+    }
+
+def sweep_to_pfd_series(sweep):
+    # [[demand(str), updated mean], ...] rows of the full-analysis result JSON and the last confidence
+    pfd_output = [[str(int(d)), float(m)] for d, m in zip(sweep["demands"], sweep["means"])]
+    last_conf = None
+    if sweep["confidences"] is not None and len(sweep["confidences"]) > 0:
+        last_conf = float(sweep["confidences"][-1])
+    return pfd_output, last_conf
+
+def histogram_to_json(histogram):
+    return {
+        "density": histogram["density"].tolist(),
+        "edges": histogram["edges"].tolist(),
+    }
+
 max_demand = 25000
 demand_interval = 1000
 demand_start = 1000
 max_trial = 10 # used to prevent infinite loop
 
-def get_number_of_required_demand(trace, pfd_goal, confidence_goal):
+# "bisect": bracket + bisection on the monotone confidence(n) curve, no upper limit on demand
+# "linear": walk demand_start, demand_start + demand_interval, ... up to max_demand and interpolate
+search_modes = ("bisect", "linear")
+max_doublings = 60 # bracket growth limit: demand_start * 2**60 is far beyond any realistic test campaign
+# draws / tune of every method="mcmc" demand point of both search modes, so bisect and linear agree
+search_draws = 1000
+search_tune = 1000
+
+def search_required_demand(pfd_trace, pfd_goal, confidence_goal, tolerance=10, method="analytic", adaptive=None):
+    """
+    Smallest number of failure-free demands n (within tolerance) with confidence(n) >= confidence_goal.
+    With zero failures the update reweights the prior by (1-p)^n, which moves mass monotonically
+    towards small PFD, so confidence(n) is non-decreasing and can be bracketed by doubling and then
+    bisected in O(log n) evaluations.
+    With method="mcmc" confidence(n) is a Monte Carlo estimate and only monotone up to its MCSE, so
+    the bisection returns a crossing of the noisy curve: its error grows where confidence(n) is flat
+    near confidence_goal. Evaluated points that contradict monotonicity are reported as a
+    "non_monotone_confidence" event; pass adaptive with an mcse_confidence target to bound the noise.
+    """
+    check_update_method(method)
+    if tolerance < 1:
+        raise ValueError("tolerance must be at least one demand")
+
+    # sorted once: the draws at or below the goal are then a prefix of length goal_index
+    prior = EmpiricalCDF(pfd_trace)
+    goal_index = np.searchsorted(prior.samples, pfd_goal, side="right")
+    if goal_index == 0:
+        # the posterior concentrates on the smallest prior draw as n grows, so the goal is never reached
+        raise UnreachableGoalError(f"PFD goal {pfd_goal} is below every prior PFD sample; no number of demands reaches it")
+
+    demand_model = DemandModel(pfd_trace) if method == "mcmc" else None
+    evaluated = {}
+
+    def confidence_at(demand):
+        with span("demand_point", demand=demand, method=method) as point:
+            if method == "analytic":
+                weights = normalize_log_weights(binomial_log_weights(prior.samples, demand, 0))
+                confidence = float(weights[:goal_index].sum())
+            else:
+                confidence = run_demand_update(demand=demand, observed_failures=0, pfd_trace=pfd_trace,
+                                               pfd_goal=pfd_goal, method=method, draws=search_draws,
+                                               tune=search_tune, demand_model=demand_model,
+                                               adaptive=adaptive)["confidence"]
+            point["attributes"]["confidence"] = confidence
+        print(f"number of demands: {demand}, confidence: {confidence}")
+        evaluated[demand] = confidence
+        return confidence
+
+    if confidence_at(0) >= confidence_goal:
+        return 0
+
+    print("Sensitivity Analysis start!")
+    low, high = 0, demand_start
+    doublings = 0
+    while confidence_at(high) < confidence_goal:
+        low, high = high, high * 2
+        doublings += 1
+        if doublings > max_doublings:
+            raise UnreachableGoalError(f"confidence goal {confidence_goal} not reached within {high} demands")
+
+    while high - low > tolerance:
+        middle = (low + high) // 2
+        if confidence_at(middle) >= confidence_goal:
+            high = middle
+        else:
+            low = middle
+    if method == "mcmc":
+        check_monotone(evaluated, method)
+    print("Sensitivity Analysis finished!")
+    return high
+
+def check_monotone(evaluated, method):
+    # warn when a larger demand got a lower confidence than a smaller one (MCMC noise, see search_required_demand)
+    demands = sorted(evaluated)
+    inversions = [(a, b) for a, b in zip(demands, demands[1:]) if evaluated[b] < evaluated[a]]
+    if inversions:
+        print(f"[WARNING] confidence(n) is not monotone at {inversions}; the required demand is only as precise as the confidence estimates")
+        event("non_monotone_confidence", method=method, inversions=len(inversions))
+
+def get_number_of_required_demand(trace, pfd_goal, confidence_goal, method="analytic", search="bisect", tolerance=10,
+                                  adaptive=None):
     # filter out outliers for interpolation
     filtered_pfd_trace = filter_outsiders(trace.posterior["PFD"])
-
     # confidence level of pfd trace obtained from BBN model
     original_confidence = get_confidence(trace.posterior["PFD"], pfd_goal)
+    return required_demand_from_samples(filtered_pfd_trace, original_confidence, pfd_goal, confidence_goal,
+                                        method=method, search=search, tolerance=tolerance, adaptive=adaptive)
+
+def required_demand_from_samples(filtered_pfd_trace, original_confidence, pfd_goal, confidence_goal,
+                                 method="analytic", search="bisect", tolerance=10, adaptive=None):
+    # get_number_of_required_demand on already filtered PFD samples (e.g. a TraceEntry of the API cache)
+    # adaptive: sampling targets of the method="mcmc" demand updates (see bbn_utils.default_sampling_targets)
+    check_update_method(method)
+    if search not in search_modes:
+        raise ValueError(f"Unknown search mode: {search} (expected one of {search_modes})")
+
+    with span("sensitivity_search", method=method, search=search, tolerance=tolerance) as record:
+        if search == "bisect":
+            demand = search_required_demand(filtered_pfd_trace, pfd_goal, confidence_goal,
+                                            tolerance=tolerance, method=method, adaptive=adaptive)
+        else:
+            demand = linear_search_required_demand(filtered_pfd_trace, original_confidence, pfd_goal,
+                                                   confidence_goal, method=method, adaptive=adaptive)
+        record["attributes"]["demand"] = float(demand)
+    return demand
 
+def linear_search_required_demand(filtered_pfd_trace, original_confidence, pfd_goal, confidence_goal,
+                                  method="analytic", adaptive=None):
+    # legacy walk: demand_start, demand_start + demand_interval, ... up to max_demand, then interpolate
     demand_traces = [] # used for debugging
     demands = []
     max_confidence = original_confidence
     confidence_levels = []
     means = []
 
+    demand_model = DemandModel(filtered_pfd_trace) if method == "mcmc" else None
+    if adaptive is not None:
+        adaptive = {"goal": pfd_goal, **adaptive}
     demand = demand_start
     print("Sensitivity Analysis start!")
     while demand <= max_demand:
-        print("number of demands: ", demand)
-        demands.append(demand)
-        confidence = 0
-        trial = 0
-        while confidence < max_confidence:
-            demand_trace = run_sampling(model=demand_model_func(demand=demand, observed_failures=0, pfd_trace=filtered_pfd_trace))
-            confidence = get_confidence(demand_trace.posterior["pfd_prior"], pfd_goal)
-            print("confidence: ", confidence)
-            max_confidence = max(confidence, max_confidence)
-            trial += 1
-            if trial == max_trial:
+        with span("demand_point", demand=demand, method=method) as point:
+            print("number of demands: ", demand)
+            demands.append(demand)
+            if method == "analytic":
+                # deterministic, so no re-sampling is needed
+                result = analytic_demand_update(demand=demand, observed_failures=0, pfd_trace=filtered_pfd_trace, pfd_goal=pfd_goal)
+                confidence = result["confidence"]
+                print("confidence: ", confidence)
+                confidence_levels.append(confidence)
+                means.append(result["mean"])
+            else:
+                confidence = 0
+                trial = 0
+                while confidence < max_confidence:
+                    demand_trace = demand_model.sample(demand, 0, draws=search_draws, tune=search_tune,
+                                                       adaptive=adaptive)
+                    confidence = get_confidence(demand_trace.posterior["pfd_prior"], pfd_goal)
+                    print("confidence: ", confidence)
+                    max_confidence = max(confidence, max_confidence)
+                    trial += 1
+                    if trial == max_trial:
+                        break
+                confidence_levels.append(confidence)
+                means.append(demand_trace.posterior["pfd_prior"].mean().item())
+                demand_traces.append(demand_trace)
+            point["attributes"]["confidence"] = confidence
+            if confidence == confidence_goal:
+                return demand
+            if confidence > confidence_goal:
                 break
-        confidence_levels.append(confidence)
-        means.append(demand_trace.posterior["pfd_prior"].mean().item())
-        demand_traces.append(demand_trace)
-        if confidence == confidence_goal:
-            return demand
-        if confidence > confidence_goal:
-            break
         demand += demand_interval
     print("Sensitivity Analysis finished!")
 
@@ -68,4 +405,4 @@ def get_number_of_required_demand(trace, pfd_goal, confidence_goal):
         if level > confidence_goal and index >= 1:
             return ((confidence_goal - confidence_levels[index-1]) / (level - confidence_levels[index-1]) * demand_interval) + demands[index-1]
 
-    return max_demand
\ No newline at end of file
+    return max_demand
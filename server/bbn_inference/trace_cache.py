@@ -0,0 +1,121 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+import numpy as np
+
+from .empirical_cdf import EmpiricalCDF
+
+default_max_entries = 32
+default_max_bytes = 256 * 1024 ** 2
+default_ttl_seconds = 3600
+
+class TraceEntry:
+    """
+    Compact form of a composite trace: only what the API handlers read.
+    filtered_pfd feeds the demand updates, the EmpiricalCDF of all PFD draws answers
+    prior confidence / quantile queries. Plain arrays, so entries can be sent to job processes.
+    """
+
+    def __init__(self, trace_id, filtered_pfd, pfd):
+        self.trace_id = trace_id
+        self.filtered_pfd = np.ascontiguousarray(filtered_pfd, dtype=np.float64)
+        self.cdf = pfd if isinstance(pfd, EmpiricalCDF) else EmpiricalCDF(pfd)
+        self.prior_mean = self.cdf.mean
+        self.created = time.monotonic()
+
+    @classmethod
+    def from_trace(cls, trace, trace_id=None):
+        # imported here: sensitivity_analysis needs PyMC, and the API imports this module at startup
+        from .sensitivity_analysis import filter_outsiders
+
+        pfd = trace.posterior["PFD"]
+        return cls(trace_id or str(uuid.uuid4()), filter_outsiders(pfd), EmpiricalCDF(pfd))
+
+    @property
+    def nbytes(self):
+        return self.filtered_pfd.nbytes + self.cdf.nbytes
+
+    def prior_confidence(self, pfd_goal):
+        # same as get_confidence(trace.posterior["PFD"], pfd_goal)
+        return self.cdf.confidence(pfd_goal)
+
+class TraceCache:
+    """
+    Thread-safe LRU cache of TraceEntry keyed by trace_id, bounded by entry count,
+    total array bytes and age (ttl_seconds; None disables expiry).
+    """
+
+    def __init__(self, max_entries=default_max_entries, max_bytes=default_max_bytes,
+                 ttl_seconds=default_ttl_seconds):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def expired(self, entry, now):
+        return self.ttl_seconds is not None and now - entry.created > self.ttl_seconds
+
+    def remove(self, trace_id):
+        entry = self.entries.pop(trace_id)
+        self.total_bytes -= entry.nbytes
+        return entry
+
+    def get(self, trace_id):
+        if not trace_id:
+            return None
+        with self.lock:
+            entry = self.entries.get(trace_id)
+            if entry is not None and self.expired(entry, time.monotonic()):
+                self.remove(trace_id)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(trace_id)
+            self.hits += 1
+            return entry
+
+    def add(self, entry):
+        with self.lock:
+            if entry.trace_id in self.entries:
+                self.remove(entry.trace_id)
+            # the age counts from insertion, entries may come from another process
+            entry.created = time.monotonic()
+            self.entries[entry.trace_id] = entry
+            self.total_bytes += entry.nbytes
+            self.evict()
+        return entry
+
+    def evict(self):
+        now = time.monotonic()
+        for trace_id in [k for k, v in self.entries.items() if self.expired(v, now)]:
+            self.remove(trace_id)
+            self.expirations += 1
+        # the newest entry is always kept, even if it alone exceeds max_bytes
+        while len(self.entries) > 1 and (len(self.entries) > self.max_entries or self.total_bytes > self.max_bytes):
+            _, entry = self.entries.popitem(last=False)
+            self.total_bytes -= entry.nbytes
+            self.evictions += 1
+
+    def stats(self):
+        with self.lock:
+            return {
+                "entries": len(self.entries),
+                "bytes": self.total_bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
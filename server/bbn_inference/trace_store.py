@@ -0,0 +1,250 @@
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import arviz as az
+import numpy as np
+
+# bump when the composite model or the stored layout changes so old entries are never reused
+trace_store_version = 2
+
+# only PFD is read by the sensitivity / update / full-analysis stages
+cached_var_names = ("PFD",)
+
+default_max_entries = 256
+default_max_bytes = 2 * 1024 ** 3
+
+def trace_cache_key(data, settings):
+    """
+    Content address of a composite-model trace: sha256 of the canonical JSON of
+    function_point, complexity, attr_states and the sampler settings.
+    """
+    payload = {
+        "version": trace_store_version,
+        "function_point": data.function_point,
+        "complexity": data.complexity,
+        "attr_states": {name: int(state) for name, state in data.attr_states.items()},
+        "settings": settings,
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+class TraceKeyMismatch(ValueError):
+    # a readable entry written under another key (or, for checkpoints, other job parameters)
+    pass
+
+def trace_to_npz_bytes(trace, key):
+    buffer = io.BytesIO()
+    arrays = {name: np.asarray(trace.posterior[name].values, dtype=np.float64) for name in cached_var_names}
+    np.savez_compressed(buffer, __key__=np.array(key), **arrays)
+    return buffer.getvalue()
+
+def trace_from_npz_bytes(blob, key):
+    with np.load(io.BytesIO(blob)) as npz:
+        if str(npz["__key__"]) != key:
+            raise TraceKeyMismatch(f"Trace cache entry does not match its key: {key}")
+        # arrays are stored as (chain, draw), the layout az.from_dict expects
+        return az.from_dict(posterior={name: npz[name] for name in cached_var_names})
+
+class LocalTraceStore:
+    """
+    NPZ entries in a local directory. Reads touch the file mtime, so evicting the
+    oldest mtimes first is LRU.
+    """
+
+    def __init__(self, directory, max_entries=default_max_entries, max_bytes=default_max_bytes):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, key):
+        return os.path.join(self.directory, f"{key}.npz")
+
+    def get(self, key):
+        path = self.path(key)
+        try:
+            with open(path, "rb") as f:
+                blob = f.read()
+        except FileNotFoundError:
+            return None
+        os.utime(path)
+        return trace_from_npz_bytes(blob, key)
+
+    def put(self, key, trace):
+        # write-then-rename so concurrent readers never see a partial file
+        path = self.path(key)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(trace_to_npz_bytes(trace, key))
+        os.replace(temp_path, path)
+        self.evict()
+
+    def entries(self):
+        # [(last access, size, path)] oldest first
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".npz"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, os.path.join(self.directory, name)))
+        return sorted(entries)
+
+    def evict(self):
+        entries = self.entries()
+        total_bytes = sum(size for _, size, _ in entries)
+        while entries and (len(entries) > self.max_entries or total_bytes > self.max_bytes):
+            _, size, path = entries.pop(0)
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total_bytes -= size
+
+class S3TraceStore:
+    """
+    NPZ entries under an S3 (or S3-compatible) prefix. A hit copies the object onto
+    itself to refresh LastModified, so evicting the oldest LastModified first is LRU.
+    """
+
+    def __init__(self, bucket, prefix="trace-cache/", max_entries=default_max_entries,
+                 max_bytes=default_max_bytes, s3_client=None, region_name=None, endpoint_url=None):
+        import boto3
+
+        self.bucket = bucket
+        self.prefix = prefix if prefix.endswith("/") else f"{prefix}/"
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.s3 = s3_client or boto3.client("s3", region_name=region_name, endpoint_url=endpoint_url)
+
+    def object_key(self, key):
+        return f"{self.prefix}{key}.npz"
+
+    def get(self, key):
+        from botocore.exceptions import ClientError
+
+        object_key = self.object_key(key)
+        try:
+            blob = self.s3.get_object(Bucket=self.bucket, Key=object_key)["Body"].read()
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+                return None
+            raise
+        try:
+            self.s3.copy_object(Bucket=self.bucket, Key=object_key,
+                                CopySource={"Bucket": self.bucket, "Key": object_key},
+                                Metadata={"last-access": str(time.time())}, MetadataDirective="REPLACE")
+        except ClientError as e:
+            print(f"[TRACE CACHE] Failed to refresh access time of {object_key}: {e}")
+        return trace_from_npz_bytes(blob, key)
+
+    def put(self, key, trace):
+        self.s3.put_object(Bucket=self.bucket, Key=self.object_key(key), Body=trace_to_npz_bytes(trace, key),
+                           ContentType="application/octet-stream")
+        self.evict()
+
+    def entries(self):
+        entries = []
+        paginator = self.s3.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=self.prefix):
+            for item in page.get("Contents", []):
+                if item["Key"].endswith(".npz"):
+                    entries.append((item["LastModified"], item["Size"], item["Key"]))
+        return sorted(entries)
+
+    def evict(self):
+        entries = self.entries()
+        total_bytes = sum(size for _, size, _ in entries)
+        while entries and (len(entries) > self.max_entries or total_bytes > self.max_bytes):
+            _, size, object_key = entries.pop(0)
+            self.s3.delete_object(Bucket=self.bucket, Key=object_key)
+            total_bytes -= size
+
+class MemoryTraceStore:
+    """
+    The most recently used traces of this process (PFD only, like the persistent stores), in front of
+    an optional persistent store: hits skip the NPZ download, misses fall through and are kept.
+    Used by long-lived workers, where a one-shot task would not live long enough to benefit.
+    """
+
+    def __init__(self, max_entries, backing=None):
+        self.max_entries = max_entries
+        self.backing = backing
+        self.traces = OrderedDict()
+        self.lock = threading.Lock()
+
+    def remember(self, key, trace):
+        trace = az.from_dict(posterior={name: trace.posterior[name].values for name in cached_var_names})
+        with self.lock:
+            self.traces[key] = trace
+            self.traces.move_to_end(key)
+            while len(self.traces) > self.max_entries:
+                self.traces.popitem(last=False)
+        return trace
+
+    def get(self, key):
+        with self.lock:
+            if key in self.traces:
+                self.traces.move_to_end(key)
+                return self.traces[key]
+        trace = self.backing.get(key) if self.backing is not None else None
+        if trace is not None:
+            self.remember(key, trace)
+        return trace
+
+    def put(self, key, trace):
+        self.remember(key, trace)
+        if self.backing is not None:
+            self.backing.put(key, trace)
+
+# one MemoryTraceStore per persistent store configuration, kept for the lifetime of the process
+memory_stores = {}
+memory_stores_lock = threading.Lock()
+
+def trace_store_from_env(environ=None):
+    """
+    TRACE_CACHE_S3_BUCKET (+ TRACE_CACHE_S3_PREFIX, TRACE_CACHE_S3_ENDPOINT) selects the S3 store,
+    otherwise TRACE_CACHE_DIR selects the local store. Returns None when neither is set.
+    TRACE_CACHE_MAX_ENTRIES / TRACE_CACHE_MAX_BYTES bound both stores.
+    TRACE_CACHE_MEMORY_ENTRIES > 0 puts a process-wide MemoryTraceStore in front (also without a
+    persistent store); repeated calls with the same settings return the same instance.
+    """
+    environ = os.environ if environ is None else environ
+    max_entries = int(environ.get("TRACE_CACHE_MAX_ENTRIES", default_max_entries))
+    max_bytes = int(environ.get("TRACE_CACHE_MAX_BYTES", default_max_bytes))
+    memory_entries = int(environ.get("TRACE_CACHE_MEMORY_ENTRIES", 0))
+
+    bucket = environ.get("TRACE_CACHE_S3_BUCKET")
+    directory = environ.get("TRACE_CACHE_DIR")
+    if bucket:
+        config = ("s3", bucket, environ.get("TRACE_CACHE_S3_PREFIX", "trace-cache/"),
+                  environ.get("TRACE_CACHE_S3_ENDPOINT") or None, max_entries, max_bytes)
+    elif directory:
+        config = ("local", directory, max_entries, max_bytes)
+    else:
+        config = None
+
+    if memory_entries > 0:
+        with memory_stores_lock:
+            key = (memory_entries, config)
+            if key not in memory_stores:
+                memory_stores[key] = MemoryTraceStore(memory_entries, persistent_trace_store(config, environ))
+            return memory_stores[key]
+    return persistent_trace_store(config, environ)
+
+def persistent_trace_store(config, environ):
+    if config is None:
+        return None
+    if config[0] == "s3":
+        _, bucket, prefix, endpoint_url, max_entries, max_bytes = config
+        return S3TraceStore(bucket, prefix=prefix, max_entries=max_entries, max_bytes=max_bytes,
+                            region_name=environ.get("AWS_REGION"), endpoint_url=endpoint_url)
+    _, directory, max_entries, max_bytes = config
+    return LocalTraceStore(directory, max_entries=max_entries, max_bytes=max_bytes)
@@ -0,0 +1,69 @@
+"""
+Import-time budget of the API server.
+
+    cd server
+    python -m benchmarks.bench_import
+    python -m benchmarks.bench_import --budget 1.5 --repeat 5
+
+main.py must start without the inference stack: bbn_inference imports PyMC, PyTensor, ArviZ, JAX and
+SciPy on first use (or in the API_WARMUP background thread). Every repetition imports main in a fresh
+interpreter; exits with 1 if the median import time exceeds --budget seconds or if any of the heavy
+modules was imported. Like the pipeline benchmark, the budget is machine specific.
+tests/test_import_budget.py runs the same check for main and bbn_inference.api under pytest.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+default_budget = 2.0
+default_repeat = 3
+
+# modules main.py must not import (the inference stack)
+heavy_modules = ("pymc", "pytensor", "arviz", "jax", "numpyro", "scipy")
+
+probe = """
+import importlib, json, sys, time
+start = time.perf_counter()
+importlib.import_module(sys.argv[1])
+seconds = time.perf_counter() - start
+heavy = sorted(name for name in json.loads(sys.argv[2]) if name in sys.modules)
+print(json.dumps({"seconds": seconds, "heavy": heavy}))
+"""
+
+server_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def import_main(module="main"):
+    # {"seconds": import time of module in a fresh interpreter, "heavy": heavy modules it imported}
+    env = {**os.environ, "API_WARMUP": "false", "METRICS_LOG": "off"}
+    output = subprocess.run([sys.executable, "-W", "ignore", "-c", probe, module, json.dumps(heavy_modules)],
+                            cwd=server_dir, env=env, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check the import time of the API server (main.py)")
+    parser.add_argument("--budget", type=float, default=default_budget, help="maximum median import time [s]")
+    parser.add_argument("--repeat", type=int, default=default_repeat, help="fresh interpreters to time")
+    args = parser.parse_args(argv)
+
+    runs = [import_main() for _ in range(args.repeat)]
+    seconds = statistics.median(run["seconds"] for run in runs)
+    heavy = sorted({name for run in runs for name in run["heavy"]})
+    print(f"[BENCH] import main: median {seconds:.3f}s, min {min(run['seconds'] for run in runs):.3f}s "
+          f"(budget {args.budget:.3f}s, {args.repeat} runs)")
+
+    failed = False
+    if heavy:
+        print(f"[BENCH] main.py imported the inference stack: {', '.join(heavy)}")
+        failed = True
+    if seconds > args.budget:
+        print(f"[BENCH] Import time {seconds:.3f}s exceeds the budget of {args.budget:.3f}s")
+        failed = True
+    if not failed:
+        print("[BENCH] Within budget")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,289 @@
+"""
+Stage-by-stage benchmark of the BBN inference pipeline.
+
+    cd server
+    python -m benchmarks.bench_pipeline --size reduced --save benchmarks/baseline.json
+    python -m benchmarks.bench_pipeline --size reduced --compare benchmarks/baseline.json --threshold 0.25
+
+Every stage runs with fixed seeds, so two runs do the same work and only the timings differ.
+--save writes the results as a JSON baseline, --compare times the stages again and exits with 1
+if any stage got slower than baseline * (1 + threshold) (stages faster than --min-seconds are ignored).
+Baselines are machine specific: compare against one recorded on the same machine / container.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+
+benchmark_version = 1
+
+# draws/tune of every sampling stage; "full" matches the production settings
+sizes = {
+    "reduced": {
+        "submodel_draws": 200, "submodel_tune": 200,
+        "generic_draws": 200, "generic_tune": 200,
+        "composite_draws": 300, "composite_tune": 300,
+        "demand_draws": 300, "demand_tune": 200,
+        "analytic_draws": 5000,
+    },
+    "full": {
+        "submodel_draws": 1000, "submodel_tune": 1000,
+        "generic_draws": 1000, "generic_tune": 1000,
+        "composite_draws": 1000, "composite_tune": 1000,
+        "demand_draws": 2000, "demand_tune": 500,
+        "analytic_draws": 20000,
+    },
+}
+
+default_seed = 20240601
+default_threshold = 0.25
+default_min_seconds = 0.05
+
+# inputs of the sensitivity / full-analysis stages (the example values of the API)
+pfd_goal = 1e-4
+confidence_goal = 0.95
+observed_failures = 0
+sweep_step = 500
+
+def time_call(func, repeat=1):
+    # (last result, list of wall times); the result is kept so later stages can use it
+    times = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return result, times
+
+def stage_record(times, **extra):
+    return {
+        "seconds": statistics.median(times),
+        "min_seconds": min(times),
+        "repeat": len(times),
+        **extra,
+    }
+
+def generic_grid(size, seed, results, repeat, path=None):
+    """
+    (x, pdf) grid of the generic model. The given artifact (default: the one next to the examples)
+    is timed when it exists; otherwise the generic model is sampled at the benchmark size into a
+    temporary artifact.
+    """
+    import arviz as az
+    from bbn_inference.bbn_utils import run_sampling
+    from bbn_inference.generic_artifact import (
+        build_generic_artifact, save_generic_artifact, read_generic_artifact,
+        default_artifact_path, default_trace_path,
+    )
+    from bbn_inference.generic_model import create_generic_model
+
+    path = path or default_artifact_path
+    if not os.path.isfile(path):
+        model = create_generic_model()
+        trace, times = time_call(lambda: run_sampling(model, True, draws=size["generic_draws"],
+                                                      tune=size["generic_tune"], random_seed=seed))
+        results["generic_sample"] = stage_record(times, draws=size["generic_draws"], tune=size["generic_tune"])
+        path = os.path.join(tempfile.mkdtemp(prefix="bbn-bench-"), "generic_model_artifact.npz")
+        save_generic_artifact(build_generic_artifact(trace), path)
+
+    if os.path.isfile(default_trace_path):
+        _, times = time_call(lambda: az.from_netcdf(default_trace_path), repeat)
+        results["generic_load_netcdf"] = stage_record(times)
+    # read_generic_artifact bypasses the per-process cache of load_generic_artifact
+    artifact, times = time_call(lambda: read_generic_artifact(path), repeat)
+    results["generic_load_artifact"] = stage_record(times, bins=artifact["bins"])
+    return artifact
+
+def run_benchmarks(size_name="reduced", seed=default_seed, repeat=3, stages=None, generic_artifact=None):
+    """
+    Time every stage of the pipeline in order; stages (a list of name prefixes) restricts
+    which results are kept, but earlier stages still run when a later one needs their output.
+    """
+    from bbn_inference import composite_model
+    from bbn_inference.attribute_posterior import attribute_submodel_traces, submodel_seeds
+    from bbn_inference.bbn_parameter import attribute_submodels
+    from bbn_inference.bbn_utils import run_sampling
+    from bbn_inference.data import nrc_report_data
+    from bbn_inference.sensitivity_analysis import (
+        get_number_of_required_demand, demand_model_func, filter_outsiders,
+        run_demand_update, run_demand_sweep, demand_grid,
+    )
+
+    size = sizes[size_name]
+    data = nrc_report_data()
+    results = {}
+
+    # 1) the ten attribute submodels: builder, NUTS sampling and the analytic replacement
+    seeds = {name: int(s.generate_state(1)[0]) for name, s in submodel_seeds(seed).items()}
+    for name in attribute_submodels:
+        builder = getattr(composite_model, f"create_{name}_model")
+        model, times = time_call(lambda: builder(data.attr_states), repeat)
+        results[f"submodel_build.{name}"] = stage_record(times)
+        _, times = time_call(lambda: run_sampling(model, True, draws=size["submodel_draws"],
+                                                  tune=size["submodel_tune"], random_seed=seeds[name]))
+        results[f"submodel_sample.{name}"] = stage_record(times, draws=size["submodel_draws"],
+                                                          tune=size["submodel_tune"])
+    traces, times = time_call(lambda: attribute_submodel_traces(data.attr_states, draws=size["analytic_draws"],
+                                                                random_seed=seed), repeat)
+    results["submodel_analytic"] = stage_record(times, draws=size["analytic_draws"])
+
+    # 2) generic model
+    artifact = generic_grid(size, seed, results, repeat, path=generic_artifact)
+
+    # 3) composite model
+    def build_composite():
+        return composite_model.create_composite_model(
+            **{f"{name}_trace": traces[name] for name in attribute_submodels},
+            generic_trace=None, function_point=data.function_point, complexity=data.complexity,
+            interpolation_bins=artifact["bins"], generic_grid=(artifact["x"], artifact["y"]))
+    model, times = time_call(build_composite, repeat)
+    results["composite_build"] = stage_record(times)
+    trace, times = time_call(lambda: run_sampling(model, draws=size["composite_draws"],
+                                                  tune=size["composite_tune"], random_seed=seed))
+    results["composite_sample"] = stage_record(times, draws=size["composite_draws"], tune=size["composite_tune"])
+
+    # 4) sensitivity analysis
+    demand_required, times = time_call(lambda: get_number_of_required_demand(
+        trace, pfd_goal=pfd_goal, confidence_goal=confidence_goal), repeat)
+    results["required_demand"] = stage_record(times, demand=int(demand_required))
+
+    # 5) one demand update: the original demand_model_func path and the analytic update
+    filtered_pfd_trace = filter_outsiders(trace.posterior["PFD"])
+    demand = max(int(demand_required), sweep_step)
+    def mcmc_update():
+        return run_sampling(demand_model_func(demand, observed_failures, filtered_pfd_trace),
+                            draws=size["demand_draws"], tune=size["demand_tune"], random_seed=seed)
+    _, times = time_call(mcmc_update)
+    results["demand_update_mcmc"] = stage_record(times, demand=demand, draws=size["demand_draws"],
+                                                 tune=size["demand_tune"])
+    _, times = time_call(lambda: run_demand_update(demand, observed_failures, filtered_pfd_trace,
+                                                   pfd_goal=pfd_goal), repeat)
+    results["demand_update_analytic"] = stage_record(times, demand=demand)
+
+    # 6) full-analysis sweep over the demand grid
+    demands = demand_grid(demand, step=sweep_step)
+    _, times = time_call(lambda: run_demand_sweep(demands, observed_failures, filtered_pfd_trace,
+                                                  pfd_goal=pfd_goal), repeat)
+    results["full_analysis_sweep"] = stage_record(times, points=len(demands))
+
+    if stages:
+        results = {name: record for name, record in results.items()
+                   if any(name.startswith(prefix) for prefix in stages)}
+    return results
+
+def environment_info():
+    import pymc as pm
+    import pytensor
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "pymc": pm.__version__,
+        "pytensor": pytensor.__version__,
+    }
+
+def make_report(results, size_name, seed, repeat):
+    return {
+        "version": benchmark_version,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "size": size_name,
+        "seed": seed,
+        "repeat": repeat,
+        "environment": environment_info(),
+        "stages": results,
+    }
+
+def compare_reports(baseline, current, threshold=default_threshold, min_seconds=default_min_seconds):
+    """
+    Per-stage ratio current / baseline of the median time. A stage regressed when the ratio is
+    above 1 + threshold and it takes at least min_seconds (shorter stages are mostly noise).
+    Returns (rows, regressions); stages missing on either side are listed with ratio None.
+    """
+    rows = []
+    regressions = []
+    names = list(baseline["stages"]) + [n for n in current["stages"] if n not in baseline["stages"]]
+    for name in names:
+        old = baseline["stages"].get(name)
+        new = current["stages"].get(name)
+        row = {"stage": name, "baseline": old and old["seconds"], "current": new and new["seconds"],
+               "ratio": None, "regressed": False}
+        if old and new and old["seconds"] > 0:
+            row["ratio"] = new["seconds"] / old["seconds"]
+            row["regressed"] = row["ratio"] > 1 + threshold and new["seconds"] >= min_seconds
+        if row["regressed"]:
+            regressions.append(name)
+        rows.append(row)
+    return rows, regressions
+
+def format_seconds(value):
+    return "-" if value is None else f"{value:.4f}"
+
+def print_comparison(rows, threshold):
+    print(f"{'stage':<40} {'baseline':>10} {'current':>10} {'ratio':>7}")
+    for row in rows:
+        ratio = "-" if row["ratio"] is None else f"{row['ratio']:.2f}"
+        flag = "  REGRESSION" if row["regressed"] else ""
+        print(f"{row['stage']:<40} {format_seconds(row['baseline']):>10} "
+              f"{format_seconds(row['current']):>10} {ratio:>7}{flag}")
+    print(f"(threshold: +{threshold:.0%})")
+
+def print_results(results):
+    print(f"{'stage':<40} {'median [s]':>10} {'min [s]':>10}")
+    for name, record in results.items():
+        print(f"{name:<40} {record['seconds']:>10.4f} {record['min_seconds']:>10.4f}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the BBN inference pipeline stage by stage")
+    parser.add_argument("--size", choices=sorted(sizes), default="reduced")
+    parser.add_argument("--seed", type=int, default=default_seed)
+    parser.add_argument("--repeat", type=int, default=3, help="repetitions of the non-sampling stages")
+    parser.add_argument("--stages", nargs="*", help="keep only stages starting with these prefixes")
+    parser.add_argument("--generic-artifact", help="generic model artifact to use (default: the one in examples/)")
+    parser.add_argument("--save", help="write the results to this JSON baseline file")
+    parser.add_argument("--compare", help="compare against this JSON baseline file")
+    parser.add_argument("--threshold", type=float, default=default_threshold,
+                        help="allowed slowdown per stage (0.25 = 25%%)")
+    parser.add_argument("--min-seconds", type=float, default=default_min_seconds,
+                        help="stages faster than this are never flagged")
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("size") != args.size:
+            print(f"[BENCH] Baseline was recorded with --size {baseline.get('size')}, using it")
+            args.size = baseline["size"]
+        args.seed = baseline.get("seed", args.seed)
+
+    results = run_benchmarks(args.size, seed=args.seed, repeat=args.repeat, stages=args.stages,
+                             generic_artifact=args.generic_artifact)
+    report = make_report(results, args.size, args.seed, args.repeat)
+    print_results(results)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"[BENCH] Saved baseline to {args.save}")
+
+    if baseline is not None:
+        rows, regressions = compare_reports(baseline, report, args.threshold, args.min_seconds)
+        print_comparison(rows, args.threshold)
+        if regressions:
+            print(f"[BENCH] {len(regressions)} stage(s) regressed: {', '.join(regressions)}")
+            return 1
+        print("[BENCH] No regressions")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
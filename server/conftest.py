@@ -0,0 +1 @@
+# makes the bbn_inference package importable from tests/ (pytest puts this directory on sys.path)
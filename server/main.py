@@ -1,18 +1,34 @@
 # server/main.py
 
 import os
+import threading
 import urllib3
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
+# COMPILE_CACHE_DIR: PyTensor compiledir / JAX 영구 컴파일 캐시 (PyMC import 전에 설정, 작업 프로세스도 상속)
+from bbn_inference.compile_cache import configure_compile_cache
+configure_compile_cache()
+
 from auth.api import router as auth_router
 from content.api import router as content_router
-from bbn_inference.api import router as full_analysis_router
+from bbn_inference.api import router as full_analysis_router, warm_up as warm_up_inference
+from bbn_inference.instrumentation import metrics_snapshot
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-app = FastAPI()
+# ------ 추론 모듈 warm-up ------
+# bbn_inference는 PyMC 등을 첫 요청 때 import함. API_WARMUP=true면 시작 직후 백그라운드에서 미리 import
+# (시작은 기다리지 않고, warm-up 중 들어온 추론 요청은 import가 끝날 때까지 대기)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if os.environ.get("API_WARMUP", "false").lower() == "true":
+        threading.Thread(target=warm_up_inference, name="inference-warmup", daemon=True).start()
+    yield
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -32,3 +48,10 @@ app.mount("/result_json", StaticFiles(directory=RESULT_DIR), name="result_json")
 app.include_router(auth_router)
 app.include_router(content_router)
 app.include_router(full_analysis_router, prefix="/api")
+
+# ------ 계측 ------
+# span별 횟수/시간, 샘플러 통계(divergence, ESS, Metropolis fallback), peak RSS
+# (작업 프로세스의 값은 작업이 끝날 때 합산됨)
+@app.get("/metrics")
+def metrics():
+    return metrics_snapshot()
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+from fastapi import HTTPException
+
+from bbn_inference import api
+from bbn_inference.trace_cache import TraceEntry
+
+
+@pytest.fixture
+def prior_entry(monkeypatch):
+    samples = np.random.default_rng(0).beta(1, 2000, 5000)
+    entry = TraceEntry("test", samples, samples)
+    monkeypatch.setattr(api, "_get_trace", lambda trace_id: entry)
+    return entry
+
+
+def test_unreachable_pfd_goal_is_a_client_error(prior_entry):
+    with pytest.raises(HTTPException) as error:
+        api.sensitivity_analysis(api.SensitivityInput(pfd_goal=1e-12, confidence_goal=0.95))
+    assert error.value.status_code == 400
+    assert "below every prior PFD sample" in error.value.detail
+
+    with pytest.raises(HTTPException) as error:
+        api.run_full_analysis(api.FullAnalysisInput(pfd_goal=1e-12, confidence_goal=0.95, failures=0))
+    assert error.value.status_code == 400
+
+
+def test_internal_value_error_is_a_server_error(prior_entry, monkeypatch):
+    def broken_job(params, entry, result_dir):
+        raise ValueError("operands could not be broadcast together")
+
+    monkeypatch.setattr(api, "sensitivity_analysis_job", broken_job)
+    with pytest.raises(HTTPException) as error:
+        api.sensitivity_analysis(api.SensitivityInput(pfd_goal=1e-3, confidence_goal=0.95))
+    assert error.value.status_code == 500
+
+
+def test_reachable_goal(prior_entry):
+    response = api.sensitivity_analysis(api.SensitivityInput(pfd_goal=1e-3, confidence_goal=0.9))
+    assert response["data"]["num_tests"] > 0
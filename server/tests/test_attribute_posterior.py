@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from bbn_inference import composite_model
+from bbn_inference.attribute_posterior import attribute_submodel_means, levels
+from bbn_inference.bbn_parameter import attribute_submodels
+from bbn_inference.bbn_utils import run_sampling
+from bbn_inference.data import generic_data, nrc_report_data
+
+# (H, M, L) posterior means of <phase>_<kind>{H,M,L}_post from the original hand-written
+# create_<name>_model submodels (before the table-driven model_builder), NUTS with 4 chains x 10000
+# draws (tune 2000), rounded to 4 decimals. Fixed numbers, so a change to bbn_parameter or
+# model_builder that moves a submodel is caught even when the analytic path moves with it.
+baseline_means = {
+    "nrc_report_data": {
+        "SR_Dev": [0.0004, 0.969, 0.0306],
+        "SR_VV": [0.0, 0.3252, 0.6748],
+        "SD_Dev": [0.0, 0.9993, 0.0007],
+        "SD_VV": [0.0, 0.0458, 0.9542],
+        "IM_Dev": [0.0, 0.979, 0.021],
+        "IM_VV": [0.0, 0.0001, 0.9999],
+        "ST_Dev": [0.0004, 0.976, 0.0235],
+        "ST_VV": [0.0, 0.0004, 0.9996],
+        "IC_Dev": [0.0149, 0.9827, 0.0023],
+        "IC_VV": [0.0052, 0.9937, 0.0011],
+    },
+    "generic_data": {
+        "SR_Dev": [0.0001, 0.9999, 0.0001],
+        "SR_VV": [0.0, 1.0, 0.0],
+        "SD_Dev": [0.0, 1.0, 0.0],
+        "SD_VV": [0.0, 1.0, 0.0],
+        "IM_Dev": [0.0, 1.0, 0.0],
+        "IM_VV": [0.0, 1.0, 0.0],
+        "ST_Dev": [0.0003, 0.9996, 0.0],
+        "ST_VV": [0.0001, 0.9998, 0.0001],
+        "IC_Dev": [0.0149, 0.9827, 0.0023],
+        "IC_VV": [0.0052, 0.9937, 0.0011],
+    },
+}
+attr_state_sets = {"nrc_report_data": nrc_report_data, "generic_data": generic_data}
+
+# the forward sampling (20000 draws) stays well inside this
+analytic_tolerance = 0.01
+# a short NUTS run has a Monte Carlo error of roughly 0.01 on these normalized means
+nuts_tolerance = 0.03
+
+
+@pytest.mark.parametrize("data_set", list(baseline_means))
+@pytest.mark.parametrize("name", list(attribute_submodels))
+def test_analytic_submodel_means_match_baseline(data_set, name):
+    # submodel_method="analytic" against the hand-written submodels
+    attr_states = attr_state_sets[data_set]().attr_states
+    analytic = np.array(attribute_submodel_means(name, attr_states, rng=0))
+
+    np.testing.assert_allclose(analytic, baseline_means[data_set][name], atol=analytic_tolerance)
+
+
+@pytest.mark.parametrize("name", list(attribute_submodels))
+def test_model_builder_submodel_means_match_baseline(name):
+    # NUTS on the table-driven create_<name>_model against the hand-written submodels
+    attr_states = nrc_report_data().attr_states
+    model = getattr(composite_model, f"create_{name}_model")(attr_states)
+    trace = run_sampling(model, True, draws=500, tune=500, random_seed=0)
+    spec = attribute_submodels[name]
+    phase = name.split("_")[0]
+    nuts = np.array([trace.posterior[f"{phase}_{spec['kind']}{level}_post"].mean().item() for level in levels])
+    nuts = nuts / nuts.sum()
+
+    np.testing.assert_allclose(nuts, baseline_means["nrc_report_data"][name], atol=nuts_tolerance)
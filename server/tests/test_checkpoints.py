@@ -0,0 +1,46 @@
+import arviz as az
+import numpy as np
+import pytest
+
+from bbn_inference.checkpoints import JobCheckpoints, LocalCheckpointStore
+
+
+def pfd_trace(seed=0):
+    return az.from_dict(posterior={"PFD": np.random.default_rng(seed).beta(1, 2000, size=(1, 100))})
+
+
+def checkpoints(directory, params=None):
+    return JobCheckpoints(LocalCheckpointStore(str(directory), "job"), params or {"pfd_goal": 1e-4})
+
+
+def test_trace_round_trip(tmp_path):
+    trace = pfd_trace()
+    checkpoints(tmp_path).save_trace(trace)
+    loaded = checkpoints(tmp_path).load_trace()
+    np.testing.assert_array_equal(loaded.posterior["PFD"].values, trace.posterior["PFD"].values)
+
+
+@pytest.mark.parametrize("blob", [b"PK\x03\x04trunc", b"", b"\x00not an npz"])
+def test_corrupted_trace_is_recomputed(tmp_path, blob, capsys):
+    store = checkpoints(tmp_path)
+    store.save_trace(pfd_trace())
+    store.write("trace.npz", blob)
+    assert store.load_trace() is None
+    assert "unreadable, recomputing" in capsys.readouterr().out
+
+    # the resumed job recomputes the trace and checkpoints it again
+    store.save_trace(pfd_trace(1))
+    assert store.load_trace() is not None
+
+
+def test_trace_of_other_parameters_is_ignored(tmp_path, capsys):
+    checkpoints(tmp_path).save_trace(pfd_trace())
+    assert checkpoints(tmp_path, {"pfd_goal": 1e-5}).load_trace() is None
+    assert "belongs to other job parameters" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("blob", [b'{"fingerp', b"[1, 2]", b"\xff\xfe"])
+def test_corrupted_json_is_recomputed(tmp_path, blob):
+    store = checkpoints(tmp_path)
+    store.write("sensitivity.json", blob)
+    assert store.load_json("sensitivity") is None
@@ -0,0 +1,16 @@
+import statistics
+
+import pytest
+
+from benchmarks.bench_import import default_budget, default_repeat, import_main
+
+
+@pytest.mark.parametrize("module", ["bbn_inference.api", "main"])
+def test_import_stays_lazy_and_within_budget(module):
+    # each run imports the module in a fresh interpreter (benchmarks/bench_import.py)
+    runs = [import_main(module) for _ in range(default_repeat)]
+
+    heavy = sorted({name for run in runs for name in run["heavy"]})
+    assert not heavy, f"{module} imported the inference stack: {heavy}"
+    seconds = statistics.median(run["seconds"] for run in runs)
+    assert seconds <= default_budget, f"median import time of {module} is {seconds:.3f}s (budget {default_budget}s)"
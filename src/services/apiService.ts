@@ -140,13 +140,20 @@ export type BbnResultItem = {
   name: string;
   size?: number;
   last_modified?: string;
+  job_id?: string;
+  job_type?: BbnResultJobType | 'other';
 };
 
+export type BbnResultJobType = 'sensitivity-analysis' | 'update-pfd' | 'full-analysis' | 'attribute-importance';
+
 export type BbnResultListResponse = {
   bucket: string;
   prefix: string;
   count: number;
   items: BbnResultItem[];
+  next_cursor?: string | null; // pass back as cursor for the next page
+  source?: 'index' | 's3';
+  order?: 'newest_first' | 'key';
 };
 
 export type BbnResultFileResponse = {
@@ -271,8 +278,15 @@ export const getHybridToolResults = async (
 // ============= BBN RESULT MANAGEMENT ENDPOINTS =========
 // =======================================================
 
-export const listBbnResultFiles = (limit?: number) => {
-  const search = typeof limit === 'number' ? `?limit=${encodeURIComponent(limit)}` : '';
+export const listBbnResultFiles = (
+  limit?: number,
+  options: { jobType?: BbnResultJobType; cursor?: string } = {},
+) => {
+  const params = new URLSearchParams();
+  if (typeof limit === 'number') params.set('limit', String(limit));
+  if (options.jobType) params.set('job_type', options.jobType);
+  if (options.cursor) params.set('cursor', options.cursor);
+  const search = params.toString() ? `?${params.toString()}` : '';
   return getJSON<BbnResultListResponse>(`/api/v1/results${search}`);
 };
 